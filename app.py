@@ -1,20 +1,27 @@
 from flask import Flask, render_template, request, redirect, url_for, session, Response, flash, send_file, jsonify, copy_current_request_context
 import threading
+import multiprocessing
+import time
 import logging
-import queue
-import pandas as pd
+import uuid
 import io
 import os
 from pathlib import Path
 from datetime import datetime
 
-from backend.linkedin_login import LinkedInLogin
-from backend.linkedin_search import LinkedInSearch
-from backend.linkedin_html import LinkedInHTML
-from backend.linkedin_data_extract import parse_all_html
-from backend.linkedin_contact_info import get_contact_info_for_profile
+# Only light modules at import time: the scraping stack (Playwright, BeautifulSoup,
+# requests, pandas) is imported inside the job and export functions that use it,
+# so gunicorn workers and login/dashboard requests don't pay for it.
+from backend.job_checkpoint import JobCheckpoint, list_jobs
+from backend.rate_control import LINKEDIN_RATE, ThrottledError
+from backend.task_queue import TaskQueue
+from backend.result_store import ResultStore
+from backend.job_state import EventFeed, open_job_state
+from backend.profile_index import SEARCH_PAGE_SIZE, SEARCH_PAGE_MAX, default_index
+from backend.profile_identity import KNOWN_PREFIX, canonical_vanity, default_store as identity_store, unique_profile_links
 
 import auth.json_module_flask as db
+from auth.json_module_flask import current_user
 
 app = Flask(__name__)
 app.secret_key = os.environ.get("SECRET_KEY", "supersecretkey")
@@ -28,11 +35,28 @@ log.setLevel(logging.ERROR)
 # app.config["PREFERRED_URL_SCHEME"] = "http"
 
 # ---------------- LinkedIn Scraper Globals ----------------
-status_queue = queue.Queue()
-linkedin_results = []
-scraper_lock = threading.Lock()
-scraper_active = False
-current_linkedin_user = None
+# Status events, the "scraper running" lock and the current job id are shared
+# by all gunicorn workers (LINKLENS_STATE_URL); the rest is this process's job.
+job_state = open_job_state()
+current_pool = None  # AccountPool of the job running in this process, if it used one
+current_results = None  # ResultStore of the job running in this process
+
+# Seconds between checks for new status events in /linkedin_status
+STATUS_POLL_SECONDS = 0.5
+SCRAPER_LEASE_SECONDS = 60
+status_feed = EventFeed(job_state, STATUS_POLL_SECONDS)
+
+# /linkedin_status streams: at most SSE_MAX_CLIENTS open per process (0 = no limit, set by
+# gunicorn.conf.py), each closed after SSE_MAX_SECONDS so the browser reconnects and resumes
+SSE_MAX_CLIENTS = int(os.environ.get("LINKLENS_SSE_MAX_CLIENTS", "0"))
+SSE_MAX_SECONDS = 300
+SSE_KEEPALIVE_SECONDS = 15
+sse_slots = threading.BoundedSemaphore(SSE_MAX_CLIENTS) if SSE_MAX_CLIENTS else None
+
+# gevent workers are monkey-patched, which Playwright's sync API does not support,
+# so there scraper jobs run in their own process (state is shared through job_state)
+SERVER_MODE = os.environ.get("LINKLENS_SERVER_MODE", "gthread").strip().lower()
+JOB_PROCESS = os.environ.get("LINKLENS_JOB_PROCESS", "1" if SERVER_MODE == "gevent" else "").strip().lower() in ("1", "true", "yes")
 
 # Directories
 DATA_DIR = Path("data")
@@ -42,10 +66,65 @@ RESULTS_DIR = DATA_DIR / "results"
 for p in (DATA_DIR, LINKS_DIR, TEMP_DIR, RESULTS_DIR):
     p.mkdir(parents=True, exist_ok=True)
 
+# Opt-in parse profiling: "1" for per-extractor timings, "cprofile" to also dump a cProfile
+PROFILE_PARSE = os.environ.get("LINKLENS_PROFILE_PARSE", "").strip().lower()
+
+# Profile capture: "html" saves the rendered page, "network" saves the profile's API responses as JSONL
+CAPTURE_MODE = os.environ.get("LINKLENS_CAPTURE_MODE", "html").strip().lower()
+
+# Watch-mode parsing: parse each profile as soon as it is saved instead of after the fetch phase
+WATCH_PARSE = os.environ.get("LINKLENS_WATCH_PARSE", "").strip().lower() in ("1", "true", "yes")
+
+# Task queue: fetch/parse/enrich run in `python -m backend.worker` processes instead of this one
+TASK_QUEUE = os.environ.get("LINKLENS_TASK_QUEUE", "").strip().lower() in ("1", "true", "yes")
+# A queued job fails when no task of it finishes for this many seconds (e.g. no worker is running)
+TASK_STALL_SECONDS = float(os.environ.get("LINKLENS_TASK_STALL_SECONDS", "900"))
+
+# People search follows this many result pages (LinkedIn shows about 10 profiles per page)
+SEARCH_PAGES = int(os.environ.get("LINKLENS_SEARCH_PAGES", "1"))
+
 def push_status(message):
-    """Push scraper status updates to the queue."""
+    """Push scraper status updates to the shared event log; returns the event id."""
     timestamp = datetime.now().strftime("%H:%M:%S")
-    status_queue.put(f"[{timestamp}] {message}")
+    return job_state.push_event(f"[{timestamp}] {message}")
+
+def job_results():
+    """ResultStore of the current job (whichever worker runs it), or None."""
+    job_id = job_state.current_job_id()
+    return ResultStore(job_id) if job_id else None
+
+# The dashboard table is virtualized: it fetches windows of at most RESULTS_WINDOW_MAX
+# summary rows, with long text cut to RESULT_PREVIEW_CHARS (the popup fetches the full row)
+RESULTS_WINDOW_MAX = 200
+RESULT_PREVIEW_CHARS = 30
+PREVIEW_COLUMNS = ("Skills", "Experience")
+
+def summarize_row(row):
+    for col in PREVIEW_COLUMNS:
+        text = row.get(col) or ""
+        row[col] = text[:RESULT_PREVIEW_CHARS] + "..." if len(text) > RESULT_PREVIEW_CHARS else text
+    return row
+
+def hold_scraper_lease(owner, done):
+    """Renew the shared scraper lock until done is set."""
+    while not done.wait(SCRAPER_LEASE_SECONDS / 3):
+        job_state.renew_scraper(owner, SCRAPER_LEASE_SECONDS)
+
+def publish_rate_stats(source=None):
+    """Share the job's rate controller and account stats, so /linkedin_rate works from any worker."""
+    stats = LINKEDIN_RATE.stats()
+    if current_pool:
+        stats["accounts"] = current_pool.stats()
+    stats["published_at"] = time.time()
+    try:
+        job_state.set_value("linkedin_rate", stats)
+    except Exception as e:
+        print(f"⚠️ Could not publish rate stats: {e}")
+
+# Throttle events from the shared LinkedIn rate controller show up in the status panel,
+# and every rate change is published for the dashboard
+LINKEDIN_RATE.status_callback = push_status
+LINKEDIN_RATE.on_change = publish_rate_stats
 
 def timestamped_filename(base_name, ext=None, folder=None):
     """Generate a timestamped filename."""
@@ -65,16 +144,55 @@ def timestamped_filename(base_name, ext=None, folder=None):
 
     return filename
 
-def enrich_df_with_contact_info(df, linkedin_cookies, status_cb=None, max_retries=2):
-    """Enrich DataFrame with Email and Phone columns using LinkedIn contact overlay."""
+def parse_profiles(role, loc, skip=(), on_parsed=None):
+    """Parse saved HTML, timing every extractor when LINKLENS_PROFILE_PARSE is set."""
+    from backend.linkedin_data_extract import parse_all_html
+    from backend.parse_profiler import ParseProfiler
+
+    if not PROFILE_PARSE or PROFILE_PARSE in ("0", "false", "no"):
+        return parse_all_html(role=role, loc=loc, skip=skip, on_parsed=on_parsed, identities=identity_store())
+
+    profiler = ParseProfiler(name="job", cprofile=PROFILE_PARSE == "cprofile")
+    with profiler.job():
+        df = parse_all_html(role=role, loc=loc, profiler=profiler, skip=skip, on_parsed=on_parsed,
+                            identities=identity_store())
+    profiler.report(push_status)
+    report_path = profiler.write_report(RESULTS_DIR)
+    push_status(f"💾 Parse profile saved: {report_path}")
+    return df
+
+def start_parse_watcher(job, role, loc):
+    """Start incremental parsing of TEMP_DIR for this job when LINKLENS_WATCH_PARSE is set."""
+    if not WATCH_PARSE:
+        return None
+    from backend.parse_watcher import ParseWatcher
+
+    return ParseWatcher(TEMP_DIR, role=role, loc=loc, on_result=current_results.append,
+                        on_parsed=job.record_parse, skip=job.state["parsed"],
+                        status_callback=push_status, identities=identity_store()).start()
+
+def enrich_df_with_contact_info(df, linkedin_cookies, status_cb=None, max_retries=2, known=None, on_contact=None,
+                                rate=LINKEDIN_RATE, identities=None):
+    """
+    Enrich DataFrame with Email and Phone columns using LinkedIn contact overlay.
+
+    known maps vanity ids to contacts fetched earlier (e.g. before a resume);
+    on_contact(vanity, email, phone) is called for every newly fetched one.
+    Contacts the IdentityStore looked up recently are reused, new ones are merged into it.
+    """
+    from backend.linkedin_contact_info import get_contact_info_for_profile
+
     emails_col = []
     phones_col = []
+    known = known or {}
+    reused = 0
 
     for idx, row in df.iterrows():
         profile_url = (
             row.get("ProfileLink")
             or row.get("profile_url")
             or row.get("Profile URL")
+            or row.get("Source_URL")
             or ""
         )
 
@@ -88,18 +206,37 @@ def enrich_df_with_contact_info(df, linkedin_cookies, status_cb=None, max_retrie
             phones_col.append(row.get("Phone", ""))
             continue
 
+        if vanity_id in known:
+            emails_col.append(known[vanity_id].get("Email", ""))
+            phones_col.append(known[vanity_id].get("Phone", ""))
+            continue
+
+        contact = identities.fresh_contact(vanity_id) if identities is not None and vanity_id else None
+        if contact:
+            emails_col.append(contact[0])
+            phones_col.append(contact[1])
+            reused += 1
+            continue
+
         if linkedin_cookies and vanity_id:
             for attempt in range(1, max_retries + 1):
                 try:
-                    contact = get_contact_info_for_profile(vanity_id, linkedin_cookies)
+                    contact = get_contact_info_for_profile(vanity_id, linkedin_cookies, rate=rate)
                     email_val = ", ".join(contact.get("emails", []))
                     phone_val = ", ".join(contact.get("phones", []))
 
                     if status_cb:
                         status_cb(f"📇 Contact extracted for {vanity_id}")
+                    if on_contact:
+                        on_contact(vanity_id, email_val, phone_val)
+                    if identities is not None:
+                        identities.record_contact(vanity_id, email_val, phone_val)
 
                     break
 
+                except ThrottledError:
+                    # Still throttled after backing off: stop here, the job can be resumed later
+                    raise
                 except Exception as e:
                     if attempt >= max_retries and status_cb:
                         status_cb(f"⚠️ Contact extract failed for {vanity_id}: {e}")
@@ -109,168 +246,367 @@ def enrich_df_with_contact_info(df, linkedin_cookies, status_cb=None, max_retrie
 
     df["Email"] = emails_col
     df["Phone"] = phones_col
+    if reused and status_cb:
+        status_cb(f"♻️ {reused} contacts taken from the identity store")
 
     return df
 
-# ---------------- Background Scraper ----------------
-def background_linkedin_scraper(params):
-    global linkedin_results, scraper_active, current_linkedin_user
+# ---------------- Scraper Job Stages ----------------
+# Each stage reads what earlier runs already stored in the job checkpoint
+# and only does the missing work, so a resumed job picks up where it stopped.
 
-    with scraper_lock:
-        if scraper_active:
-            push_status("⚠️ Scraper already running; ignoring duplicate request.")
-            return
-        scraper_active = True
+FETCH_MODES = ("full", "html_only", "html_and_data")
+
+def stage_collect_links(job, login_scraper):
+    import pandas as pd
+    from backend.linkedin_search import LinkedInSearch
+
+    params = job.params
+    if job.stage_done("links"):
+        push_status(f"📥 Resuming with {len(job.state['links'])} collected links")
+        return job.state["links"]
+
+    links = []
+    excel_path = params.get("excel_path")
+    job_title, country, city = params.get("job_title", ""), params.get("country", ""), params.get("city", "")
+
+    if excel_path and params.get("mode") in ["html_only", "html_and_data"]:
+        try:
+            df_links = pd.read_excel(excel_path)
+            if "ProfileLink" in df_links.columns:
+                links = df_links["ProfileLink"].dropna().tolist()
+                push_status(f"📥 Loaded {len(links)} links from uploaded Excel")
+            else:
+                push_status("⚠️ Excel file must have a column named 'ProfileLink'")
+        except Exception as e:
+            push_status(f"❌ Failed to read Excel file: {e}")
+
+    if not links:
+        search_scraper = LinkedInSearch(login_scraper.page, status_callback=push_status, max_pages=SEARCH_PAGES)
+        links = search_scraper.collect_profile_links(
+            job_title=job_title,
+            country=country,
+            max_results=int(params.get("max_results", 50)),
+            city=city
+        )
+
+        if links:
+            links_filename = timestamped_filename(f"links_{job_title}_{city}_{country}", ".xlsx")
+            links_path = LINKS_DIR / links_filename
+            df_links = pd.DataFrame({"ProfileLink": links})
+            df_links.to_excel(links_path, index=False)
+            push_status(f"💾 Saved {len(links)} links to: {links_path}")
+
+    unique = unique_profile_links(links)
+    if len(unique) < len(links):
+        push_status(f"🔗 {len(links) - len(unique)} duplicate profile links dropped")
+    job.set_links(unique)
+    return job.state["links"]
+
+def take_known_profiles(job, links):
+    """
+    Record the links whose profile the identity store parsed recently as fetched and
+    parsed (evaluated against this job's filters) and return the ones left to fetch.
+    """
+    from backend.linkedin_data_extract import evaluate_known_profile
+
+    identities = identity_store()
+    if identities is None or job.params.get("mode") == "html_only":
+        # html_only jobs are run to save the pages themselves
+        return links
+    role = job.params.get("job_title", "")
+    loc = job.params.get("city") or job.params.get("country", "")
+    todo = []
+    known = 0
+    for link in links:
+        identity = identities.fresh_profile(link)
+        if identity:
+            try:
+                parsed = evaluate_known_profile(identity, role, loc)
+            except LookupError:
+                todo.append(link)  # the filters need the page itself
+                continue
+            name = f"{KNOWN_PREFIX}{identity['vanity']}"
+            job.record_fetch(link, name)
+            job.record_parse(name, parsed.to_row() if parsed and parsed.accepted else None)
+            known += 1
+        else:
+            todo.append(link)
+    if known:
+        push_status(f"♻️ {known} profiles already known, not fetched again")
+    return todo
+
+def make_account_pool(params):
+    """Pool of all saved LinkedIn accounts when the job asks for one (needs at least two)."""
+    global current_pool
+    if not params.get("use_account_pool"):
+        return None
+    from backend.account_pool import AccountPool, discover_accounts
+
+    username = params.get("username")
+    accounts = [username] + [a for a in discover_accounts() if a != username]
+    if len(accounts) < 2:
+        push_status("⚠️ Account pool needs more than one saved LinkedIn session; using one account")
+        return None
+    push_status(f"👥 Sharding across {len(accounts)} accounts: {', '.join(accounts)}")
+    current_pool = AccountPool(accounts, headless=params.get("headless", True), status_callback=push_status,
+                               capture_mode=CAPTURE_MODE, primary=username, on_change=publish_rate_stats)
+    publish_rate_stats()
+    return current_pool
+
+def stage_fetch_profiles(job, login_scraper, links, watcher=None, pool=None):
+    from backend.linkedin_html import LinkedInHTML
+
+    if not links:
+        push_status("⚠️ No links to process for HTML collection")
+        job.complete_stage("fetch")
+        return
+
+    fetched = job.state["fetched"]
+    todo = [link for link in links if link not in fetched]
+    if len(todo) < len(links):
+        push_status(f"⏭️ {len(links) - len(todo)} profiles already fetched, {len(todo)} to go")
+    todo = take_known_profiles(job, todo)
+
+    if pool:
+        pool.fetch_profiles(todo, TEMP_DIR, on_saved=watcher.notify if watcher else None,
+                            on_fetched=job.record_fetch)
+        push_status(f"💾 {len(job.state['fetched'])} Saved HTML Profile Files at {TEMP_DIR}")
+        job.complete_stage("fetch")
+        return
+
+    html_scraper = LinkedInHTML(login_scraper.page, status_callback=push_status, capture_mode=CAPTURE_MODE,
+                                on_saved=watcher.notify if watcher else None)
+    html_count = len(links) - len(todo)
+    for i, link in enumerate(todo):
+        html_path = html_scraper.save_profile(link, TEMP_DIR)
+        job.record_fetch(link, html_path)
+        if html_path:
+            html_count += 1
+        else:
+            push_status(f"❌ Failed to save profile HTML ({i+1}/{len(todo)})")
+    push_status(f"💾 {html_count} Saved HTML Profile Files at {TEMP_DIR}")
+    job.complete_stage("fetch")
+
+def stage_parse_profiles(job, watcher=None):
+    """Accepted rows of this job as a DataFrame; files parsed before a resume are not parsed again."""
+    from backend.linkedin_data_extract import results_to_dataframe
+
+    params = job.params
+    loc = params.get("city") or params.get("country", "")
+    if watcher:
+        watcher.stop()
+        # Live rows are replaced by the final rows once the job finishes
+        current_results.clear()
+    elif not job.stage_done("parse"):
+        push_status("📄 Parsing HTML for data extraction...")
+        parse_profiles(role=params.get("job_title", ""), loc=loc,
+                       skip=job.state["parsed"], on_parsed=job.record_parse)
+    job.complete_stage("parse")
+    return results_to_dataframe([row for row in job.state["parsed"].values() if row], params.get("job_title", ""))
+
+def stage_enrich_contacts(job, df, login_scraper, pool=None):
+    def enrich(chunk, cookies, rate=LINKEDIN_RATE):
+        return enrich_df_with_contact_info(chunk, linkedin_cookies=cookies, status_cb=push_status,
+                                           known=job.state["contacts"], on_contact=job.record_contact, rate=rate,
+                                           identities=identity_store())
+
+    if not df.empty:
+        df = pool.enrich(df, enrich) if pool else enrich(df, login_scraper.cookies)
+    job.complete_stage("enrich")
+    return df
 
-    linkedin_results = []
-    push_status("🔍 Starting LinkedIn Scraper...")
+def stage_export_results(job, df, label="Data extraction complete. Results saved"):
+    params = job.params
+    job_title, country, city = params.get("job_title", ""), params.get("country", ""), params.get("city", "")
+
+    current_results.replace(df)
+    results_filename = timestamped_filename(f"linkedin_results_{job_title}_{city}_{country}", ".xlsx")
+    results_path = RESULTS_DIR / results_filename
+    df.to_excel(results_path, index=False)
+    push_status(f"💾 {label}: {results_path}")
+    push_status(f"DATA_FILE:{results_path}")
+
+    # Background thread: url_for needs a request context when SERVER_NAME is not configured
+    with app.test_request_context():
+        download_url = url_for('download_file', folder='results', filename=results_filename, _external=False)
+        push_status(f"DOWNLOAD:{download_url}")
+    push_status("RESULTS_READY")
+
+    job.state["results_path"] = str(results_path)
+    job.complete_stage("export")
+
+def run_queued_job(job, login_scraper):
+    """
+    Run the job's fetch/parse/enrich work through the task queue.
+
+    Search still runs here; workers (python -m backend.worker) do the rest and
+    this thread only enqueues tasks, reports progress and exports the results.
+    """
+    from backend.linkedin_data_extract import is_profile_file, results_to_dataframe
+
+    mode = job.params.get("mode", "full")
+    params = job.params
+    tasks = TaskQueue()
+    enrich = mode != "html_only"
+    parse = None if mode == "html_only" else {
+        "role": params.get("job_title", ""),
+        "loc": params.get("city") or params.get("country", ""),
+        "enrich": enrich,
+    }
+
+    if mode in FETCH_MODES:
+        links = stage_collect_links(job, login_scraper)
+        todo = take_known_profiles(job, [link for link in links if link not in job.state["fetched"]])
+        tasks.enqueue_many(job.job_id, "fetch", (
+            (link, {"link": link, "folder": str(TEMP_DIR), "capture_mode": CAPTURE_MODE, "parse": parse})
+            for link in todo
+        ))
+        if enrich:
+            # Known profiles skip fetch and parse; their contacts may still be missing
+            vanities = [canonical_vanity(row["Source_URL"]) for name, row in job.state["parsed"].items()
+                        if row and name.startswith(KNOWN_PREFIX)]
+            tasks.enqueue_many(job.job_id, "enrich", ((v, {"vanity": v}) for v in vanities if v))
+    if mode == "data_only":
+        files = [f for f in TEMP_DIR.iterdir() if is_profile_file(f) and f.name not in job.state["parsed"]]
+        tasks.enqueue_many(job.job_id, "parse", ((f.name, dict(parse, file=f.name, folder=str(TEMP_DIR)))
+                                                  for f in files))
+
+    retried = tasks.retry_failed(job.job_id)
+    if retried:
+        push_status(f"🔁 Retrying {retried} failed tasks")
+    wait_for_tasks(job, tasks)
+
+    # Copy the workers' results into the checkpoint so /jobs and resume see them
+    for link, result in tasks.results(job.job_id, "fetch"):
+        job.record_fetch(link, result["file"])
+    for failure in tasks.failures(job.job_id):
+        push_status(f"❌ {failure['kind']} {failure['key']} failed: {failure['error']}")
+        if failure["kind"] == "fetch":
+            job.record_fetch(failure["key"], None)
+    for file_name, result in tasks.results(job.job_id, "parse"):
+        job.record_parse(file_name, result["row"])
+    for vanity, contact in tasks.results(job.job_id, "enrich"):
+        job.record_contact(vanity, contact["Email"], contact["Phone"])
+    for stage in ("fetch", "parse", "enrich"):
+        job.complete_stage(stage)
+
+    if mode == "html_only":
+        push_status(f"💾 {len(job.state['fetched'])} Saved HTML Profile Files at {TEMP_DIR}")
+        return
+    df = results_to_dataframe([row for row in job.state["parsed"].values() if row], params.get("job_title", ""))
+    if not df.empty:
+        # No cookies: contacts come only from the enrich tasks recorded above
+        df = enrich_df_with_contact_info(df, None, known=job.state["contacts"], identities=identity_store())
+    stage_export_results(job, df)
+
+def wait_for_tasks(job, tasks, poll_interval=2.0, stall_seconds=TASK_STALL_SECONDS):
+    """Block until the job's tasks are finished; raises TimeoutError if none finishes for stall_seconds."""
+    last = None
+    deadline = time.monotonic() + stall_seconds
+    while not tasks.is_job_done(job.job_id):
+        counts = tasks.job_counts(job.job_id)
+        if counts != last:
+            progress = ", ".join(
+                f"{kind} {c.get('done', 0)}/{sum(c.values())}" for kind, c in sorted(counts.items())
+            )
+            push_status(f"⏳ Waiting for workers: {progress}")
+            last = counts
+            deadline = time.monotonic() + stall_seconds
+        elif time.monotonic() > deadline:
+            raise TimeoutError(f"No task finished in {stall_seconds:g} s; is a worker running "
+                               f"(python -m backend.worker)?")
+        time.sleep(poll_interval)
+
+def run_scraper_job(job, login_scraper):
+    if TASK_QUEUE:
+        return run_queued_job(job, login_scraper)
+    mode = job.params.get("mode", "full")
+    params = job.params
+    watcher = None
+    pool = make_account_pool(params)
+
+    if mode in FETCH_MODES:
+        links = stage_collect_links(job, login_scraper)
+        if not job.stage_done("fetch"):
+            watcher = start_parse_watcher(job, params.get("job_title", ""), params.get("city") or params.get("country", ""))
+            try:
+                stage_fetch_profiles(job, login_scraper, links, watcher, pool)
+            except Exception:
+                if watcher:
+                    watcher.stop(drain=False)
+                raise
+
+    if mode == "html_only":
+        # Profiles parsed while fetching are exported without contact enrichment
+        if watcher or job.stage_done("parse"):
+            df = stage_parse_profiles(job, watcher)
+            if not df.empty:
+                stage_export_results(job, df, label="Parsed results saved")
+        return
+
+    if mode == "data_only":
+        push_status("📄 Parsing existing HTML for data extraction...")
+    df = stage_parse_profiles(job, watcher)
+    df = stage_enrich_contacts(job, df, login_scraper, pool)
+    stage_export_results(job, df)
+
+# ---------------- Background Scraper ----------------
+def background_linkedin_scraper(params, resume_job_id=None):
+    global current_results, current_pool
+
+    owner = f"{uuid.uuid4().hex}@{os.getpid()}"
+    if not job_state.acquire_scraper(owner, SCRAPER_LEASE_SECONDS):
+        push_status("⚠️ Scraper already running; ignoring duplicate request.")
+        return
+    lease_done = threading.Event()
+    threading.Thread(target=hold_scraper_lease, args=(owner, lease_done), daemon=True).start()
+    current_pool = None
+    publish_rate_stats()
+
+    first_event_id = push_status("🔍 Starting LinkedIn Scraper...")
     
     login_scraper = None
+    job = None
     try:
+        if resume_job_id:
+            job = JobCheckpoint.load(resume_job_id)
+            if not job:
+                push_status(f"❌ Job not found: {resume_job_id}")
+                return
+            push_status(f"🔁 Resuming job {job.job_id}")
+            job.state["status"] = "running"
+            params = dict(job.params, password=params.get("password", ""),
+                          headless=params.get("headless", job.params.get("headless", True)))
+        else:
+            job = JobCheckpoint.create(params)
+            push_status(f"🗂️ Job {job.job_id} checkpointed to {job.path}")
+        current_results = ResultStore.open(job.job_id)
+        job_state.set_current_job(job.job_id, first_event_id)
+
         username = params.get("username")
         password = params.get("password")
-        mode = params.get("mode", "full")
         headless = params.get("headless", True)
-        excel_path = params.get("excel_path")
-        job_title = params.get("job_title", "")
-        country = params.get("country", "")
-        city = params.get("city", "")
 
-        if not username or not password:
+        # A resumed job can reuse the saved LinkedIn session instead of a password
+        if not username or not (password or resume_job_id):
             push_status("❌ Missing LinkedIn username or password")
+            job.finish("failed", "Missing LinkedIn username or password")
             return
 
         # ------------------ LOGIN ------------------
+        from backend.linkedin_login import LinkedInLogin
+
         login_scraper = LinkedInLogin(headless=headless, status_callback=push_status)
         login_scraper.login(username, password)
         if not login_scraper.logged_in:
             push_status("❌ Cannot proceed, login failed.")
-            if login_scraper:
-                login_scraper.close()
+            job.finish("failed", "Login failed")
             return
 
-        # ------------------ COLLECT LINKS ------------------
-        links = []
-
-        if excel_path and mode in ["html_only", "html_and_data"]:
-            try:
-                df_links = pd.read_excel(excel_path)
-                if "ProfileLink" in df_links.columns:
-                    links = df_links["ProfileLink"].dropna().tolist()
-                    push_status(f"📥 Loaded {len(links)} links from uploaded Excel")
-                else:
-                    push_status("⚠️ Excel file must have a column named 'ProfileLink'")
-            except Exception as e:
-                push_status(f"❌ Failed to read Excel file: {e}")
-
-        if not links and mode in ["full", "html_only", "html_and_data"]:
-            search_scraper = LinkedInSearch(login_scraper.page, status_callback=push_status)
-            links = search_scraper.collect_profile_links(
-                job_title=job_title,
-                country=country,
-                max_results=int(params.get("max_results", 50)),
-                city=city
-            )
-            
-            if links:
-                links_filename = timestamped_filename(f"links_{job_title}_{city}_{country}", ".xlsx")
-                links_path = LINKS_DIR / links_filename
-                df_links = pd.DataFrame({"ProfileLink": links})
-                df_links.to_excel(links_path, index=False)
-                push_status(f"💾 Saved {len(links)} links to: {links_path}")
-
-        # ------------------ MODE EXECUTION ------------------
-        if mode == "html_only":
-            if links:
-                html_scraper = LinkedInHTML(login_scraper.page, status_callback=push_status)
-                html_count = 0
-                for i, link in enumerate(links):
-                    html_path = html_scraper.save_profile_html(link, TEMP_DIR)
-                    if html_path:
-                        html_count += 1
-                    else:
-                        push_status(f"❌ Failed to save profile HTML ({i+1}/{len(links)})")
-                push_status(f"💾 {html_count} Saved HTML Profile Files at {TEMP_DIR}")
-            else:
-                push_status("⚠️ No links to process for HTML collection")
-
-        elif mode == "data_only":
-            push_status("📄 Parsing existing HTML for data extraction...")
-            df = parse_all_html(role=job_title, loc=city or country)
-            df = enrich_df_with_contact_info(df, linkedin_cookies=login_scraper.cookies, status_cb=push_status)
-
-            linkedin_results.extend(df.to_dict(orient="records"))
-            results_filename = timestamped_filename(f"linkedin_results_{job_title}_{city}_{country}", ".xlsx")
-            results_path = RESULTS_DIR / results_filename
-            df.to_excel(results_path, index=False)
-            push_status(f"💾 Data extraction complete. Results saved: {results_path}")
-            push_status(f"DATA_FILE:{results_path}")
-            
-            # Fixed URL generation for production
-            with app.app_context():
-                download_url = url_for('download_file', folder='results', filename=results_filename, _external=False)
-                push_status(f"DOWNLOAD:{download_url}")
-            push_status("RESULTS_READY")
-
-        elif mode == "html_and_data":
-            if links:
-                html_scraper = LinkedInHTML(login_scraper.page, status_callback=push_status)
-                html_count = 0
-                for i, link in enumerate(links):
-                    html_path = html_scraper.save_profile_html(link, TEMP_DIR)
-                    if html_path:
-                        html_count += 1
-                    else:
-                        push_status(f"❌ Failed to save profile HTML ({i+1}/{len(links)})")
-                push_status(f"💾 {html_count} Saved HTML Profile Files at {TEMP_DIR}")
-            else:
-                push_status("⚠️ No links to process for HTML collection")
-
-            push_status("📄 Parsing HTML for data extraction...")
-            df = parse_all_html(role=job_title, loc=city or country)
-            df = enrich_df_with_contact_info(df, linkedin_cookies=login_scraper.cookies, status_cb=push_status)
-
-            linkedin_results.extend(df.to_dict(orient="records"))
-            results_filename = timestamped_filename(f"linkedin_results_{job_title}_{city}_{country}", ".xlsx")
-            results_path = RESULTS_DIR / results_filename
-            df.to_excel(results_path, index=False)
-            push_status(f"💾 Data extraction complete. Results saved: {results_path}")
-            push_status(f"DATA_FILE:{results_path}")
-            
-            with app.app_context():
-                download_url = url_for('download_file', folder='results', filename=results_filename, _external=False)
-                push_status(f"DOWNLOAD:{download_url}")
-            push_status("RESULTS_READY")
-
-        else:  # mode == "full"
-            if links:
-                html_scraper = LinkedInHTML(login_scraper.page, status_callback=push_status)
-                html_count = 0
-                for i, link in enumerate(links):
-                    html_path = html_scraper.save_profile_html(link, TEMP_DIR)
-                    if html_path:
-                        html_count += 1
-                    else:
-                        push_status(f"❌ Failed to save profile HTML ({i+1}/{len(links)})")
-                push_status(f"💾 {html_count} Saved HTML Profile Files at {TEMP_DIR}")
-            else:
-                push_status("⚠️ No links to process")
-
-            push_status("📄 Parsing HTML for data extraction...")
-            df = parse_all_html(role=job_title, loc=city or country)
-            df = enrich_df_with_contact_info(df, linkedin_cookies=login_scraper.cookies, status_cb=push_status)
-
-            linkedin_results.extend(df.to_dict(orient="records"))
-            results_filename = timestamped_filename(f"linkedin_results_{job_title}_{city}_{country}", ".xlsx")
-            results_path = RESULTS_DIR / results_filename
-            df.to_excel(results_path, index=False)
-            push_status(f"💾 Data extraction complete. Results saved: {results_path}")
-            push_status(f"DATA_FILE:{results_path}")
-            
-            with app.app_context():
-                download_url = url_for('download_file', folder='results', filename=results_filename, _external=False)
-                push_status(f"DOWNLOAD:{download_url}")
-            push_status("RESULTS_READY")
+        # ------------------ STAGES ------------------
+        run_scraper_job(job, login_scraper)
+        job.finish("completed")
 
         push_status("✅ Scraping completed successfully!")
 
@@ -278,11 +614,23 @@ def background_linkedin_scraper(params):
         push_status(f"❌ Error: {e}")
         import traceback
         push_status(f"❌ Traceback: {traceback.format_exc()}")
+        if job:
+            job.finish("failed", str(e))
     finally:
         if login_scraper:
             login_scraper.close()
-        with scraper_lock:
-            scraper_active = False
+        lease_done.set()
+        job_state.release_scraper(owner)
+
+def start_scraper(params, resume_job_id=None):
+    if JOB_PROCESS:
+        proc = multiprocessing.get_context("spawn").Process(target=background_linkedin_scraper,
+                                                            args=(params, resume_job_id))
+        proc.start()
+        # Reap the child when it exits
+        threading.Thread(target=proc.join, daemon=True).start()
+    else:
+        threading.Thread(target=background_linkedin_scraper, args=(params, resume_job_id), daemon=True).start()
 
 # ------------------- ROUTES -------------------
 @app.route("/", methods=["GET","POST"])
@@ -294,12 +642,13 @@ def login():
         password = request.form.get("password")
         user = db.get_user(email)
         if user and db.verify_password(password, user["password_hash"]):
+            # The cookie only carries the id; the record is looked up (and cached) per request
             session["logged_in"] = True
-            session["user"] = user
+            session["user_id"] = user["id"]
             return redirect(url_for("dashboard"))
         else:
             error = "Invalid email or password"
-    return render_template("app.html", screen="login", title="Login", error=error, user=session.get("user"))
+    return render_template("app.html", screen="login", title="Login", error=error, user=current_user())
 
 @app.route("/signup", methods=["GET","POST"])
 def signup():
@@ -314,7 +663,7 @@ def signup():
             return redirect(url_for("login"))
         except Exception as e:
             error = str(e)
-    return render_template("app.html", screen="signup", title="Sign Up", error=error, user=session.get("user"))
+    return render_template("app.html", screen="signup", title="Sign Up", error=error, user=current_user())
 
 @app.route("/logout")
 def logout():
@@ -332,7 +681,7 @@ def reset_request():
             message = "Reset link sent! Check your email."
         except Exception as e:
             message = str(e)
-    return render_template("app.html", screen="reset_request", title="Reset Password", message=message, user=session.get("user"))
+    return render_template("app.html", screen="reset_request", title="Reset Password", message=message, user=current_user())
 
 @app.route("/reset_password/<token>", methods=["GET","POST"])
 def reset_password(token):
@@ -347,14 +696,15 @@ def reset_password(token):
             return redirect(url_for("login"))
         except Exception as e:
             error = str(e)
-    return render_template("app.html", screen="reset_password", title="Set New Password", error=error, user=session.get("user"))
+    return render_template("app.html", screen="reset_password", title="Set New Password", error=error, user=current_user())
 
 @app.route("/dashboard", methods=["GET","POST"])
 def dashboard():
-    if not session.get("logged_in"):
+    user = current_user()
+    if not user:
+        # Not logged in, or the account was deleted since
+        session.clear()
         return redirect(url_for("login"))
-    user = session.get("user")
-    users_list = []
 
     last_inputs = {
         "linkedin_user": "",
@@ -364,6 +714,7 @@ def dashboard():
         "city": "",
         "max_results": 50,
         "headless": True,
+        "use_account_pool": False,
         "scraper_mode": "full"
     }
 
@@ -375,6 +726,7 @@ def dashboard():
         city = request.form.get("city")
         max_results = request.form.get("max_results") or 50
         headless = "headless" in request.form
+        use_account_pool = "use_account_pool" in request.form
         scraper_mode = request.form.get("scraper_mode", "full")
 
         uploaded_file = request.files.get("input_excel")
@@ -393,6 +745,7 @@ def dashboard():
             "city": city,
             "max_results": max_results,
             "headless": headless,
+            "use_account_pool": use_account_pool,
             "scraper_mode": scraper_mode
         }
 
@@ -404,36 +757,162 @@ def dashboard():
             "city": city,
             "max_results": max_results,
             "headless": headless,
+            "use_account_pool": use_account_pool,
             "mode": scraper_mode,
             "excel_path": excel_path
         }
-        threading.Thread(target=background_linkedin_scraper, args=(params,), daemon=True).start()
+        start_scraper(params)
         flash("Scraper started — check the status panel.", "success")
 
-    if user.get("is_admin"):
-        users_list = db.get_all_users()
-
+    # Only the row count is rendered: the table pulls row windows from /results as it scrolls,
+    # and admins get the user list from /admin/users, page by page, when they open it
+    results = job_results()
     return render_template(
         "app.html",
         screen="dashboard",
         title="Dashboard",
-        results=linkedin_results,
-        users_list=users_list,
+        results_total=len(results) if results is not None else 0,
         user=user,
         last_inputs=last_inputs
     )
 
 @app.route("/linkedin_status")
 def linkedin_status():
-    def event_stream():
-        while True:
-            msg = status_queue.get()
-            yield f"data: {msg}\n\n"
-    return Response(event_stream(), mimetype="text/event-stream")
+    # Reconnects continue after the last event seen; a new client joining a running
+    # job gets that job's log so far, otherwise only new events
+    last_id = request.headers.get("Last-Event-ID", type=int)
+    if last_id is None:
+        job_id, first_event_id = job_state.current_job()
+        last_id = first_event_id - 1 if job_id and job_state.scraper_active() else job_state.last_event_id()
+
+    if sse_slots and not sse_slots.acquire(blocking=False):
+        # Every stream slot is taken: have the browser retry later instead of holding a thread
+        return Response("retry: 10000\n\n", mimetype="text/event-stream")
+
+    def event_stream(last_id):
+        yield "retry: 2000\n\n"
+        deadline = time.monotonic() + SSE_MAX_SECONDS
+        quiet_since = time.monotonic()
+        while time.monotonic() < deadline:
+            events = status_feed.wait(last_id, timeout=STATUS_POLL_SECONDS * 4)
+            for event_id, msg in events:
+                last_id = event_id
+                yield f"id: {event_id}\ndata: {msg}\n\n"
+            if events:
+                quiet_since = time.monotonic()
+            elif time.monotonic() - quiet_since > SSE_KEEPALIVE_SECONDS:
+                # Writing to a closed connection is what ends the stream of a tab that went away
+                yield ": keepalive\n\n"
+                quiet_since = time.monotonic()
+
+    response = Response(event_stream(last_id), mimetype="text/event-stream",
+                        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+    if sse_slots:
+        response.call_on_close(sse_slots.release)
+    return response
+
+@app.route("/linkedin_rate")
+def linkedin_rate():
+    # Published by the process running the job, which need not be this one
+    stats = job_state.get_value("linkedin_rate")
+    if stats is None:
+        return jsonify(LINKEDIN_RATE.stats())
+    # Pauses were measured when the stats were published
+    elapsed = time.time() - stats.pop("published_at", time.time())
+    for rate in [stats] + [account["rate"] for account in stats.get("accounts", [])]:
+        rate["paused_for"] = round(max(0.0, rate["paused_for"] - elapsed), 1)
+    return jsonify(stats)
 
 @app.route("/get_results")
 def get_results():
-    return jsonify({"results": linkedin_results})
+    """Rows of the last job; ?offset=&limit= return one page."""
+    results = job_results()
+    if results is None:
+        return jsonify({"results": [], "total": 0})
+    offset = request.args.get("offset", 0, type=int)
+    limit = request.args.get("limit", type=int)
+    return jsonify({"results": list(results.rows(offset, limit)), "total": len(results)})
+
+@app.route("/admin/users")
+def admin_users():
+    """One page of users for the admin panel; ?q= searches name and email."""
+    user = current_user()
+    if not user:
+        return jsonify({"error": "Login required"}), 401
+    if not user.get("is_admin"):
+        return jsonify({"error": "Admins only"}), 403
+    query = request.args.get("q", "")
+    page = max(1, request.args.get("page", 1, type=int))
+    per_page = max(1, min(request.args.get("per_page", db.USER_PAGE_SIZE, type=int), db.USER_PAGE_MAX))
+    total, users = db.search_users(query, offset=(page - 1) * per_page, limit=per_page)
+    return jsonify({"users": users, "total": total, "page": page, "per_page": per_page,
+                    "pages": (total + per_page - 1) // per_page})
+
+@app.route("/results")
+def results_window():
+    """Summary rows of the current job for the dashboard table: ?offset=&limit= (at most RESULTS_WINDOW_MAX)."""
+    if not current_user():
+        return jsonify({"error": "Login required"}), 401
+    results = job_results()
+    if results is None:
+        return jsonify({"rows": [], "total": 0, "offset": 0})
+    offset = max(0, request.args.get("offset", 0, type=int))
+    limit = max(1, min(request.args.get("limit", RESULTS_WINDOW_MAX, type=int), RESULTS_WINDOW_MAX))
+    rows = [summarize_row(row) for row in results.rows(offset, limit)]
+    return jsonify({"rows": rows, "total": len(results), "offset": offset})
+
+@app.route("/results/<int:index>")
+def result_detail(index):
+    """Full row at position index (0-based), for the Skills/Experience popup."""
+    if not current_user():
+        return jsonify({"error": "Login required"}), 401
+    results = job_results()
+    row = results.row(index) if results is not None else None
+    if row is None:
+        return jsonify({"error": "Row not found"}), 404
+    return jsonify(row)
+
+@app.route("/profiles/search")
+def profile_search():
+    """Search every profile parsed so far: ?q=kubernetes location:sydney&page=&per_page="""
+    if not current_user():
+        return jsonify({"error": "Login required"}), 401
+    index = default_index()
+    if index is None:
+        return jsonify({"error": "Profile index disabled (LINKLENS_PROFILE_INDEX)"}), 404
+    page = max(1, request.args.get("page", 1, type=int))
+    per_page = max(1, min(request.args.get("per_page", SEARCH_PAGE_SIZE, type=int), SEARCH_PAGE_MAX))
+    start = time.perf_counter()
+    total, profiles = index.search(request.args.get("q", ""), offset=(page - 1) * per_page, limit=per_page)
+    return jsonify({"profiles": profiles, "total": total, "page": page, "per_page": per_page,
+                    "pages": (total + per_page - 1) // per_page,
+                    "ms": round((time.perf_counter() - start) * 1000, 1)})
+
+@app.route("/jobs")
+def jobs():
+    if not current_user():
+        return jsonify({"error": "Login required"}), 401
+    active_job_id = job_state.current_job_id() if job_state.scraper_active() else None
+    return jsonify({"jobs": list_jobs(active_job_id=active_job_id)})
+
+@app.route("/jobs/<job_id>/resume", methods=["POST"])
+def resume_job(job_id):
+    if not current_user():
+        return jsonify({"error": "Login required"}), 401
+    job = JobCheckpoint.load(job_id)
+    if not job:
+        return jsonify({"error": "Job not found"}), 404
+    if job.state["status"] == "completed":
+        return jsonify({"error": "Job already completed", "results_path": job.state["results_path"]}), 400
+    if job_state.scraper_active():
+        return jsonify({"error": "Scraper already running"}), 409
+
+    form = request.get_json(silent=True) or request.form
+    params = {"password": form.get("linkedin_pass", "")}
+    if "headless" in form:
+        params["headless"] = str(form.get("headless")).lower() in ("1", "true", "on", "yes")
+    start_scraper(params, job.job_id)
+    return jsonify({"status": "resuming", "job": job.summary()})
 
 @app.route("/download_file/<folder>/<filename>")
 def download_file(folder, filename):
@@ -447,9 +926,10 @@ def download_file(folder, filename):
 
 @app.route("/linkedin_download")
 def linkedin_download():
-    if not linkedin_results:
+    results = job_results()
+    if results is None or not len(results):
         return "No data yet.", 400
-    df = pd.DataFrame(linkedin_results)
+    df = results.to_dataframe()
     buf = io.BytesIO()
     df.to_excel(buf, index=False)
     buf.seek(0)
@@ -1,5 +1,6 @@
 from flask import Flask, render_template, request, redirect, url_for, session, send_file
 import json_module_flask as db
+from json_module_flask import current_user
 import io
 import pandas as pd
 import webbrowser
@@ -18,11 +19,11 @@ def login():
         user = db.get_user(email)
         if user and db.verify_password(password, user["password_hash"]):
             session["logged_in"] = True
-            session["user"] = user
+            session["user_id"] = user["id"]
             return redirect(url_for("dashboard"))
         else:
             error = "Invalid email or password"
-    return render_template("app.html", screen="login", title="Login", error=error, user=session.get("user"))
+    return render_template("app.html", screen="login", title="Login", error=error, user=current_user())
 
 # ================= SIGNUP =================
 @app.route("/signup", methods=["GET","POST"])
@@ -40,7 +41,7 @@ def signup():
             return redirect(url_for("login"))
         except Exception as e:
             error = str(e)
-    return render_template("app.html", screen="signup", title="Sign Up", error=error, user=session.get("user"))
+    return render_template("app.html", screen="signup", title="Sign Up", error=error, user=current_user())
 
 # ================= LOGOUT =================
 @app.route("/logout")
@@ -60,7 +61,7 @@ def reset_request():
             message = "Reset link sent! Check your email."
         except Exception as e:
             message = str(e)
-    return render_template("app.html", screen="reset_request", title="Reset Password", message=message, user=session.get("user"))
+    return render_template("app.html", screen="reset_request", title="Reset Password", message=message, user=current_user())
 
 # ================= RESET PASSWORD =================
 @app.route("/reset_password/<token>", methods=["GET","POST"])
@@ -76,7 +77,7 @@ def reset_password(token):
             return redirect(url_for("login"))
         except Exception as e:
             error = str(e)
-    return render_template("app.html", screen="reset_password", title="Set New Password", error=error, user=session.get("user"))
+    return render_template("app.html", screen="reset_password", title="Set New Password", error=error, user=current_user())
 
 # ================= DASHBOARD =================
 @app.route("/dashboard", methods=["GET","POST"])
@@ -84,7 +85,9 @@ def dashboard():
     if not session.get("logged_in"):
         return redirect(url_for("login"))
 
-    user = session.get("user")
+    user = current_user()
+    if not user:
+        return redirect(url_for("login"))
     status_message = ""
     results = []
     users_list = []
@@ -130,7 +133,7 @@ def download_excel():
 # ================= ADMIN EDIT USER =================
 @app.route("/edit_user/<int:user_id>", methods=["POST"])
 def edit_user(user_id):
-    if not session.get("logged_in") or not session["user"].get("is_admin"):
+    if not (current_user() or {}).get("is_admin"):
         return redirect(url_for("login"))
     name = request.form.get("name")
     email = request.form.get("email")
@@ -140,8 +143,6 @@ def edit_user(user_id):
     is_admin = True if request.form.get("is_admin")=="on" else False
     try:
         db.update_user(user_id, name, email, address, company, phone, is_admin)
-        if session["user"]["id"] == user_id:
-            session["user"] = db.get_user(email)
     except Exception as e:
         print("Edit user error:", e)
     return redirect(url_for("dashboard"))
@@ -149,7 +150,7 @@ def edit_user(user_id):
 # ================= ADMIN DELETE USER =================
 @app.route("/delete_user/<int:user_id>")
 def delete_user(user_id):
-    if not session.get("logged_in") or not session["user"].get("is_admin"):
+    if not (current_user() or {}).get("is_admin"):
         return redirect(url_for("login"))
     try:
         db.delete_user(user_id)
@@ -11,7 +11,7 @@ if auth_dir not in sys.path:
     sys.path.append(auth_dir)
 
 from .json_module_flask import (
-    get_user, get_user_count, add_user, update_password,
+    get_user, get_user_by_id, current_user, get_user_count, add_user, update_password,
     set_reset_token, get_user_by_token, update_user, delete_user,
     send_reset_email, get_all_users
 )
@@ -37,7 +37,7 @@ def login():
         user = get_user(email)
         if user and bcrypt.checkpw(password.encode(), user["password_hash"].encode()):
             session['logged_in'] = True
-            session['user'] = user
+            session['user_id'] = user["id"]
             resp = make_response(redirect(url_for("dashboard")))
             if remember:
                 set_cookie(resp, "auth_email", email)
@@ -97,11 +97,11 @@ def dashboard():
             user = get_user(email)
             if user and bcrypt.checkpw(password.encode(), user["password_hash"].encode()):
                 session['logged_in'] = True
-                session['user'] = user
+                session['user_id'] = user["id"]
         else:
             return redirect(url_for("login"))
 
-    user = session.get("user")
+    user = current_user()
     if not user:
         return redirect(url_for("login"))
 
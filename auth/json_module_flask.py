@@ -3,11 +3,14 @@ import os
 import bcrypt
 import uuid
 from datetime import datetime, timedelta
+from functools import lru_cache
 import smtplib
 import ssl
 from email.mime.text import MIMEText
 from typing import Optional, List, Dict
 
+from flask import g, session
+
 # To this:
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))  # folder where this module lives
 USERS_FILE = os.path.join(BASE_DIR, "..", "data", "users", "users.json")
@@ -54,6 +57,98 @@ def _save_users(users: List[Dict]):
         with os.fdopen(fd, "w", encoding="utf-8") as tmpf:
             json.dump(users, tmpf, indent=2, ensure_ascii=False)
         os.replace(path, USERS_FILE)
+    _cached_user.cache_clear()
+    _invalidate_user_index()
+
+# ===== User cache =====
+# Sessions only carry the user id; the record is looked up per request from an
+# LRU keyed by (id, users.json mtime). Writes through _save_users clear it, and
+# a write by another worker process changes the mtime, so entries never go stale.
+
+# Never leaves this module: not in the session cookie, not in templates
+PRIVATE_FIELDS = ("password_hash", "reset_token", "reset_expiry")
+
+def public_user(user: Dict) -> Dict:
+    return {k: v for k, v in user.items() if k not in PRIVATE_FIELDS}
+
+def _users_mtime() -> int:
+    try:
+        return os.stat(USERS_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+@lru_cache(maxsize=1024)
+def _cached_user(user_id: int, mtime_ns: int) -> Optional[Dict]:
+    for u in _load_users():
+        if u.get("id") == user_id:
+            return public_user(u)
+    return None
+
+# ===== Admin user index =====
+# The admin user list is searched through a trigram index over lowercase
+# name and email: a query's trigrams narrow the candidates to a few posting
+# lists and only those are checked for the substring. The index follows the
+# same rule as the user cache: _save_users drops it and a changed users.json
+# mtime (a write by another worker) rebuilds it on the next search.
+
+USER_PAGE_SIZE = 25
+USER_PAGE_MAX = 100
+
+def _trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+class _UserIndex:
+    def __init__(self, users: List[Dict], mtime_ns: int):
+        self.mtime_ns = mtime_ns
+        self.users = [public_user(u) for u in users]
+        # Name and email are kept apart so a match never spans the two
+        self.keys = [((u.get("name") or "").lower(), (u.get("email") or "").lower()) for u in users]
+        self.grams: Dict[str, List[int]] = {}
+        for pos, key in enumerate(self.keys):
+            for gram in _trigrams(key[0]) | _trigrams(key[1]):
+                self.grams.setdefault(gram, []).append(pos)
+
+    def _matches(self, pos: int, q: str) -> bool:
+        name, email = self.keys[pos]
+        return q in name or q in email
+
+    def search(self, q: str) -> List[int]:
+        """Positions (in users.json order) of the users whose name or email contains q."""
+        if not q:
+            return list(range(len(self.users)))
+        if len(q) < 3:
+            # Too short for a trigram: such queries match most users anyway
+            return [pos for pos in range(len(self.users)) if self._matches(pos, q)]
+        postings = sorted((self.grams.get(gram, []) for gram in _trigrams(q)), key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                break
+        return sorted(pos for pos in candidates if self._matches(pos, q))
+
+_user_index: Optional[_UserIndex] = None
+
+def _invalidate_user_index():
+    global _user_index
+    _user_index = None
+
+def _get_user_index() -> _UserIndex:
+    global _user_index
+    mtime = _users_mtime()
+    index = _user_index
+    if index is None or index.mtime_ns != mtime:
+        index = _UserIndex(_load_users(), mtime)
+        _user_index = index
+    return index
+
+def search_users(query: Optional[str] = None, offset: int = 0, limit: int = USER_PAGE_SIZE):
+    """(total, page) of public user records whose name/email contains query, in users.json order."""
+    index = _get_user_index()
+    positions = index.search((query or "").strip().lower())
+    offset = max(0, offset)
+    limit = max(1, min(limit, USER_PAGE_MAX))
+    return len(positions), [dict(index.users[pos]) for pos in positions[offset:offset + limit]]
 
 # =================== DB API ===================
 def get_user(email: str) -> Optional[Dict]:
@@ -63,6 +158,25 @@ def get_user(email: str) -> Optional[Dict]:
             return u.copy()
     return None
 
+def get_user_by_id(user_id: Optional[int]) -> Optional[Dict]:
+    """Public record (no password hash or reset token) of a user, from the cache."""
+    if user_id is None:
+        return None
+    user = _cached_user(user_id, _users_mtime())
+    return dict(user) if user else None
+
+def current_user() -> Optional[Dict]:
+    """Logged-in user's public record (cached per request), or None.
+
+    The session only carries the user id; the record is looked up through the cache above.
+    """
+    if "current_user" not in g:
+        # Older sessions stored the whole user dict in session["user"]; keep just its id
+        if "user" in session and "user_id" not in session:
+            session["user_id"] = (session.pop("user") or {}).get("id")
+        g.current_user = get_user_by_id(session.get("user_id")) if session.get("logged_in") else None
+    return g.current_user
+
 def get_user_count() -> int:
     return len(_load_users())
 
@@ -170,11 +284,9 @@ def delete_user(user_id: int):
     _save_users(new_users)
 
 def get_all_users(search_query: Optional[str] = None) -> List[Dict]:
-    users = _load_users()
-    if search_query:
-        q = search_query.lower()
-        return [u.copy() for u in users if q in (u.get("name", "") or "").lower() or q in (u.get("email", "") or "").lower()]
-    return [u.copy() for u in users]
+    """Public records of all users (or those whose name/email contains search_query)."""
+    index = _get_user_index()
+    return [dict(index.users[pos]) for pos in index.search((search_query or "").strip().lower())]
 
 def verify_password(password: str, hashed: str) -> bool:
     """Check password against stored hash"""
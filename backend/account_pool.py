@@ -0,0 +1,205 @@
+# account_pool.py
+import queue
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+from backend.linkedin_html import LinkedInHTML
+from backend.rate_control import LINKEDIN_RATE, ThrottledError, linkedin_rate_controller
+
+ACCOUNTS_DIR = Path("data/linkedin")
+
+
+def discover_accounts(accounts_dir=ACCOUNTS_DIR):
+    """Usernames with a saved LinkedIn session (data/linkedin/<username>/state.json)."""
+    return sorted(p.parent.name for p in Path(accounts_dir).glob("*/state.json"))
+
+
+# --------------------------------------------------
+# Account pool
+# --------------------------------------------------
+# Each account gets its own worker thread with its own Playwright browser
+# (the sync API is bound to the thread that started it) and its own rate
+# controller. Workers pull links from one shared queue, so a slow or
+# throttled account simply takes fewer links; an account that is still
+# throttled after backing off puts its link back and retires. Accounts
+# only ever run on their saved session: one that has expired marks the
+# account unavailable until someone logs in with it again.
+
+class AccountWorker:
+    def __init__(self, username, rate, status_callback):
+        self.username = username
+        self.rate = rate
+        self.status_callback = status_callback
+        self.cookies = None
+        self.available = True
+        self.fetched = 0
+        self.failed = 0
+        self.error = None
+
+    def stats(self):
+        return {
+            "username": self.username,
+            "available": self.available,
+            "fetched": self.fetched,
+            "failed": self.failed,
+            "error": self.error,
+            "rate": self.rate.stats(),
+        }
+
+
+class AccountPool:
+    def __init__(self, usernames, headless=True, status_callback=None, capture_mode="html",
+                 primary=None, login_factory=None, on_change=None):
+        self.status_callback = status_callback or (lambda msg: None)
+        # Called with the controller or worker whose stats() changed
+        self.on_change = on_change or (lambda source: None)
+        self.headless = headless
+        self.capture_mode = capture_mode
+        if login_factory is None:
+            from backend.linkedin_login import LinkedInLogin
+            login_factory = LinkedInLogin
+        self.login_factory = login_factory
+
+        # The primary account keeps the shared controller so its budget covers search too
+        self.workers = [
+            AccountWorker(
+                username,
+                LINKEDIN_RATE if username == primary
+                else linkedin_rate_controller(f"linkedin:{username}", self.status_callback, self.on_change),
+                self.status_callback,
+            )
+            for username in dict.fromkeys(usernames)
+        ]
+
+    def __len__(self):
+        return len(self.workers)
+
+    def stats(self):
+        return [w.stats() for w in self.workers]
+
+    # ---------------- Fetch ----------------
+    def fetch_profiles(self, links, folder, on_saved=None, on_fetched=None):
+        """
+        Save every link's profile using all accounts in parallel.
+
+        on_fetched(link, path) is called for each link (path None on failure).
+        Raises ThrottledError if links are left because every account was throttled.
+        """
+        work = queue.Queue()
+        for link in links:
+            work.put(link)
+
+        def run(worker):
+            login = None
+            try:
+                login = self._login(worker)
+                if not login:
+                    return
+                html = LinkedInHTML(login.page, status_callback=self.status_callback, capture_mode=self.capture_mode,
+                                    on_saved=on_saved, rate=worker.rate)
+                while True:
+                    try:
+                        link = work.get_nowait()
+                    except queue.Empty:
+                        return
+                    try:
+                        path = html.save_profile(link, Path(folder))
+                    except ThrottledError as e:
+                        work.put(link)
+                        worker.error = str(e)
+                        self.status_callback(f"🐢 {worker.username} retired from this job: {e}")
+                        self.on_change(worker)
+                        return
+                    if path:
+                        worker.fetched += 1
+                    else:
+                        worker.failed += 1
+                    self.on_change(worker)
+                    if on_fetched:
+                        on_fetched(link, path)
+            except Exception as e:
+                worker.error = str(e)
+                self.status_callback(f"❌ Account {worker.username} stopped: {e}")
+                self.on_change(worker)
+            finally:
+                if login:
+                    login.close()
+
+        self._run_all(run)
+
+        for w in self.workers:
+            self.status_callback(f"👤 {w.username}: {w.fetched} profiles fetched, {w.failed} failed")
+        if not work.empty():
+            raise ThrottledError(f"{work.qsize()} links left, no account available")
+
+    # ---------------- Enrich ----------------
+    def enrich(self, df, enrich_fn):
+        """
+        Split df's rows across the accounts, run enrich_fn(chunk, cookies, rate) for each
+        in parallel and merge the chunks back in the original row order.
+        """
+        if df.empty:
+            return df
+
+        missing = [w for w in self.workers if w.cookies is None and w.available]
+        if missing:
+            self._run_all(self._login_for_cookies, missing)
+        workers = [w for w in self.workers if w.cookies]
+        if not workers:
+            raise Exception("No account in the pool could log in")
+
+        chunks = [df.iloc[i::len(workers)].copy() for i in range(len(workers))]
+        results = [None] * len(workers)
+        errors = []
+
+        def run(i, worker):
+            try:
+                results[i] = enrich_fn(chunks[i], worker.cookies, worker.rate)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=run, args=(i, w), daemon=True) for i, w in enumerate(workers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        if errors:
+            raise errors[0]
+        return pd.concat(results).loc[df.index]
+
+    # ---------------- Helpers ----------------
+    def _login(self, worker):
+        if not worker.available:
+            return None
+        login = self.login_factory(headless=self.headless, status_callback=self.status_callback)
+        # Pool accounts have no password; a stale session is never retried with an empty one
+        if not login.resume_session(worker.username):
+            worker.available = False
+            worker.error = "Saved session expired"
+            self.on_change(worker)
+            self.status_callback(f"⚠️ Account {worker.username} unavailable: saved session expired, "
+                                 f"log in with it again to use it")
+            login.close()
+            return None
+        worker.cookies = login.cookies
+        return login
+
+    def _login_for_cookies(self, worker):
+        login = None
+        try:
+            login = self._login(worker)
+        except Exception as e:
+            worker.error = str(e)
+        finally:
+            if login:
+                login.close()
+
+    def _run_all(self, target, workers=None):
+        threads = [threading.Thread(target=target, args=(w,), name=f"account-{w.username}", daemon=True)
+                   for w in (workers or self.workers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
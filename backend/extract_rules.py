@@ -0,0 +1,103 @@
+# extract_rules.py
+import re
+
+# --------------------------------------------------
+# Compiled rule engine for the extraction heuristics
+# --------------------------------------------------
+# Every pattern group is compiled exactly once into a single combined
+# regex, so a line is checked against a whole group in one scan instead
+# of one re.search() (and one re cache lookup) per pattern.
+
+_RULES = {}
+
+
+class RuleSet:
+    """A named group of regex patterns combined into one alternation."""
+
+    def __init__(self, name, patterns, flags=0):
+        self.name = name
+        self.patterns = tuple(patterns)
+        self.flags = flags
+        self.regex = re.compile("|".join(f"(?:{p})" for p in self.patterns), flags)
+
+    def search(self, text):
+        """True if any pattern of the group matches anywhere in text."""
+        if not text:
+            return False
+        return self.regex.search(text) is not None
+
+    def match(self, text):
+        """True if any pattern of the group matches at the start of text."""
+        if not text:
+            return False
+        return self.regex.match(text) is not None
+
+    def __repr__(self):
+        return f"RuleSet({self.name!r}, {len(self.patterns)} patterns)"
+
+
+class KeywordSet:
+    """A named group of plain substrings matched in a single pass."""
+
+    def __init__(self, name, keywords, ignore_case=False):
+        self.name = name
+        self.keywords = tuple(keywords)
+        # Longest first so overlapping keywords never shadow each other
+        ordered = sorted(set(self.keywords), key=len, reverse=True)
+        self.regex = re.compile("|".join(re.escape(k) for k in ordered), re.I if ignore_case else 0)
+
+    def contains_any(self, text):
+        """True if any keyword occurs as a substring of text."""
+        if not text:
+            return False
+        return self.regex.search(text) is not None
+
+    def __repr__(self):
+        return f"KeywordSet({self.name!r}, {len(self.keywords)} keywords)"
+
+
+class SubstitutionChain:
+    """Ordered (pattern, replacement) rules applied one after the other."""
+
+    def __init__(self, name, rules, flags=0):
+        self.name = name
+        self.rules = tuple((re.compile(p, flags), repl) for p, repl in rules)
+
+    def apply(self, text):
+        for regex, repl in self.rules:
+            text = regex.sub(repl, text)
+        return text
+
+    def __repr__(self):
+        return f"SubstitutionChain({self.name!r}, {len(self.rules)} rules)"
+
+
+def register(rule):
+    """Add a compiled rule to the registry and return it."""
+    if rule.name in _RULES:
+        raise ValueError(f"Rule already registered: {rule.name}")
+    _RULES[rule.name] = rule
+    return rule
+
+
+def register_patterns(name, patterns, flags=0):
+    return register(RuleSet(name, patterns, flags))
+
+
+def register_keywords(name, keywords, ignore_case=False):
+    return register(KeywordSet(name, keywords, ignore_case))
+
+
+def register_substitutions(name, rules, flags=0):
+    return register(SubstitutionChain(name, rules, flags))
+
+
+def get_rule(name):
+    try:
+        return _RULES[name]
+    except KeyError:
+        raise KeyError(f"Unknown extraction rule: {name}") from None
+
+
+def all_rules():
+    return dict(_RULES)
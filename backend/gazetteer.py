@@ -0,0 +1,142 @@
+# gazetteer.py
+import os
+import re
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from backend.similarity import find_similar
+
+# Tab-separated places (see the header of the bundled file for the format)
+GAZETTEER_FILE = os.environ.get("LINKLENS_GAZETTEER", str(Path(__file__).with_name("gazetteer.tsv")))
+
+# Spellings a city is also written as on LinkedIn, e.g. "Greater Sydney Area"
+CITY_FORMS = ("{}", "greater {}", "greater {} area", "{} area", "{} metropolitan area", "{} metro area",
+              "{} metro", "{} city", "{} cbd")
+REGION_FORMS = ("{}", "{} region", "{} state")
+
+# Unknown names closer than this to a known one are taken as a misspelling of it
+FUZZY_THRESHOLD = 0.8
+FUZZY_MIN_LENGTH = 4
+
+KEY_WORD_RE = re.compile(r"[a-z0-9]+")
+# "Sydney, New South Wales, Australia · Hybrid", "Melbourne (Remote)"
+WORKPLACE_RE = re.compile(r"\s*[·•|(].*$")
+
+
+def place_key(text):
+    """Lowercase ASCII words of a place name: "Zürich" and "zurich" are both "zurich"."""
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return " ".join(KEY_WORD_RE.findall(text.lower()))
+
+
+@dataclass(slots=True, frozen=True)
+class Place:
+    city: str
+    region: str
+    country: str
+
+    def contains(self, other):
+        """True when other is this place or lies within it."""
+        return (self.country == other.country and self.region in (None, other.region)
+                and self.city in (None, other.city))
+
+    def as_specific_as(self, other):
+        return (other.city is None or self.city is not None) and (other.region is None or self.region is not None)
+
+    def __str__(self):
+        return ", ".join(part for part in (self.city, self.region, self.country) if part)
+
+
+# --------------------------------------------------
+# Gazetteer
+# --------------------------------------------------
+# Every name, alias and "Greater X Area" style form of every place is
+# expanded into one dict from place_key to candidate Places (in file
+# order) when the gazetteer loads, so normalizing a location is a dict
+# lookup. "City, Region, Country" strings are looked up part by part and
+# the city candidate that lies within the other parts is kept, which is
+# how "Victoria, British Columbia" and "Sydney, Nova Scotia" end up in
+# Canada. Only names found nowhere in the index are matched fuzzily.
+
+class Gazetteer:
+    def __init__(self, path=GAZETTEER_FILE):
+        self.index = {}
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.rstrip("\r\n")
+                if not line.strip() or line.startswith("#"):
+                    continue
+                country, region, city, aliases = (line.split("\t") + ["", "", ""])[:4]
+                place = Place(city or None, region or None, country)
+                names = [city or region or country, *(a for a in aliases.split(";") if a)]
+                forms = CITY_FORMS if city else REGION_FORMS if region else ("{}",)
+                for name in names:
+                    for form in forms:
+                        candidates = self.index.setdefault(place_key(form.format(name)), [])
+                        if place not in candidates:
+                            candidates.append(place)
+        self.keys = list(self.index)
+        self.normalize = lru_cache(maxsize=65536)(self._normalize)
+
+    def __len__(self):
+        return len(self.index)
+
+    def _normalize(self, text):
+        """The Place a free-text location names, or None when it names none the gazetteer knows."""
+        if not isinstance(text, str):
+            return None
+        text = WORKPLACE_RE.sub("", text)
+        key = place_key(text)
+        if not key:
+            return None
+        if key in self.index:
+            return self.index[key][0]
+        parts = [p for p in (place_key(part) for part in text.split(",")) if p]
+        found = [self.index[p] for p in parts if p in self.index]
+        if not found:
+            found = [self.index[m] for m in (self._fuzzy(p) for p in parts) if m]
+        return _resolve(found)
+
+    def is_place(self, text):
+        """True when every comma-separated part of text is a known place name (no fuzzy matching)."""
+        parts = [place_key(part) for part in WORKPLACE_RE.sub("", text or "").split(",")]
+        return bool(parts) and all(p in self.index for p in parts)
+
+    def _fuzzy(self, key):
+        if len(key) < FUZZY_MIN_LENGTH:
+            return None
+        return find_similar(key, self.keys, FUZZY_THRESHOLD)
+
+
+def _resolve(found):
+    """The most specific candidate of the first part that lies within every later part."""
+    while found:
+        first, context = found[0], found[1:]
+        consistent = [p for p in first if all(any(c.contains(p) for c in candidates) for candidates in context)]
+        if consistent:
+            return max(consistent, key=lambda p: (p.city is not None) + (p.region is not None))
+        # "Perth, Scotland": a first part that contradicts the rest is dropped
+        found = context
+    return None
+
+
+# --------------------------------------------------
+# Default gazetteer
+# --------------------------------------------------
+_default_gazetteer = None
+
+
+def default_gazetteer():
+    """The gazetteer at GAZETTEER_FILE, loaded on first use."""
+    global _default_gazetteer
+    if _default_gazetteer is None:
+        _default_gazetteer = Gazetteer(GAZETTEER_FILE)
+    return _default_gazetteer
+
+
+def normalize_location(text):
+    """Canonical Place of a location string (cached), or None."""
+    return default_gazetteer().normalize(text)
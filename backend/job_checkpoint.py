@@ -0,0 +1,182 @@
+# job_checkpoint.py
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+JOBS_DIR = Path("data/jobs")
+
+# Stages in the order a job runs them
+STAGES = ["links", "fetch", "parse", "enrich", "export"]
+
+# Persist at least every N items or every N seconds inside a stage
+CHECKPOINT_EVERY = 10
+CHECKPOINT_SECONDS = 15
+
+# Never written to disk; resuming reuses the saved LinkedIn session or asks again
+SECRET_PARAMS = {"password"}
+
+# --------------------------------------------------
+# Checkpointed scraper job
+# --------------------------------------------------
+# data/jobs/<job_id>/checkpoint.json holds the job parameters and every
+# stage's output so far:
+#   links     profile links to fetch
+#   fetched   link -> saved profile file name
+#   failed    links that could not be saved
+#   parsed    profile file name -> accepted row, or null if rejected
+#   contacts  vanity id -> {"Email", "Phone"}
+# Stage outputs are keyed, so re-running a stage after a resume only does
+# the missing work. Writes go through a temp file + os.replace.
+
+class JobCheckpoint:
+    def __init__(self, job_id, state=None, jobs_dir=JOBS_DIR):
+        self.job_id = job_id
+        self.folder = Path(jobs_dir) / job_id
+        self.path = self.folder / "checkpoint.json"
+        self.state = state or {}
+        self._lock = threading.Lock()
+        self._dirty = 0
+        self._last_save = 0.0
+
+    # ---------------- Create / load ----------------
+    @classmethod
+    def create(cls, params, jobs_dir=JOBS_DIR):
+        job_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        now = datetime.now().isoformat(timespec="seconds")
+        job = cls(job_id, {
+            "job_id": job_id,
+            "params": public_params(params),
+            "status": "running",
+            "stages": {stage: False for stage in STAGES},
+            "links": [],
+            "fetched": {},
+            "failed": [],
+            "parsed": {},
+            "contacts": {},
+            "results_path": None,
+            "error": None,
+            "created_at": now,
+            "updated_at": now,
+        }, jobs_dir)
+        job.save(force=True)
+        return job
+
+    @classmethod
+    def load(cls, job_id, jobs_dir=JOBS_DIR):
+        path = Path(jobs_dir) / os.path.basename(job_id) / "checkpoint.json"
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(path.parent.name, json.load(f), jobs_dir)
+
+    # ---------------- Accessors ----------------
+    @property
+    def params(self):
+        return self.state["params"]
+
+    def stage_done(self, stage):
+        return bool(self.state["stages"].get(stage))
+
+    def summary(self):
+        s = self.state
+        accepted = sum(1 for row in s["parsed"].values() if row)
+        return {
+            "job_id": self.job_id,
+            "status": s["status"],
+            "mode": s["params"].get("mode"),
+            "job_title": s["params"].get("job_title"),
+            "stages": s["stages"],
+            "links": len(s["links"]),
+            "fetched": len(s["fetched"]),
+            "failed": len(s["failed"]),
+            "parsed": len(s["parsed"]),
+            "accepted": accepted,
+            "enriched": len(s["contacts"]),
+            "results_path": s["results_path"],
+            "error": s["error"],
+            "updated_at": s["updated_at"],
+        }
+
+    # ---------------- Updates ----------------
+    def set_links(self, links):
+        with self._lock:
+            self.state["links"] = list(dict.fromkeys(links))
+        self.complete_stage("links")
+
+    def record_fetch(self, link, path):
+        # Saved right away: a lost entry would fetch the profile again into a second file
+        with self._lock:
+            if path:
+                self.state["fetched"][link] = Path(path).name
+                if link in self.state["failed"]:
+                    self.state["failed"].remove(link)
+            elif link not in self.state["failed"]:
+                self.state["failed"].append(link)
+        self.save(force=bool(path))
+
+    def record_parse(self, file_name, row):
+        # Accepted files are moved out of the temp folder, so their rows are saved right away
+        with self._lock:
+            self.state["parsed"][Path(file_name).name] = row
+        self.save(force=bool(row))
+
+    def record_contact(self, vanity, email, phone):
+        with self._lock:
+            self.state["contacts"][vanity] = {"Email": email, "Phone": phone}
+        self.save()
+
+    def complete_stage(self, stage):
+        with self._lock:
+            self.state["stages"][stage] = True
+        self.save(force=True)
+
+    def finish(self, status="completed", error=None):
+        with self._lock:
+            self.state["status"] = status
+            self.state["error"] = error
+        self.save(force=True)
+
+    # ---------------- Persistence ----------------
+    def save(self, force=False):
+        """Write the checkpoint; without force only every CHECKPOINT_EVERY updates / CHECKPOINT_SECONDS."""
+        with self._lock:
+            self._dirty += 1
+            now = time.monotonic()
+            if not force and self._dirty < CHECKPOINT_EVERY and now - self._last_save < CHECKPOINT_SECONDS:
+                return
+            self.state["updated_at"] = datetime.now().isoformat(timespec="seconds")
+            self.folder.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.folder, text=True)
+            with os.fdopen(fd, "w", encoding="utf-8") as tmpf:
+                json.dump(self.state, tmpf, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self._dirty = 0
+            self._last_save = now
+
+
+def public_params(params):
+    return {k: (str(v) if isinstance(v, Path) else v) for k, v in params.items() if k not in SECRET_PARAMS}
+
+
+def list_jobs(jobs_dir=JOBS_DIR, active_job_id=None):
+    """Summaries of all checkpointed jobs, newest first.
+
+    A job still marked running that is not the active one was cut off by a
+    crash or restart and is reported as interrupted.
+    """
+    jobs = []
+    for path in sorted(Path(jobs_dir).glob("*/checkpoint.json"), reverse=True):
+        try:
+            job = JobCheckpoint.load(path.parent.name, jobs_dir)
+        except (OSError, ValueError):
+            continue
+        summary = job.summary()
+        if summary["status"] == "running" and job.job_id != active_job_id:
+            summary["status"] = "interrupted"
+        jobs.append(summary)
+    return jobs
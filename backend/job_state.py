@@ -0,0 +1,287 @@
+# job_state.py
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+
+from backend.task_queue import worker_name
+
+# "sqlite:///path/to/state.db" (default) or "redis://host:6379/0"
+STATE_URL = os.environ.get("LINKLENS_STATE_URL", "sqlite:///data/state/app.db")
+
+# Events kept for SSE clients that reconnect with Last-Event-ID
+EVENTS_KEEP = 5000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id      INTEGER PRIMARY KEY AUTOINCREMENT,
+    message TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS kv (
+    key         TEXT PRIMARY KEY,
+    value       TEXT,
+    owner       TEXT,
+    lease_until REAL
+);
+"""
+
+
+# --------------------------------------------------
+# Shared job state
+# --------------------------------------------------
+# Everything the web workers have to agree on: the status event log the
+# SSE endpoint streams, the "scraper running" lock, the current job id and
+# values the job publishes for the dashboard (e.g. the rate controllers'
+# stats). Each gunicorn worker, and the job process, opens the same store,
+# so a job started in one worker is visible to requests served by any other.
+#
+# Only this state goes through the store. Results, checkpoints, the task
+# queue, the identity store and the profile index are SQLite files under
+# data/, so every process still needs the same data directory.
+#
+# The scraper lock is a lease: the owner renews it while the job runs,
+# and a worker that dies without releasing it frees it once it expires.
+
+class SQLiteJobState:
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA busy_timeout=30000")
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    # ---------------- Events ----------------
+    def push_event(self, message):
+        with self._connect() as conn:
+            event_id = conn.execute("INSERT INTO events (message) VALUES (?)", (message,)).lastrowid
+            if event_id % 500 == 0:
+                conn.execute("DELETE FROM events WHERE id <= ?", (event_id - EVENTS_KEEP,))
+        return event_id
+
+    def events_after(self, last_id, limit=100):
+        """[(id, message)] of events newer than last_id, oldest first."""
+        with self._connect() as conn:
+            return conn.execute("SELECT id, message FROM events WHERE id > ? ORDER BY id LIMIT ?",
+                                (last_id, limit)).fetchall()
+
+    def last_event_id(self):
+        with self._connect() as conn:
+            return conn.execute("SELECT COALESCE(MAX(id), 0) FROM events").fetchone()[0]
+
+    # ---------------- Scraper lock ----------------
+    def acquire_scraper(self, owner=None, lease_seconds=60):
+        """Take the scraper lock; False if another live owner holds it."""
+        owner = owner or worker_name()
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT owner, lease_until FROM kv WHERE key = 'scraper'").fetchone()
+            if row and row[0] and row[0] != owner and (row[1] or 0) > now:
+                conn.execute("COMMIT")
+                return False
+            conn.execute("INSERT OR REPLACE INTO kv (key, owner, lease_until) VALUES ('scraper', ?, ?)",
+                         (owner, now + lease_seconds))
+            conn.execute("COMMIT")
+        return True
+
+    def renew_scraper(self, owner=None, lease_seconds=60):
+        owner = owner or worker_name()
+        with self._connect() as conn:
+            cur = conn.execute("UPDATE kv SET lease_until = ? WHERE key = 'scraper' AND owner = ?",
+                               (time.time() + lease_seconds, owner))
+            return cur.rowcount == 1
+
+    def release_scraper(self, owner=None):
+        owner = owner or worker_name()
+        with self._connect() as conn:
+            conn.execute("DELETE FROM kv WHERE key = 'scraper' AND owner = ?", (owner,))
+
+    def scraper_active(self):
+        with self._connect() as conn:
+            row = conn.execute("SELECT lease_until FROM kv WHERE key = 'scraper'").fetchone()
+        return bool(row and (row[0] or 0) > time.time())
+
+    # ---------------- Current job ----------------
+    def set_current_job(self, job_id, first_event_id=0):
+        """first_event_id: where the job's status log starts, replayed to clients that connect mid-job."""
+        with self._connect() as conn:
+            conn.executemany("INSERT OR REPLACE INTO kv (key, value) VALUES (?, ?)",
+                             [("current_job", job_id), ("current_job_first_event", str(first_event_id))])
+
+    def current_job_id(self):
+        return self.current_job()[0]
+
+    def current_job(self):
+        """(job_id, first_event_id), or (None, 0) before the first job."""
+        with self._connect() as conn:
+            values = dict(conn.execute("SELECT key, value FROM kv WHERE key IN "
+                                       "('current_job', 'current_job_first_event')"))
+        return values.get("current_job"), int(values.get("current_job_first_event") or 0)
+
+    # ---------------- Published values ----------------
+    def set_value(self, key, value):
+        """Store a JSON-serializable value under key, replacing the previous one."""
+        with self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO kv (key, value) VALUES (?, ?)", (f"value:{key}", json.dumps(value)))
+
+    def get_value(self, key, default=None):
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM kv WHERE key = ?", (f"value:{key}",)).fetchone()
+        return json.loads(row[0]) if row else default
+
+
+class RedisJobState:
+    """
+    Same interface as SQLiteJobState, kept in Redis.
+
+    Only the events, the scraper lock, the current job and published values
+    move to Redis; the processes still need a shared data directory (see above).
+    """
+
+    def __init__(self, url, prefix="linklens:"):
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError("LINKLENS_STATE_URL is a redis:// URL but the redis package is not installed "
+                              "(pip install redis)") from e
+        self.redis = redis.Redis.from_url(url, decode_responses=True)
+        self.prefix = prefix
+
+    def _key(self, name):
+        return f"{self.prefix}{name}"
+
+    # ---------------- Events ----------------
+    def push_event(self, message):
+        event_id = self.redis.incr(self._key("event_id"))
+        pipe = self.redis.pipeline()
+        pipe.zadd(self._key("events"), {f"{event_id}:{message}": event_id})
+        pipe.zremrangebyscore(self._key("events"), 0, event_id - EVENTS_KEEP)
+        pipe.execute()
+        return event_id
+
+    def events_after(self, last_id, limit=100):
+        members = self.redis.zrangebyscore(self._key("events"), f"({last_id}", "+inf", start=0, num=limit)
+        return [(int(event_id), message) for event_id, message in (m.split(":", 1) for m in members)]
+
+    def last_event_id(self):
+        return int(self.redis.get(self._key("event_id")) or 0)
+
+    # ---------------- Scraper lock ----------------
+    def acquire_scraper(self, owner=None, lease_seconds=60):
+        owner = owner or worker_name()
+        key = self._key("scraper")
+        if self.redis.set(key, owner, nx=True, ex=lease_seconds):
+            return True
+        # Re-entrant for the current owner
+        if self.redis.get(key) == owner:
+            self.redis.expire(key, lease_seconds)
+            return True
+        return False
+
+    def renew_scraper(self, owner=None, lease_seconds=60):
+        owner = owner or worker_name()
+        key = self._key("scraper")
+        if self.redis.get(key) != owner:
+            return False
+        return bool(self.redis.expire(key, lease_seconds))
+
+    def release_scraper(self, owner=None):
+        owner = owner or worker_name()
+        key = self._key("scraper")
+        if self.redis.get(key) == owner:
+            self.redis.delete(key)
+
+    def scraper_active(self):
+        return bool(self.redis.exists(self._key("scraper")))
+
+    # ---------------- Current job ----------------
+    def set_current_job(self, job_id, first_event_id=0):
+        self.redis.hset(self._key("current_job"), mapping={"job_id": job_id, "first_event_id": first_event_id})
+
+    def current_job_id(self):
+        return self.current_job()[0]
+
+    def current_job(self):
+        job = self.redis.hgetall(self._key("current_job"))
+        return (job.get("job_id"), int(job.get("first_event_id") or 0))
+
+    # ---------------- Published values ----------------
+    def set_value(self, key, value):
+        self.redis.set(self._key(f"value:{key}"), json.dumps(value))
+
+    def get_value(self, key, default=None):
+        value = self.redis.get(self._key(f"value:{key}"))
+        return json.loads(value) if value is not None else default
+
+
+# --------------------------------------------------
+# Event feed
+# --------------------------------------------------
+# One poller per process reads new events from the store into a small
+# buffer and wakes the waiting SSE streams, so hundreds of open dashboard
+# tabs cost one store query per poll instead of one each.
+
+class EventFeed:
+    def __init__(self, state, poll_interval=0.5, buffer_size=500):
+        self.state = state
+        self.poll_interval = poll_interval
+        self._events = deque(maxlen=buffer_size)
+        self._last_id = None
+        self._cond = threading.Condition()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def _ensure_started(self):
+        # Started on first use so it runs in the serving (forked) process, not the gunicorn master
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    self._last_id = self.state.last_event_id()
+                    self._thread = threading.Thread(target=self._run, name="event-feed", daemon=True)
+                    self._thread.start()
+
+    def _run(self):
+        while True:
+            try:
+                events = self.state.events_after(self._last_id, limit=500)
+            except Exception as e:
+                print(f"⚠️ Event feed poll failed: {e}")
+                events = []
+            if events:
+                with self._cond:
+                    self._events.extend(events)
+                    self._last_id = events[-1][0]
+                    self._cond.notify_all()
+            if len(events) < 500:
+                time.sleep(self.poll_interval)
+
+    def wait(self, last_id, timeout):
+        """Events newer than last_id; blocks up to timeout seconds when there are none yet."""
+        self._ensure_started()
+        with self._cond:
+            if self._last_id <= last_id:
+                self._cond.wait(timeout)
+            buffered = self._events[0][0] if self._events else self._last_id + 1
+            if last_id + 1 >= buffered:
+                return [event for event in self._events if event[0] > last_id]
+        # Older than the buffer (a reconnect or a replayed job log): read the store directly
+        return self.state.events_after(last_id)
+
+
+def open_job_state(url=STATE_URL):
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisJobState(url)
+    return SQLiteJobState(url.removeprefix("sqlite:///"))
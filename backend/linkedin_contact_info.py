@@ -3,6 +3,10 @@ import json
 import requests
 import re
 from bs4 import BeautifulSoup
+from urllib.parse import urlparse
+
+from backend.linkedin_urls import contact_overlay_url, linkedin_url, profile_url
+from backend.rate_control import LINKEDIN_RATE
 
 # --------------------------------------------------
 # Cookie loader (reusable)
@@ -29,9 +33,7 @@ def load_cookies(session_dir):
             else:
                 continue
 
-            for c in cookie_list:
-                if "linkedin.com" in c.get("domain", ""):
-                    cookies[c["name"]] = c["value"]
+            cookies.update(_cookie_dict(cookie_list))
 
     if not cookies.get("li_at"):
         raise Exception("li_at cookie missing")
@@ -39,21 +41,46 @@ def load_cookies(session_dir):
     return cookies
 
 
+def _cookie_dict(cookies):
+    """Name -> value for the LinkedIn host, from a dict or a Playwright cookie list."""
+    if isinstance(cookies, dict):
+        return cookies
+
+    host = urlparse(linkedin_url()).hostname or ""
+    result = {}
+    for c in cookies or []:
+        domain = c.get("domain", "").lstrip(".")
+        if "linkedin.com" in domain or (domain and host.endswith(domain)):
+            result[c["name"]] = c["value"]
+    return result
+
+
 # --------------------------------------------------
 # Public API function (THIS is what app.py will call)
 # --------------------------------------------------
-def get_contact_info_for_profile(vanity_id, cookies):
+def get_contact_info_for_profile(vanity_id, cookies, rate=LINKEDIN_RATE):
+    """
+    Emails and phones from the profile's contact overlay, paced by the shared rate controller.
+
+    Raises ThrottledError if LinkedIn keeps throttling, and an Exception for
+    any other non-200 response, rather than returning empty contacts.
+    """
     headers = {
         "User-Agent": "Mozilla/5.0",
         "Accept": "text/html",
-        "Referer": f"https://www.linkedin.com/in/{vanity_id}/",
+        "Referer": profile_url(vanity_id),
     }
 
-    overlay_url = f"https://www.linkedin.com/in/{vanity_id}/overlay/contact-info/"
-    r = requests.get(overlay_url, headers=headers, cookies=cookies, timeout=30)
+    overlay_url = contact_overlay_url(vanity_id)
+    cookie_dict = _cookie_dict(cookies)
+
+    def fetch():
+        r = requests.get(overlay_url, headers=headers, cookies=cookie_dict, timeout=30)
+        return r.status_code, r.url, r
 
+    r = rate.call(fetch)
     if r.status_code != 200:
-        return {"emails": [], "phones": []}
+        raise Exception(f"Contact overlay returned HTTP {r.status_code} for {vanity_id}")
 
     return _parse_contact_from_html(r.text)
 
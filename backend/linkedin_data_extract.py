@@ -1,15 +1,33 @@
+import os
 from pathlib import Path
 from bs4 import BeautifulSoup
 import re
 import pandas as pd
 import shutil
 from datetime import datetime
-from difflib import SequenceMatcher
+from functools import lru_cache
+
+from backend.extract_rules import (
+    register_patterns, register_keywords, register_substitutions
+)
+from backend.parse_profiler import NULL_PROFILER
+from backend.linkedin_urls import profile_url
+from backend.profile_record import ProfileRecord
+from backend.profile_index import index_profiles
+from backend.profile_identity import profile_fields, record_from_fields
+from backend.gazetteer import default_gazetteer, normalize_location
+from backend.relevance import FIELD_WEIGHTS, RELEVANCE_THRESHOLD, RelevanceScorer, term_id
+from backend.linkedin_json_extract import (
+    CAPTURE_SUFFIX, extract_profile_data, experience_from_positions, load_capture
+)
 
 # Folders
 HTML_FOLDER = "data/temp"
 PARSED_FOLDER = "data/temp/parsed"
 
+# "auto": use the page's embedded API data where present, DOM otherwise; "dom": DOM only
+EXTRACTION_ENGINE = os.environ.get("LINKLENS_EXTRACTION_ENGINE", "auto").strip().lower()
+
 BAD_SKILLS = {
     "follow", "message", "subscribe", "connect", "connections",
     "followers", "endorse", "unsw", "ibm", "accenture",
@@ -30,6 +48,75 @@ JUNK_EXPERIENCE_PATTERNS = [
     r'^[·•\-]+$',
 ]
 
+# Section headings that end the experience block
+EXPERIENCE_STOP_HEADINGS = frozenset({
+    "education", "skills", "languages", "licenses", "about",
+    "recommendations", "interests", "volunteering"
+})
+
+# Section headings that end the skills block
+SKILLS_STOP_HEADINGS = frozenset({
+    "interests", "education", "experience", "volunteering", "recommendations",
+    "licenses & certifications", "test scores", "languages", "honors & awards"
+})
+
+# LinkedIn UI filler that shows up between skills
+SKILLS_UI_FILLER = [
+    "endorse", "logo", "followers", "person",
+    "show all", "company", "connections",
+]
+
+UI_JUNK_ENTRIES = frozenset({
+    'now you know', 'you now know', 'show all', 'see all', 'view more',
+    'not found', 'follow', 'message', 'connect',
+    'full-time', 'part-time', 'contract', 'freelance', 'remote', 'hybrid'
+})
+
+# ---------------- Compiled rules ----------------
+DATE_PATTERN = r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|\d{4}|Present)'
+EMPLOYMENT_TYPES = r'(Full-time|Part-time|Freelance|Contract)'
+
+JUNK_EXPERIENCE_RULE = register_patterns("junk_experience", JUNK_EXPERIENCE_PATTERNS, re.I)
+DATE_RULE = register_patterns("date", [DATE_PATTERN])
+SHOW_ALL_RULE = register_patterns("show_all", [r'show all|see all'], re.I)
+SKILLS_FILLER_RULE = register_keywords("skills_filler", SKILLS_UI_FILLER)
+
+DURATION_SUMMARY_RE = re.compile(r'^' + EMPLOYMENT_TYPES + r'\s*·\s*\d+\s*(yr|mo)s?', re.I)
+EMPLOYMENT_SUMMARY_RE = re.compile(r'^' + EMPLOYMENT_TYPES + r'\s*·\s*\d+', re.I)
+EMPLOYMENT_PREFIX_RE = re.compile(r'^' + EMPLOYMENT_TYPES, re.I)
+EMPLOYMENT_DOT_RE = re.compile(r'^' + EMPLOYMENT_TYPES + r'\s*·', re.I)
+EMPLOYMENT_SUFFIX_RE = re.compile(r'\s*·\s*' + EMPLOYMENT_TYPES + r'.*$', re.I)
+COMPANY_WITH_EMPLOYMENT_RE = re.compile(r'.+\s*·\s*' + EMPLOYMENT_TYPES + r'$', re.I)
+WORKPLACE_ONLY_RE = re.compile(r'^(Remote|Hybrid|On-site)$', re.I)
+LOGO_OR_EXPERIENCE_RE = re.compile(r'(logo|experience)', re.I)
+TITLE_SKIP_RE = re.compile(r'(full-time|part-time|logo)', re.I)
+SPLIT_TITLE_COMPANY_RE = re.compile(r'(?<=[a-zA-Z])(?=[A-Z][a-z]+ · )')
+DIGITS_PUNCT_RE = re.compile(r'[\d\s\-·•,]+')
+TWO_LETTERS_RE = re.compile(r'[a-zA-Z]{2,}')
+CONNECTION_DEGREE_RE = re.compile(r'·\s*(1st|2nd|3rd)')
+FILE_TIMESTAMP_RE = re.compile(r'_\d{10}$')
+WORD_RE = re.compile(r'\b[a-zA-Z]+\b')
+
+EXPERIENCE_LOCATION_RE = re.compile(
+    r'^(?P<city>[A-Z][a-zA-Z\s]+,\s*[A-Z][a-zA-Z\s,]+)\s*(?:·\s*(Remote|Hybrid|On-site))?|'
+    r'^(?P<city2>[A-Z][a-zA-Z\s]+)\s*·\s*(Remote|Hybrid|On-site)', re.I
+)
+
+HEADLINE_NOISE_RULE = register_patterns(
+    "headline_noise", [r'\b(follower|connection|connect|contact|email|1st|2nd|3rd)\b'], re.I
+)
+HEADLINE_ROLE_RULE = register_patterns(
+    "headline_role", [r'\b(Engineer|Developer|Manager|Founder|Consultant|CEO|CTO)\b']
+)
+HEADLINE_ROLE_WORD_RULE = register_patterns(
+    "headline_role_word", [r"(Manager|Engineer|Developer|Officer|Consultant)"]
+)
+HEADLINE_WORKPLACE_RULE = register_patterns("headline_workplace", [r"\b(Remote|Hybrid)\b"], re.I)
+HEADLINE_NUMBER_RE = re.compile(r"[0-9,]+")
+HEADLINE_LOCATION_RE = re.compile(r"^[A-Z][A-Za-z\.\s'-]+(,\s*[A-Z][A-Za-z\.\s'-]+)+$")
+GREATER_AREA_RE = re.compile(r"\bGreater\s+[A-Z][A-Za-z\s]+Area\b")
+PLAIN_PLACE_RE = re.compile(r"[A-Z][A-Za-z\s]+")
+
 def normalize_text(t):
     if not t:
         return ""
@@ -37,11 +124,6 @@ def normalize_text(t):
     t = re.sub(r"[^\w\s\-.#/+]", "", t)
     return t
 
-def is_similar(a, b, threshold=0.82):
-    if not a or not b:
-        return False
-    return SequenceMatcher(None, a, b).ratio() >= threshold
-
 def _clean_title_company_for_compare(s):
     if not s:
         return ""
@@ -58,29 +140,21 @@ def is_valid_experience_entry(title, company, dates):
     title_lower = title.lower().strip()
     company_lower = company.lower().strip()
 
-    for pattern in JUNK_EXPERIENCE_PATTERNS:
-        if re.search(pattern, title_lower, re.IGNORECASE):
-            return False
-        if re.search(pattern, company_lower, re.IGNORECASE):
-            return False
+    if JUNK_EXPERIENCE_RULE.search(title_lower) or JUNK_EXPERIENCE_RULE.search(company_lower):
+        return False
 
     if len(title.strip()) < 3 or len(company.strip()) < 2:
         return False
 
-    ui_junk = {
-        'now you know', 'you now know', 'show all', 'see all', 'view more',
-        'not found', 'follow', 'message', 'connect',
-        'full-time', 'part-time', 'contract', 'freelance', 'remote', 'hybrid'
-    }
-    if title_lower in ui_junk or company_lower in ui_junk:
+    if title_lower in UI_JUNK_ENTRIES or company_lower in UI_JUNK_ENTRIES:
         return False
 
-    if re.fullmatch(r'[\d\s\-·•,]+', title.strip()):
+    if DIGITS_PUNCT_RE.fullmatch(title.strip()):
         return False
-    if re.fullmatch(r'[\d\s\-·•,]+', company.strip()):
+    if DIGITS_PUNCT_RE.fullmatch(company.strip()):
         return False
 
-    if not re.search(r'[a-zA-Z]{2,}', title) or not re.search(r'[a-zA-Z]{2,}', company):
+    if not TWO_LETTERS_RE.search(title) or not TWO_LETTERS_RE.search(company):
         return False
 
     return True
@@ -102,7 +176,7 @@ def find_skills(html):
     skills = []
     for elem in skills_heading.find_all_next(["span", "div", "li"]):
         txt = elem.get_text(strip=True).lower()
-        if txt in {"interests", "education", "experience", "volunteering", "recommendations", "licenses & certifications", "test scores", "languages", "honors & awards"}:
+        if txt in SKILLS_STOP_HEADINGS:
             break
 
         # Skip non-leaf nodes
@@ -112,10 +186,7 @@ def find_skills(html):
             continue
 
         # Skip LinkedIn UI filler
-        if any(x in txt for x in [
-            "endorse", "logo", "followers", "person",
-            "show all", "company", "connections",
-        ]):
+        if SKILLS_FILLER_RULE.contains_any(txt):
             continue
 
         # Skill length sanity
@@ -160,7 +231,7 @@ def find_name(html):
     h1 = soup.find("h1")
     if h1:
         name = h1.get_text(strip=True)
-        name = re.sub(r'·\s*(1st|2nd|3rd)', '', name).split("|")[0].strip()
+        name = CONNECTION_DEGREE_RE.sub('', name).split("|")[0].strip()
         if name:
             candidates.append(("h1", name, 10))
 
@@ -222,19 +293,17 @@ def extract_experience_lines(html_file):
     for ln in lines[start_idx + 1:]:
         ln_clean = clean_line(ln)
 
-        if ln_clean.lower() in [
-            "education", "skills", "languages", "licenses", "about",
-            "recommendations", "interests", "volunteering"
-        ]:
+        ln_lower = ln_clean.lower()
+        if ln_lower in EXPERIENCE_STOP_HEADINGS:
             break
 
-        if "logo" in ln_clean.lower() or ln_clean.lower().startswith("experience"):
+        if "logo" in ln_lower or ln_lower.startswith("experience"):
             continue
 
-        if re.search(r'show all|see all', ln_clean, re.I):
+        if SHOW_ALL_RULE.search(ln_clean):
             continue
 
-        split_lines = re.split(r'(?<=[a-zA-Z])(?=[A-Z][a-z]+ · )', ln_clean)
+        split_lines = SPLIT_TITLE_COMPANY_RE.split(ln_clean)
         for sl in split_lines:
             sl_clean = sl.strip()
             if sl_clean and sl_clean not in seen:
@@ -244,26 +313,22 @@ def extract_experience_lines(html_file):
     return block
 
 def detect_first_company_structure(block):
-    date_pattern = r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|\d{4}|Present)'
     first_date_idx = None
     for i, ln in enumerate(block[:15]):
-        if re.search(date_pattern, ln):
+        if DATE_RULE.search(ln):
             first_date_idx = i
             break
     if not first_date_idx:
         return 'single'
-    duration_summary_pattern = r'^(Full-time|Part-time|Freelance|Contract)\s*·\s*\d+\s*(yr|mo)s?'
     for i in range(first_date_idx):
-        if re.match(duration_summary_pattern, block[i], re.I):
+        if DURATION_SUMMARY_RE.match(block[i]):
             return 'multiple'
-    company_with_employment_pattern = r'.+\s*·\s*(Full-time|Part-time|Freelance|Contract)$'
     for i in range(min(3, first_date_idx)):
-        if re.search(company_with_employment_pattern, block[i], re.I):
+        if COMPANY_WITH_EMPLOYMENT_RE.search(block[i]):
             return 'single'
     return 'single'
 
 def extract_first_company_roles(block, structure):
-    date_pattern = r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|\d{4}|Present)'
     roles = []
     seen_roles = set()
     first_company = None
@@ -274,23 +339,23 @@ def extract_first_company_roles(block, structure):
             line = block[i]
 
             if not first_company and len(line) > 5:
-                if not re.search(date_pattern, line) and not re.search(r'(logo|experience)', line, re.I):
+                if not DATE_RULE.search(line) and not LOGO_OR_EXPERIENCE_RE.search(line):
                     first_company = line
                     i += 1
-                    if i < len(block) and re.match(r'^(Full-time|Part-time|Freelance|Contract)\s*·\s*\d+', block[i], re.I):
+                    if i < len(block) and EMPLOYMENT_SUMMARY_RE.match(block[i]):
                         i += 1
                     continue
 
-            if first_company and re.search(date_pattern, line):
+            if first_company and DATE_RULE.search(line):
                 entry = {"title": None, "company": first_company, "dates": line, "location": None}
 
                 for j in range(i - 1, max(i - 6, -1), -1):
                     l = block[j]
                     if len(l) < 3:
                         continue
-                    if re.search(r'(full-time|part-time|logo)', l, re.I):
+                    if TITLE_SKIP_RE.search(l):
                         continue
-                    if re.search(date_pattern, l):
+                    if DATE_RULE.search(l):
                         continue
                     if l.startswith("-"):  # skip description lines
                         continue
@@ -310,16 +375,16 @@ def extract_first_company_roles(block, structure):
         first_title = None
         first_company = None
         for i, ln in enumerate(block):
-            if re.search(date_pattern, ln):
+            if DATE_RULE.search(ln):
                 dates = ln
                 # USE THE HELPER FUNCTION HERE TOO
                 location = extract_location_from_block(block, i)
                 if first_title and first_company:
                     roles.append({"title": first_title, "company": first_company, "dates": dates, "location": location})
                 break
-            if re.match(r'^(Full-time|Part-time|Freelance|Contract)', ln, re.I):
+            if EMPLOYMENT_PREFIX_RE.match(ln):
                 continue
-            if re.match(r'^(Remote|Hybrid|On-site)$', ln, re.I):
+            if WORKPLACE_ONLY_RE.match(ln):
                 continue
             if len(ln) < 3:
                 continue
@@ -327,7 +392,7 @@ def extract_first_company_roles(block, structure):
                 first_title = ln
                 continue
             if not first_company:
-                first_company = re.sub(r'\s*·\s*(Full-time|Part-time|Freelance|Contract).*$', '', ln, flags=re.I).strip()
+                first_company = EMPLOYMENT_SUFFIX_RE.sub('', ln).strip()
     return roles
 
 def extract_location_from_block(block, date_index, max_lines=6):
@@ -336,10 +401,7 @@ def extract_location_from_block(block, date_index, max_lines=6):
     Searches both before and after the date line.
     """
     # Location pattern - must have comma OR location type keyword
-    location_pattern = re.compile(
-        r'^(?P<city>[A-Z][a-zA-Z\s]+,\s*[A-Z][a-zA-Z\s,]+)\s*(?:·\s*(Remote|Hybrid|On-site))?|'
-        r'^(?P<city2>[A-Z][a-zA-Z\s]+)\s*·\s*(Remote|Hybrid|On-site)', re.I
-    )
+    location_pattern = EXPERIENCE_LOCATION_RE
 
     # First, check lines BEFORE the date (common in LinkedIn's structure)
     for k in range(max(0, date_index - max_lines), date_index):
@@ -347,7 +409,7 @@ def extract_location_from_block(block, date_index, max_lines=6):
         if not line or line.startswith("-"):
             continue
         # Skip employment type summary lines
-        if re.match(r'^(Full-time|Part-time|Freelance|Contract)\s*·', line, re.I):
+        if EMPLOYMENT_DOT_RE.match(line):
             continue
         # Skip if it's just a single word (likely company name)
         if ',' not in line and '·' not in line:
@@ -396,20 +458,18 @@ def find_experience(html):
     for ln in lines[start_idx + 1:]:
         ln_clean = ln.strip()
 
-        if ln_clean.lower() in [
-            "education", "skills", "languages", "licenses", "about",
-            "recommendations", "interests", "volunteering"
-        ]:
+        ln_lower = ln_clean.lower()
+        if ln_lower in EXPERIENCE_STOP_HEADINGS:
             break
 
-        if "logo" in ln_clean.lower() or ln_clean.lower().startswith("experience"):
+        if "logo" in ln_lower or ln_lower.startswith("experience"):
             continue
 
-        if re.search(r'show all|see all', ln_clean, re.I):
+        if SHOW_ALL_RULE.search(ln_clean):
             continue
 
         # Split combined entries like "Title · Company"
-        split_lines = re.split(r'(?<=[a-zA-Z])(?=[A-Z][a-z]+ · )', ln_clean)
+        split_lines = SPLIT_TITLE_COMPANY_RE.split(ln_clean)
         for sl in split_lines:
             sl_clean = sl.strip()
             if sl_clean and sl_clean not in seen:
@@ -440,28 +500,6 @@ def find_experience(html):
 
     return dataset
 
-def format_experience_bullets(experience):
-    if not isinstance(experience, dict) or not experience.get("Roles"):
-        return "• No experience found"
-
-    bullets = []
-    company = experience.get("Company", "Unknown Company")
-
-    bullets.append(f"• {company}")
-
-    for role in experience["Roles"]:
-        title = role.get("Title", "Unknown Title")
-        dates = role.get("Dates", "Dates not found")
-        location = role.get("Location")
-
-        line = f"  ◦ {title} ({dates})"
-        if location:
-            line += f" — {location}"
-
-        bullets.append(line)
-
-    return "\n".join(bullets)
-
 def get_company_from_experience(experience):
     if not isinstance(experience, dict):
         return "Not found"
@@ -477,12 +515,6 @@ def get_title_from_experience(experience):
 
     return roles[0].get("Title", "Not found")
 
-def get_first_role_title(experience):
-    roles = experience.get("Roles", [])
-    if not roles:
-        return None
-    return roles[0].get("Title")
-
 def get_location_from_experience(experience):
     if not isinstance(experience, dict):
         return "Not found"
@@ -517,35 +549,40 @@ def extract_location_from_headline(html):
 
     clean = []
     for t in candidate_texts:
-        if re.search(r'\b(follower|connection|connect|contact|email|1st|2nd|3rd)\b', t, re.I):
+        if HEADLINE_NOISE_RULE.search(t):
             continue
-        if re.search(r'\b(Engineer|Developer|Manager|Founder|Consultant|CEO|CTO)\b', t):
+        if HEADLINE_ROLE_RULE.search(t):
             continue
         if " at " in t.lower():
             continue
-        if re.fullmatch(r"[0-9,]+", t):
+        if HEADLINE_NUMBER_RE.fullmatch(t):
             continue
         if len(t) <= 2:
             continue
         clean.append(t)
 
-    location_regex = re.compile(r"^[A-Z][A-Za-z\.\s'-]+(,\s*[A-Z][A-Za-z\.\s'-]+)+$")
+    # Known places first, then the shape heuristics
+    gazetteer = default_gazetteer()
     for t in clean:
-        if location_regex.match(t):
+        if gazetteer.is_place(t):
             return t.strip()
 
     for t in clean:
-        m = re.search(r"\bGreater\s+[A-Z][A-Za-z\s]+Area\b", t)
+        if HEADLINE_LOCATION_RE.match(t):
+            return t.strip()
+
+    for t in clean:
+        m = GREATER_AREA_RE.search(t)
         if m:
             return m.group(0)
 
     for t in clean:
-        if re.fullmatch(r"[A-Z][A-Za-z\s]+", t) and len(t.split()) <= 3:
-            if not re.search(r"(Manager|Engineer|Developer|Officer|Consultant)", t):
+        if PLAIN_PLACE_RE.fullmatch(t) and len(t.split()) <= 3:
+            if not HEADLINE_ROLE_WORD_RULE.search(t):
                 return t
 
     for t in clean:
-        if re.search(r"\b(Remote|Hybrid)\b", t, re.I):
+        if HEADLINE_WORKPLACE_RULE.search(t):
             return t.strip()
 
     return None
@@ -559,6 +596,22 @@ recruitment_agencies = [
 # Keywords that indicate a technical/engineering role
 tech_keywords = ['engineer', 'developer', 'architect', 'analyst', 'data', 'software', 'ai', 'ml']
 
+RECRUITER_RULE = register_patterns("recruiter", recruitment_agencies, re.I)
+TECH_KEYWORD_RULE = register_keywords("tech_keywords", tech_keywords)
+
+# Job-title morphology, applied in order
+ROLE_WORD_RULES = [
+    (r'(ists?|ism)$', ''),        # scientist → scient
+    (r'(ing)$', ''),              # engineering → engineer
+    (r'(ics)$', 'ic'),             # analytics → analytic
+    (r'(ers?)$', ''),              # engineers → engineer
+    (r'(ors?)$', ''),              # advisors → advisor
+    (r'(ments?)$', ''),            # management → manage
+    (r'(ives?)$', 'ive'),          # executive → executive
+    (r'(ians?)$', 'ian'),          # statistician
+]
+ROLE_WORD_CHAIN = register_substitutions("role_word", ROLE_WORD_RULES)
+
 def is_recruiter_profile(title, company):
     """
     Returns True if the profile is likely a recruiter, False otherwise.
@@ -567,16 +620,16 @@ def is_recruiter_profile(title, company):
     # Combine title and company for pattern matching
     combined = f"{title} {company}"
 
-    for pattern in recruitment_agencies:
-        if re.search(pattern, combined, re.I):
-            # If the title contains clear technical keywords, allow it through
-            if any(kw in title.lower() for kw in tech_keywords):
-                return False
-            # Otherwise, treat as recruiter
-            return True
+    if RECRUITER_RULE.search(combined):
+        # If the title contains clear technical keywords, allow it through
+        if TECH_KEYWORD_RULE.contains_any(title.lower()):
+            return False
+        # Otherwise, treat as recruiter
+        return True
     return False
 
 
+@lru_cache(maxsize=4096)
 def normalize_role_word(word):
     """
     Normalize common job-title morphology:
@@ -585,26 +638,10 @@ def normalize_role_word(word):
     analyst <-> analytics
     manager <-> management
     """
-    w = word.lower()
-
-    rules = [
-        (r'(ists?|ism)$', ''),        # scientist → scient
-        (r'(ing)$', ''),              # engineering → engineer
-        (r'(ics)$', 'ic'),             # analytics → analytic
-        (r'(ers?)$', ''),              # engineers → engineer
-        (r'(ors?)$', ''),              # advisors → advisor
-        (r'(ments?)$', ''),            # management → manage
-        (r'(ives?)$', 'ive'),          # executive → executive
-        (r'(ians?)$', 'ian'),          # statistician
-    ]
-
-    for pattern, repl in rules:
-        w = re.sub(pattern, repl, w)
-
-    return w
+    return ROLE_WORD_CHAIN.apply(word.lower())
 
 def extract_normalized_role_words(text):
-    words = set(re.findall(r'\b[a-zA-Z]+\b', text.lower()))
+    words = set(WORD_RE.findall(text.lower()))
     words -= COMMON_WORDS
     return {normalize_role_word(w) for w in words}
 
@@ -628,91 +665,346 @@ def fuzzy_match(query, target, threshold=0.6):
 
     return ratio >= threshold
 
-def parse_html(html, file_name):
-    lines = load_text_from_html(html)
-    Experience = find_experience(html)
-    Name = find_name(html)
+def location_match(loc, text):
+    """
+    Whether a profile location lies within the job's location.
+
+    Both are normalized with the gazetteer ("Greater Sydney Area" and "Sydney,
+    New South Wales, Australia" are the same place). fuzzy_match decides when
+    either is not a known place, or the profile's is too coarse to tell (a
+    suburb the gazetteer lacks only resolves to its state).
+
+    This accepts more profiles than word overlap alone used to: a job in
+    "Greater Sydney Area" now takes "Sydney, New South Wales, Australia",
+    "Sydney NSW" and the suburbs listed as Sydney aliases (Parramatta,
+    North Sydney, ...), and a job in a state or country takes every place
+    the gazetteer puts inside it. Matches across countries are no longer
+    made on a shared word ("Sydney, Nova Scotia" is not Sydney, NSW).
+    """
+    if not loc or not text:
+        return False
+    wanted, place = normalize_location(loc), normalize_location(text)
+    if wanted is not None and place is not None:
+        if wanted.contains(place):
+            return True
+        if place.country != wanted.country or place.as_specific_as(wanted):
+            return False
+    return fuzzy_match(loc, text)
+
+# Field texts that stand for "nothing extracted"
+EMPTY_FIELD_TEXTS = {"Not found", "• No experience found"}
+
+@lru_cache(maxsize=65536)
+def role_term_id(word):
+    """term_id of a lowercase word's normalized form; None for common words."""
+    return None if word in COMMON_WORDS else term_id(normalize_role_word(word))
+
+def role_term_ids(text):
+    """Hashed extract_normalized_role_words(text)."""
+    ids = {role_term_id(w) for w in WORD_RE.findall(text.lower())}
+    ids.discard(None)
+    return ids
+
+def profile_term_ids(profile):
+    """Hashed words of the scored fields of a ProfileRecord or result row."""
+    ids = {}
+    for field in FIELD_WEIGHTS:
+        text = profile[field]
+        ids[field] = role_term_ids(text) if isinstance(text, str) and text not in EMPTY_FIELD_TEXTS else ()
+    return ids
+
+@lru_cache(maxsize=64)
+def relevance_scorer(role):
+    return RelevanceScorer(role_term_ids(role or ""))
+
+def score_profiles(profiles, role):
+    """Relevance of each profile (ProfileRecords or result rows) to the job title, as a numpy array."""
+    return relevance_scorer(role).score([profile_term_ids(p) for p in profiles])
+
+def score_profile(profile, role):
+    """score_profiles() of one profile, rounded as shown in the Score column."""
+    return round(float(relevance_scorer(role).score_one(profile_term_ids(profile))), 3)
+
+def parse_html(html, file_name, profiler=NULL_PROFILER, context=None):
+    """
+    Parse one saved profile page into a result row.
+
+    Fields found in the page's embedded API data are used directly; the DOM
+    extractors only run for whatever is missing there. If a context dict is
+    passed it receives the "experience" dataset and "embedded" data so callers
+    don't have to extract them again. Returns a ProfileRecord.
+    """
+    embedded = {}
+    if EXTRACTION_ENGINE != "dom":
+        with profiler.stage("extract_embedded_json"):
+            embedded = extract_profile_data(html)
+
+    if embedded.get("positions"):
+        Experience = experience_from_positions(embedded["positions"])
+    else:
+        with profiler.stage("find_experience"):
+            Experience = find_experience(html)
+
+    if embedded.get("name"):
+        Name = embedded["name"]
+    else:
+        with profiler.stage("find_name"):
+            Name = find_name(html)
     Company = get_company_from_experience(Experience)
     Title = get_title_from_experience(Experience)
     Location = get_location_from_experience(Experience)
 
     # --- Skills ---
-    Skills = find_skills(html)
+    if embedded.get("skills"):
+        Skills = embedded["skills"]
+    else:
+        with profiler.stage("find_skills"):
+            Skills = find_skills(html)
+
+    if embedded.get("vanity"):
+        url = profile_url(embedded["vanity"])
+    else:
+        stem = Path(file_name).stem.strip()
+        stem = FILE_TIMESTAMP_RE.sub('', stem)
+        constructed_url = profile_url(stem)
+        with profiler.stage("find_url"):
+            url = find_url(html, constructed_url)
+
+    if context is not None:
+        context["experience"] = Experience
+        context["embedded"] = embedded
+
+    return ProfileRecord.build(Name, Title, Company, Location, Skills, Experience, url)
+
+
+def parse_capture(text, file_name, profiler=NULL_PROFILER, context=None):
+    """Parse a network capture file (see LinkedInHTML.save_profile_capture) into a result row."""
+    with profiler.stage("load_capture"):
+        embedded = load_capture(text)
+
+    Experience = experience_from_positions(embedded.get("positions"))
+    Skills = embedded.get("skills") or []
+    vanity = embedded.get("vanity") or FILE_TIMESTAMP_RE.sub('', Path(file_name).stem.strip())
+
+    if context is not None:
+        context["experience"] = Experience
+        context["embedded"] = embedded
+
+    return ProfileRecord.build(
+        embedded.get("name") or "Not found",
+        get_title_from_experience(Experience),
+        get_company_from_experience(Experience),
+        get_location_from_experience(Experience),
+        Skills,
+        Experience,
+        profile_url(vanity),
+    )
 
-    stem = Path(file_name).stem.strip()
-    stem = re.sub(r'_\d{10}$', '', stem)
-    constructed_url = f"https://www.linkedin.com/in/{stem}/"
-    url = find_url(html, constructed_url)
 
-    return {
-        "Name": Name,
-        "Title": Title,
-        "Company": Company,
-        "Location": Location,
-        "Skills": "\n".join(f"• {s}" for s in Skills) if Skills else "Not found",
-        "Experience": format_experience_bullets(Experience),
-        "Source_URL": url
-    }
+PROFILE_SUFFIXES = (".html", CAPTURE_SUFFIX)
+RESULT_COLUMNS = ["Name", "Title", "Company", "Location", "Skills", "Experience", "Source_URL"]
+SCORE_COLUMN = "Score"
 
 
-def parse_all_html(move_files=True, role="", loc=""):
-    results = []
-    html_files = list(Path(HTML_FOLDER).glob("*.html"))
+def is_profile_file(path):
+    return Path(path).suffix in PROFILE_SUFFIXES
+
+
+def resolve_parsed_folder(html_folder=None, parsed_folder=None):
+    if parsed_folder:
+        return Path(parsed_folder)
+    if html_folder:
+        return Path(html_folder) / "parsed"
+    return Path(PARSED_FOLDER)
+
+
+def evaluate_profile_file(file, role="", loc="", profiler=NULL_PROFILER, identities=None):
+    """
+    Parse one saved profile file and apply the job filters.
+
+    Returns the ProfileRecord with its accepted flag set, or None for
+    recruiter profiles. Rejection reasons are printed. With an IdentityStore,
+    the parsed profile is merged into it (recruiters too).
+    """
+    file = Path(file)
+    with profiler.stage("read_file"):
+        html = file.read_text(encoding="utf-8")
+    with profiler.file(file, html):
+        context = {}
+        if file.suffix == CAPTURE_SUFFIX:
+            parsed = parse_capture(html, file, profiler, context)
+        else:
+            parsed = parse_html(html, file, profiler, context)
+
+        facts = {
+            # None: only extracted from the page if the location filter needs it
+            "headline_location": context["embedded"].get("location") or ("" if file.suffix == CAPTURE_SUFFIX else None),
+        }
+        fields = profile_fields(parsed, facts) if identities is not None else None
+        accepted = apply_profile_filters(parsed, facts, role, loc, profiler, page=lambda: html)
+
+    if identities is not None:
+        # Recorded as parsed: apply_profile_filters may swap in the headline location
+        fields["headline_location"] = facts["headline_location"]
+        identities.record_parse(fields, file)
+    return parsed if accepted is not None else None
+
+
+def evaluate_known_profile(identity, role="", loc="", profiler=NULL_PROFILER, page=None):
+    """
+    evaluate_profile_file for a profile already in the identity store, without parsing it again.
+
+    page() returns the saved page for the headline location fallback; raises
+    LookupError when the filters need it and there is none (fetch it instead).
+    """
+    parsed, facts = record_from_fields(identity["fields"])
+    accepted = apply_profile_filters(parsed, facts, role, loc, profiler, page=page)
+    return parsed if accepted is not None else None
+
+
+def apply_profile_filters(parsed, facts, role, loc, profiler=NULL_PROFILER, page=None):
+    """
+    Set parsed.accepted from the job's role and location filters; None for recruiters.
+
+    facts holds the headline location (None if not extracted yet, in which
+    case it is extracted from page() when needed).
+    """
+    # Skip recruiters
+    with profiler.stage("filter_recruiter"):
+        is_recruiter = is_recruiter_profile(parsed.title, parsed.company)
+    if is_recruiter:
+        return None
+
+    # Relevance to the job title (title, skills and experience)
+    title_match = True
+    if role:
+        with profiler.stage("filter_relevance"):
+            parsed.score = score_profile(parsed, role)
+        title_match = parsed.score >= RELEVANCE_THRESHOLD
+
+    # Location match with fallback to headline if experience location fails
+    loc_match = False
+    if loc:
+        experience_loc = parsed.location
+        with profiler.stage("filter_location"):
+            exp_loc_match = location_match(loc, experience_loc)
+        if exp_loc_match:
+            loc_match = True
+        else:
+            headline_loc = facts["headline_location"]
+            if headline_loc is None:
+                html = page() if page else None
+                if html is None:
+                    raise LookupError("headline location needs the saved profile page")
+                with profiler.stage("extract_location_from_headline"):
+                    headline_loc = facts["headline_location"] = extract_location_from_headline(html) or ""
+            if headline_loc and location_match(loc, headline_loc):
+                loc_match = True
+                parsed.location = headline_loc  # optionally overwrite with headline
+
+    # Ensure profile has skills and experience
+    has_skills = bool(parsed.skills)
+    has_experience = bool(parsed.roles) or parsed.experience_text != "Not found"
+
+    parsed.accepted = bool(title_match and loc_match and has_skills and has_experience)
+
+    if not parsed.accepted:
+        reasons = []
+        if not title_match:
+            reasons.append(f"Title mismatch: expected '{role}', got '{parsed.title}' "
+                           f"(relevance {parsed.score:.2f} < {RELEVANCE_THRESHOLD})")
+        if not loc_match:
+            reasons.append(f"Location mismatch: expected '{loc}', got '{parsed.location}'")
+        if not has_skills:
+            reasons.append("Missing skills")
+        if not has_experience:
+            reasons.append("Missing experience")
+        print(f"⚠️ Rejected: {parsed.name} - {', '.join(reasons)}")
+
+    return parsed.accepted
+
+
+def move_parsed_file(file, parsed_path, profiler=NULL_PROFILER):
+    dest_file = Path(parsed_path) / Path(file).name
+    with profiler.stage("move_file"):
+        shutil.move(str(file), str(dest_file))
+    return dest_file
+
+
+def results_to_dataframe(results, role=""):
+    """
+    Accepted rows (dicts or ProfileRecords) -> numbered DataFrame in the export column order.
+
+    With a role the rows are ranked by their Score, most relevant first (ties
+    keep their order). Records keep the score the relevance filter gave them;
+    every other row is scored in one batch.
+    """
+    if not results:
+        return pd.DataFrame()
+    if isinstance(results[0], ProfileRecord):
+        # Bullet columns are formatted here, straight into the DataFrame's columns
+        df = pd.DataFrame({col: [r[col] for r in results] for col in RESULT_COLUMNS})
+    else:
+        df = pd.DataFrame(results)
+        df = df.reindex(columns=RESULT_COLUMNS)
+    if role:
+        scores = [r.score if isinstance(r, ProfileRecord) else None for r in results]
+        unscored = [i for i, score in enumerate(scores) if score is None]
+        if unscored:
+            for i, score in zip(unscored, score_profiles([results[i] for i in unscored], role).round(3)):
+                scores[i] = float(score)
+        df.insert(0, SCORE_COLUMN, scores)
+        df = df.sort_values(SCORE_COLUMN, ascending=False, kind="stable", ignore_index=True)
+    df.insert(0, "#", range(1, len(df) + 1))
+    return df
+
 
-    parsed_path = Path(PARSED_FOLDER)
+def parse_all_html(move_files=True, role="", loc="", profiler=NULL_PROFILER, html_folder=None, parsed_folder=None,
+                   skip=(), on_parsed=None, index=True, identities=None):
+    """
+    Parse every saved profile in the folder and return the accepted ones as a DataFrame.
+
+    Files named in skip are left alone; on_parsed(file, parsed) is called for each
+    evaluated file with the accepted row, or None if it was rejected. With index,
+    every parsed profile (accepted or not) is added to the profile search index.
+    With an IdentityStore, files it has already parsed unchanged are evaluated from
+    its record instead of being parsed again, and new ones are merged into it.
+    """
+    results = []
+    parsed_profiles = []
+    reused = 0
+    folder = Path(html_folder or HTML_FOLDER)
+    skip = set(skip)
+    html_files = [
+        f for f in folder.iterdir() if f.is_file() and is_profile_file(f) and f.name not in skip
+    ] if folder.exists() else []
+
+    parsed_path = resolve_parsed_folder(html_folder, parsed_folder)
     if move_files:
         parsed_path.mkdir(parents=True, exist_ok=True)
 
     for file in html_files:
         try:
-            html = file.read_text(encoding="utf-8")
-            parsed = parse_html(html, file)
-
-            # Skip recruiters
-            if is_recruiter_profile(parsed["Title"], parsed["Company"]):
-                continue
-
-            # Title match
-            first_role_title = get_first_role_title(find_experience(html))
-            title_match = fuzzy_match(role, first_role_title) if role else True
-
-            # Location match with fallback to headline if experience location fails
-            loc_match = False
-            if loc:
-                experience_loc = parsed["Location"]
-                if fuzzy_match(loc, experience_loc):
-                    loc_match = True
-                else:
-                    headline_loc = extract_location_from_headline(html)
-                    if headline_loc and fuzzy_match(loc, headline_loc):
-                        loc_match = True
-                        parsed["Location"] = headline_loc  # optionally overwrite with headline
-
-            # Ensure profile has skills and experience
-            has_skills = parsed["Skills"] != "Not found"
-            has_experience = parsed["Experience"] != "Not found"
-
-            parsed['Accepted'] = bool(title_match and loc_match and has_skills and has_experience)
-
-            if not parsed['Accepted']:
-                reasons = []
-                if not title_match:
-                    reasons.append(f"Title mismatch: expected '{role}', got '{parsed['Title']}'")
-                if not loc_match:
-                    reasons.append(f"Location mismatch: expected '{loc}', got '{parsed['Location']}'")
-                if not has_skills:
-                    reasons.append("Missing skills")
-                if not has_experience:
-                    reasons.append("Missing experience")
-                print(f"⚠️ Rejected: {parsed['Name']} - {', '.join(reasons)}")
+            known = identities.known_file(file) if identities is not None else None
+            if known:
+                parsed = evaluate_known_profile(known, role, loc, profiler,
+                                                page=lambda: file.read_text(encoding="utf-8"))
+                reused += 1
+            else:
+                parsed = evaluate_profile_file(file, role, loc, profiler, identities)
+            if parsed:
+                parsed_profiles.append(parsed)
+            if not parsed or not parsed.accepted:
+                if on_parsed:
+                    on_parsed(file, None)
                 continue
 
             results.append(parsed)
 
             if move_files:
-                dest_file = parsed_path / file.name
-                shutil.move(str(file), str(dest_file))
-                #print(f"Moved parsed file to: {dest_file}")
+                move_parsed_file(file, parsed_path, profiler)
+            if on_parsed:
+                on_parsed(file, parsed.to_row())
 
         except Exception as e:
             print(f"❌ Error parsing {file.name}: {e}")
@@ -720,15 +1012,17 @@ def parse_all_html(move_files=True, role="", loc=""):
             traceback.print_exc()
             continue
 
+    if reused:
+        print(f"♻️ {reused} unchanged profiles taken from the identity store")
+    if index and parsed_profiles:
+        with profiler.stage("index_profiles"):
+            index_profiles(parsed_profiles, role, loc)
+
     if not results:
         print("❌ No accepted profiles found")
         return pd.DataFrame()
 
-    desired_order = ["Name", "Title", "Company", "Location", "Skills", "Experience", "Source_URL"]
-
-    df = pd.DataFrame(results)
-    df = df.reindex(columns=desired_order)
-    df.insert(0, "#", range(1, len(df) + 1))
+    df = results_to_dataframe(results, role)
 
     print(f"✅ Parsed {len(html_files)} profiles, {len(results)} accepted")
     return df
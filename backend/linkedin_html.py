@@ -5,47 +5,133 @@ import re
 import shutil
 from urllib.parse import urlparse
 
+from backend.linkedin_json_extract import (
+    CAPTURE_SUFFIX, is_profile_request, iter_embedded_payloads, map_payloads, write_capture
+)
+from backend.rate_control import LINKEDIN_RATE, ThrottledError
+
+# Capture modes: "html" saves page.content(); "network" keeps only the profile's API responses
+CAPTURE_MODES = ("html", "network")
+
 class LinkedInHTML:
-    def __init__(self, page, status_callback=None):
+    def __init__(self, page, status_callback=None, capture_mode="html", on_saved=None, rate=LINKEDIN_RATE):
         self.page = page
+        self.rate = rate
         self.status_callback = status_callback or (lambda msg: None)
-        self.saved_files = []  # Track saved HTML files
+        self.capture_mode = capture_mode if capture_mode in CAPTURE_MODES else "html"
+        self.saved_files = []  # Track saved HTML / capture files
+        self.on_saved = on_saved  # called with each saved path, e.g. ParseWatcher.notify
+
+    def save_profile(self, link: str, folder: Path) -> Path:
+        """Save a profile using the configured capture mode."""
+        if self.capture_mode == "network":
+            return self.save_profile_capture(link, folder)
+        return self.save_profile_html(link, folder)
 
     def save_profile_html(self, link: str, folder: Path) -> Path:
         """Save LinkedIn profile page HTML locally, ensuring unique filenames and handling errors."""
         try:
-            self.page.goto(link)
+            self.rate.call(lambda: self._goto(link))
             time.sleep(2)
             content = self.page.content()
             if not content or len(content) < 100:
                 self.status_callback(f"⚠️ Warning: Content too short or empty for {link}")
+        except ThrottledError:
+            raise
+        except Exception as e:
+            self.status_callback(f"❌ Failed to load {link}: {e}")
+            return None
+
+        return self._write_html(link, folder, content)
+
+    def save_profile_capture(self, link: str, folder: Path) -> Path:
+        """
+        Save a profile as its structured API responses (JSONL) captured during navigation.
+
+        Responses from the profile endpoints are recorded with a response listener,
+        plus the payloads embedded in the page document itself. If they don't hold
+        the name and experience, the rendered HTML is saved instead.
+        """
+        responses = []
+
+        def on_response(response):
+            if response.request.resource_type == "document" or (
+                "/voyager/api/" in response.url and is_profile_request(response.url)
+            ):
+                responses.append(response)
+
+        self.page.on("response", on_response)
+        try:
+            self.rate.call(lambda: self._goto(link))
+            time.sleep(2)
+        except ThrottledError:
+            raise
         except Exception as e:
             self.status_callback(f"❌ Failed to load {link}: {e}")
             return None
+        finally:
+            self.page.remove_listener("response", on_response)
+
+        records = []
+        for response in responses:
+            try:
+                if response.request.resource_type == "document":
+                    records.extend(iter_embedded_payloads(response.text()))
+                else:
+                    url = urlparse(response.url)
+                    request_path = url.path + (f"?{url.query}" if url.query else "")
+                    records.append((request_path, response.json()))
+            except Exception:
+                continue  # redirects and bodies that are gone or not JSON
+
+        slug = self._profile_slug(link)
+        data = map_payloads(records, slug)
+        if not data.get("name") or not data.get("positions"):
+            return self._write_html(link, folder, self.page.content())
 
         folder.mkdir(parents=True, exist_ok=True)
+        filename = folder / f"{slug}_{int(time.time())}{CAPTURE_SUFFIX}"
+        try:
+            write_capture(filename, link, data.get("vanity") or slug, records, int(time.time()))
+            self._saved(filename)
+            return filename
+        except Exception:
+            return None
+
+    def _goto(self, link):
+        response = self.page.goto(link)
+        return (response.status if response else 200), self.page.url, response
+
+    def _saved(self, filename):
+        self.saved_files.append(filename)
+        if self.on_saved:
+            self.on_saved(filename)
 
+    def _profile_slug(self, link, content=""):
         parsed = urlparse(link)
         slug = parsed.path.strip("/").split("/")[-1] or ""
         if not slug:
             title_match = re.search(r"<title>(.*?)</title>", content, re.I | re.S)
             slug = title_match.group(1).strip() if title_match else "linkedin_profile"
 
-        slug = re.sub(r"[^a-zA-Z0-9_-]+", "-", slug).strip("-") or "linkedin_profile"
-        filename = folder / f"{slug}_{int(time.time())}.html"
+        return re.sub(r"[^a-zA-Z0-9_-]+", "-", slug).strip("-") or "linkedin_profile"
+
+    def _write_html(self, link, folder, content):
+        folder.mkdir(parents=True, exist_ok=True)
+        filename = folder / f"{self._profile_slug(link, content)}_{int(time.time())}.html"
 
         try:
             with open(filename, "w", encoding="utf-8") as f:
                 f.write(content)
-            self.saved_files.append(filename)
+            self._saved(filename)
             return filename
         except Exception as e:
             # self.status_callback(f"❌ Failed to save HTML for {link}: {e}")
             return None
 
     def report_saved_count(self):
-        """Send a single status message with total HTML files saved."""
-        self.status_callback(f"💾 {len(self.saved_files)} HTML files saved successfully")
+        """Send a single status message with total profile files saved."""
+        self.status_callback(f"💾 {len(self.saved_files)} profile files saved successfully")
 
     def move_parsed_file(self, file_path: Path, parsed_folder: Path):
         """Move parsed HTML file to a designated folder safely."""
@@ -0,0 +1,240 @@
+# linkedin_json_extract.py
+import html as html_lib
+import json
+import re
+
+try:
+    import orjson
+
+    def _loads(text):
+        return orjson.loads(text)
+except ImportError:  # orjson is optional
+    def _loads(text):
+        return json.loads(text)
+
+# --------------------------------------------------
+# Structured extraction from LinkedIn's embedded API payloads
+# --------------------------------------------------
+# Saved profile pages carry the voyager API responses the page was rendered
+# from as hidden <code> blocks: a "datalet-bpr-guid-N" block describing the
+# request, and a "bpr-guid-N" block with the (HTML-escaped) JSON body.
+# Only bodies of profile-related requests are decoded.
+
+DATALET_RE = re.compile(r'<code[^>]*\bid="datalet-(?P<guid>bpr-guid-\d+)"[^>]*>(?P<body>.*?)</code>', re.S)
+BODY_RE_TEMPLATE = r'<code[^>]*\bid="{guid}"[^>]*>(?P<body>.*?)</code>'
+VANITY_RE = re.compile(r'vanityName:([^,)&]+)')
+
+PROFILE_REQUEST_MARKERS = (
+    "voyagerIdentityDashProfiles",
+    "voyagerIdentityDashProfileComponents",
+    "voyagerIdentityDashProfileCards",
+    "/identity/dash/profiles",
+    "/identity/profiles/",
+)
+
+PROFILE_TYPE = ".identity.profile.Profile"
+POSITION_TYPE = ".identity.profile.Position"
+SKILL_TYPE = ".identity.profile.Skill"
+
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+
+def _decode(text):
+    text = text.strip()
+    if "&" in text:
+        text = html_lib.unescape(text)
+    return _loads(text)
+
+
+def is_profile_request(request_path):
+    return any(marker in (request_path or "") for marker in PROFILE_REQUEST_MARKERS)
+
+
+def iter_embedded_payloads(html):
+    """Yield (request_path, payload) for every profile-related embedded API response."""
+    for m in DATALET_RE.finditer(html):
+        try:
+            meta = _decode(m.group("body"))
+        except ValueError:
+            continue
+        request_path = meta.get("request", "") if isinstance(meta, dict) else ""
+        if not is_profile_request(request_path):
+            continue
+
+        body = re.search(BODY_RE_TEMPLATE.format(guid=re.escape(m.group("guid"))), html, re.S)
+        if not body:
+            continue
+        try:
+            yield request_path, _decode(body.group("body"))
+        except ValueError:
+            continue
+
+
+def _is_type(entity, suffix):
+    return entity.get("$type", "").endswith(suffix)
+
+
+def _format_date(date):
+    if not isinstance(date, dict) or not date.get("year"):
+        return None
+    month = date.get("month")
+    if month and 1 <= month <= 12:
+        return f"{MONTHS[month - 1]} {date['year']}"
+    return str(date["year"])
+
+
+def _date_range(position):
+    """(start, end) date dicts; dash entities use dateRange, older ones timePeriod."""
+    period = position.get("dateRange") or position.get("timePeriod") or {}
+    return (period.get("start") or period.get("startDate") or {},
+            period.get("end") or period.get("endDate") or {})
+
+
+def _format_date_range(position):
+    start, end = _date_range(position)
+    start = _format_date(start)
+    end = _format_date(end) or "Present"
+    return f"{start} - {end}" if start else None
+
+
+def map_payloads(payloads, vanity=None):
+    """Map decoded API responses to profile fields.
+
+    Returns a dict with any of: name, headline, location, vanity,
+    positions [{title, company, dates, location}], skills [names].
+    Missing data is simply left out so callers can fall back to the DOM.
+    """
+    entities = {}
+    primary_urns = []
+    for request_path, payload in payloads:
+        if not vanity:
+            m = VANITY_RE.search(request_path or "")
+            vanity = m.group(1) if m else None
+        if not isinstance(payload, dict):
+            continue
+        for entity in payload.get("included") or []:
+            if isinstance(entity, dict) and entity.get("entityUrn"):
+                entities[entity["entityUrn"]] = entity
+        data = (payload.get("data") or {})
+        data = data.get("data", data) if isinstance(data, dict) else {}
+        for value in data.values() if isinstance(data, dict) else []:
+            if isinstance(value, dict):
+                primary_urns.extend(value.get("*elements") or [])
+
+    # The viewed profile: referenced by the profile query, else matched by vanity
+    profiles = [e for e in entities.values() if _is_type(e, PROFILE_TYPE)]
+    profile = next((entities[u] for u in primary_urns if u in entities and _is_type(entities[u], PROFILE_TYPE)), None)
+    if profile is None and vanity:
+        profile = next((p for p in profiles if p.get("publicIdentifier") == vanity), None)
+    if profile is None:
+        return {}
+
+    result = {}
+    name = " ".join(p for p in (profile.get("firstName"), profile.get("lastName")) if p).strip()
+    if name:
+        result["name"] = name
+    if profile.get("headline"):
+        result["headline"] = profile["headline"]
+    if profile.get("publicIdentifier"):
+        result["vanity"] = profile["publicIdentifier"]
+
+    geo_urn = (profile.get("geoLocation") or {}).get("*geo")
+    geo = entities.get(geo_urn) if geo_urn else None
+    if geo and geo.get("defaultLocalizedName"):
+        result["location"] = geo["defaultLocalizedName"]
+    elif profile.get("locationName"):
+        result["location"] = profile["locationName"]
+
+    positions = []
+    for e in entities.values():
+        if not _is_type(e, POSITION_TYPE) or not e.get("title"):
+            continue
+        positions.append({
+            "title": e["title"],
+            "company": e.get("companyName") or (e.get("company") or {}).get("name"),
+            "dates": _format_date_range(e),
+            "location": e.get("locationName") or e.get("geoLocationName"),
+            "_start": _date_range(e)[0],
+        })
+    if positions:
+        # Newest first, like the Experience section
+        positions.sort(key=lambda p: (p["_start"].get("year", 0), p["_start"].get("month", 0)), reverse=True)
+        for p in positions:
+            p.pop("_start")
+        result["positions"] = positions
+
+    skills = [e["name"] for e in entities.values() if _is_type(e, SKILL_TYPE) and e.get("name")]
+    if skills:
+        result["skills"] = list(dict.fromkeys(skills))
+
+    return result
+
+
+def extract_profile_data(html, vanity=None):
+    """Structured profile fields from the embedded payloads of a saved page ({} if none)."""
+    if "bpr-guid-" not in html:
+        return {}
+    return map_payloads(iter_embedded_payloads(html), vanity)
+
+
+def experience_from_positions(positions, max_roles=3):
+    """Experience dataset (same shape as find_experience) for the first company."""
+    if not positions:
+        return {"Company": "No roles found!", "Roles": []}
+    company = positions[0]["company"]
+    roles = []
+    last_title = None
+    for p in positions:
+        if p["company"] != company:
+            break
+        if p["title"] == last_title:
+            continue
+        roles.append({"Title": p["title"], "Dates": p["dates"], "Location": p["location"]})
+        last_title = p["title"]
+    return {"Company": company, "Roles": roles[:max_roles]}
+
+
+# --------------------------------------------------
+# Network capture files (JSONL)
+# --------------------------------------------------
+# One header line {"type": "profile", "url", "vanity", "captured_at"}
+# followed by one {"request": path, "payload": body} line per API response.
+
+CAPTURE_SUFFIX = ".jsonl"
+
+
+def _dumps(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def write_capture(path, url, vanity, records, captured_at=None):
+    """Write captured (request_path, payload) records to a JSONL file."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(_dumps({"type": "profile", "url": url, "vanity": vanity, "captured_at": captured_at}) + "\n")
+        for request_path, payload in records:
+            f.write(_dumps({"request": request_path, "payload": payload}) + "\n")
+    return path
+
+
+def read_capture(text):
+    """Header dict and (request_path, payload) records of a capture file."""
+    header = {}
+    records = []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            item = _loads(line)
+        except ValueError:
+            continue
+        if item.get("type") == "profile":
+            header = item
+        elif "payload" in item:
+            records.append((item.get("request", ""), item["payload"]))
+    return header, records
+
+
+def load_capture(text):
+    """Profile fields from a capture file, same shape as extract_profile_data."""
+    header, records = read_capture(text)
+    return map_payloads(records, header.get("vanity"))
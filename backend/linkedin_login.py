@@ -3,6 +3,8 @@ import time
 from pathlib import Path
 from playwright.sync_api import sync_playwright
 
+from backend.linkedin_urls import feed_url, login_url
+
 class LinkedInLogin:
     def __init__(self, headless: bool = True, status_callback=None):
         self.headless = headless
@@ -26,7 +28,7 @@ class LinkedInLogin:
             self.status_callback(f"🔄 Loading existing LinkedIn session for {username}")
             self.context = self.browser.new_context(storage_state=str(state_file))
             self.page = self.context.new_page()
-            self.page.goto("https://www.linkedin.com/feed/")
+            self.page.goto(feed_url())
             time.sleep(3)
             if "feed" in self.page.url or "/in/" in self.page.url:
                 self.logged_in = True
@@ -34,12 +36,17 @@ class LinkedInLogin:
                 self.status_callback("✅ Reused saved login session")
                 return
             else:
-                self.status_callback("⚠️ Saved session invalid, logging in fresh...")
+                self.status_callback(f"⚠️ Saved session for {username} is no longer valid")
 
         # If no valid session, create fresh context and page
         self.context = self.browser.new_context()
         self.page = self.context.new_page()
 
+    # Reuse a saved session only; never submits the login form
+    def resume_session(self, username: str):
+        self._init_context(username)
+        return self.logged_in
+
     # Perform login
     def login(self, username: str, password: str):
         self._init_context(username)
@@ -47,7 +54,7 @@ class LinkedInLogin:
             return
 
         self.status_callback(f"🔐 Logging in as {username}")
-        self.page.goto("https://www.linkedin.com/login")
+        self.page.goto(login_url())
         self.page.fill("input#username", username)
         self.page.fill("input#password", password)
         self.page.click("button[type=submit]")
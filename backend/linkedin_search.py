@@ -2,22 +2,42 @@
 import time
 from typing import List, Optional
 
+from backend.linkedin_urls import people_search_url
+from backend.rate_control import LINKEDIN_RATE
+
 class LinkedInSearch:
-    def __init__(self, page, status_callback=None):
+    def __init__(self, page, status_callback=None, max_pages: int = 1, rate=LINKEDIN_RATE):
         self.page = page
         self.status_callback = status_callback or (lambda msg: None)
+        self.max_pages = max(1, max_pages)
+        self.rate = rate
 
     def collect_profile_links(self, job_title: str, country: str, max_results: int = 20, city: Optional[str] = "") -> List[str]:
         if not self.page:
             raise RuntimeError("LinkedIn page context required for search")
 
         search_keywords = f"{job_title} {city} {country}".strip()
-        search_url = f"https://www.linkedin.com/search/results/people/?keywords={search_keywords.replace(' ', '%20')}&origin=GLOBAL_SEARCH_HEADER"
         self.status_callback(f"🔍 Searching LinkedIn: {search_keywords}")
-        self.page.goto(search_url)
-        time.sleep(4)
 
         profile_links = set()
+        for page_num in range(1, self.max_pages + 1):
+            found_before = len(profile_links)
+            self.rate.call(lambda: self._goto(people_search_url(search_keywords, page=page_num)))
+            time.sleep(4)
+            self._collect_from_page(profile_links, max_results)
+
+            # Stop when the results run out or enough links were collected
+            if len(profile_links) >= max_results or len(profile_links) == found_before:
+                break
+
+        self.status_callback(f"✅ Collected {len(profile_links)} profile links")
+        return list(profile_links)[:max_results]
+
+    def _goto(self, url):
+        response = self.page.goto(url)
+        return (response.status if response else 200), self.page.url, response
+
+    def _collect_from_page(self, profile_links, max_results):
         scroll_attempts = 0
         max_scroll_attempts = 5
 
@@ -32,6 +52,3 @@ class LinkedInSearch:
             self.page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
             time.sleep(2)
             scroll_attempts += 1
-
-        self.status_callback(f"✅ Collected {len(profile_links)} profile links")
-        return list(profile_links)[:max_results]
@@ -0,0 +1,39 @@
+# linkedin_urls.py
+import os
+from urllib.parse import quote
+
+# Base URL for every LinkedIn request. Point it at a local mock server
+# (benchmarks/mock_linkedin.py) to run the pipeline without network access.
+LINKEDIN_BASE_URL = os.environ.get("LINKEDIN_BASE_URL", "https://www.linkedin.com").rstrip("/")
+
+
+def set_base_url(url):
+    global LINKEDIN_BASE_URL
+    LINKEDIN_BASE_URL = (url or "https://www.linkedin.com").rstrip("/")
+
+
+def linkedin_url(path=""):
+    return f"{LINKEDIN_BASE_URL}/{path.lstrip('/')}"
+
+
+def login_url():
+    return linkedin_url("/login")
+
+
+def feed_url():
+    return linkedin_url("/feed/")
+
+
+def profile_url(vanity_id):
+    return linkedin_url(f"/in/{vanity_id}/")
+
+
+def contact_overlay_url(vanity_id):
+    return linkedin_url(f"/in/{vanity_id}/overlay/contact-info/")
+
+
+def people_search_url(keywords, page=1):
+    url = linkedin_url(f"/search/results/people/?keywords={quote(keywords)}&origin=GLOBAL_SEARCH_HEADER")
+    if page > 1:
+        url += f"&page={page}"
+    return url
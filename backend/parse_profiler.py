@@ -0,0 +1,162 @@
+# parse_profiler.py
+import cProfile
+import json
+import math
+import re
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+START_TAG_RE = re.compile(rb"<[A-Za-z]")
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of an unsorted list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = math.ceil(pct / 100.0 * len(ordered))
+    return ordered[max(0, min(len(ordered), rank) - 1)]
+
+
+class ParseProfiler:
+    """Opt-in timing of every extractor in the parse pipeline.
+
+    Usage:
+        profiler = ParseProfiler(cprofile=True)
+        with profiler.job():
+            df = parse_all_html(profiler=profiler)
+        profiler.write_report(RESULTS_DIR)
+    """
+
+    def __init__(self, name="parse", cprofile=False):
+        self.name = name
+        self.cprofile = cprofile
+        self.stage_times = defaultdict(list)
+        self.files = []
+        self.total_seconds = 0.0
+        self._current = None
+        self._profile = None
+
+    # ---------------- Recording ----------------
+    @contextmanager
+    def job(self):
+        if self.cprofile:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.total_seconds += time.perf_counter() - start
+            if self._profile:
+                self._profile.disable()
+
+    @contextmanager
+    def file(self, path, html):
+        raw = html.encode("utf-8") if isinstance(html, str) else html
+        record = {
+            "file": Path(path).name,
+            "bytes": len(raw),
+            "nodes": len(START_TAG_RE.findall(raw)),
+            "stages": defaultdict(float),
+        }
+        self._current = record
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["total"] = time.perf_counter() - start
+            self.stage_times["file_total"].append(record["total"])
+            self._current = None
+            self.files.append(record)
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stage_times[name].append(elapsed)
+            if self._current is not None:
+                self._current["stages"][name] += elapsed
+
+    # ---------------- Reporting ----------------
+    def summary(self):
+        stages = {}
+        for name, values in self.stage_times.items():
+            stages[name] = {
+                "count": len(values),
+                "total": sum(values),
+                "p50": percentile(values, 50),
+                "p95": percentile(values, 95),
+                "max": max(values),
+            }
+        return {
+            "name": self.name,
+            "files": len(self.files),
+            "bytes": sum(f["bytes"] for f in self.files),
+            "nodes": sum(f["nodes"] for f in self.files),
+            "total_seconds": self.total_seconds,
+            "stages": stages,
+        }
+
+    def summary_lines(self):
+        summary = self.summary()
+        lines = [
+            f"⏱️ Parsed {summary['files']} files "
+            f"({summary['bytes'] / 1_048_576:.1f} MB, {summary['nodes']} nodes) "
+            f"in {summary['total_seconds']:.2f}s"
+        ]
+        ranked = sorted(summary["stages"].items(), key=lambda kv: kv[1]["total"], reverse=True)
+        for name, st in ranked:
+            lines.append(
+                f"⏱️ {name}: total {st['total'] * 1000:.0f} ms · "
+                f"p50 {st['p50'] * 1000:.1f} · p95 {st['p95'] * 1000:.1f} · max {st['max'] * 1000:.1f} ms"
+            )
+        return lines
+
+    def report(self, status_callback):
+        for line in self.summary_lines():
+            status_callback(line)
+
+    def write_report(self, folder):
+        """Write the JSON report (and the cProfile dump, if enabled) to folder."""
+        folder = Path(folder)
+        folder.mkdir(parents=True, exist_ok=True)
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        report = self.summary()
+        report["per_file"] = [dict(f, stages=dict(f["stages"])) for f in self.files]
+
+        report_path = folder / f"parse_profile_{self.name}_{ts}.json"
+        if self._profile:
+            prof_path = folder / f"parse_profile_{self.name}_{ts}.prof"
+            self._profile.dump_stats(str(prof_path))
+            report["cprofile"] = str(prof_path)
+
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        return report_path
+
+
+class NullProfiler:
+    """Stand-in used when profiling is off; every hook is a no-op."""
+
+    @contextmanager
+    def job(self):
+        yield self
+
+    @contextmanager
+    def file(self, path, html):
+        yield None
+
+    @contextmanager
+    def stage(self, name):
+        yield
+
+
+NULL_PROFILER = NullProfiler()
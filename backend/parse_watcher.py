@@ -0,0 +1,191 @@
+# parse_watcher.py
+import os
+import threading
+import time
+import traceback
+from pathlib import Path
+
+from backend.linkedin_data_extract import (
+    HTML_FOLDER, RESULT_COLUMNS, evaluate_profile_file, is_profile_file,
+    move_parsed_file, resolve_parsed_folder, results_to_dataframe
+)
+from backend.parse_profiler import NULL_PROFILER
+from backend.profile_index import index_profiles
+
+# --------------------------------------------------
+# Incremental parsing of saved profiles as they arrive
+# --------------------------------------------------
+# Files reach the watcher two ways:
+#   * notify(path): called by LinkedInHTML right after a file is written,
+#     so the file is parsed without touching the directory at all;
+#   * polling: the folder is only listed when its mtime changes (a file
+#     was created, moved or deleted), and files already handled are kept
+#     in an mtime index so they are never parsed twice.
+# Files younger than settle_seconds are left for the next poll in case
+# they are still being written by another process.
+
+class ParseWatcher:
+    def __init__(self, folder=HTML_FOLDER, role="", loc="", parsed_folder=None, move_files=True,
+                 on_result=None, on_parsed=None, status_callback=None, poll_interval=1.0, settle_seconds=0.5,
+                 include_existing=True, skip=(), profiler=NULL_PROFILER, identities=None):
+        self.folder = Path(folder)
+        self.role = role
+        self.loc = loc
+        self.parsed_path = resolve_parsed_folder(folder, parsed_folder)
+        self.move_files = move_files
+        self.on_result = on_result or (lambda row: None)
+        self.on_parsed = on_parsed or (lambda path, parsed: None)  # same contract as parse_all_html
+        self.status_callback = status_callback or (lambda msg: None)
+        self.poll_interval = poll_interval
+        self.settle_ns = int(settle_seconds * 1e9)
+        self.profiler = profiler
+        self.identities = identities  # IdentityStore every parsed profile is merged into
+
+        self.index = {name: None for name in skip}  # file name -> (mtime_ns, size) of handled files
+        self.results = []       # accepted ProfileRecords, in arrival order
+        self.counts = {"parsed": 0, "accepted": 0, "rejected": 0, "errors": 0, "scans": 0}
+
+        self._dir_mtime = None
+        self._pending = set()   # seen but not settled yet
+        self._notified = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+        self.folder.mkdir(parents=True, exist_ok=True)
+        if not include_existing:
+            self._mark_existing()
+
+    # ---------------- Lifecycle ----------------
+    def start(self):
+        if self.move_files:
+            self.parsed_path.mkdir(parents=True, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="parse-watcher", daemon=True)
+        self._thread.start()
+        self.status_callback(f"👀 Watching {self.folder} for new profiles")
+        return self
+
+    def stop(self, drain=True):
+        """Stop the watcher thread; with drain, parse whatever has arrived in the meantime."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        if drain:
+            self.poll(settle_ns=0)
+        c = self.counts
+        self.status_callback(
+            f"📄 Watch parse: {c['parsed']} parsed, {c['accepted']} accepted, "
+            f"{c['rejected']} rejected, {c['errors']} errors"
+        )
+        return self.results
+
+    def notify(self, path):
+        """Hook for writers: parse this file on the next tick without listing the folder."""
+        if path and is_profile_file(path):
+            with self._lock:
+                self._notified.append(Path(path))
+            self._wake.set()
+
+    def dataframe(self):
+        return results_to_dataframe(self.results, self.role)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                self.status_callback(f"⚠️ Parse watcher error: {e}")
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+    # ---------------- Polling ----------------
+    def poll(self, settle_ns=None):
+        """Handle notified files, then rescan the folder if it changed. Returns files handled."""
+        with self._lock:
+            notified, self._notified = self._notified, []
+        handled = 0
+        for path in notified:
+            handled += self._process(path)
+        return handled + self._scan(self.settle_ns if settle_ns is None else settle_ns)
+
+    def _scan(self, settle_ns):
+        try:
+            dir_mtime = os.stat(self.folder).st_mtime_ns
+        except FileNotFoundError:
+            return 0
+
+        now = time.time_ns()
+        # Unchanged folder: nothing new unless a file is still settling. Very recent
+        # mtimes are rescanned anyway, since coarse filesystem clocks can hide a change.
+        if dir_mtime == self._dir_mtime and not self._pending and now - dir_mtime > self.settle_ns:
+            return 0
+        self._dir_mtime = dir_mtime
+        self.counts["scans"] += 1
+
+        handled = 0
+        pending = set()
+        with os.scandir(self.folder) as entries:
+            for entry in entries:
+                if not entry.is_file() or not is_profile_file(entry.name) or entry.name in self.index:
+                    continue
+                st = entry.stat()
+                if now - st.st_mtime_ns < settle_ns:
+                    pending.add(entry.name)
+                    continue
+                handled += self._process(Path(entry.path), st)
+        self._pending = pending
+        return handled
+
+    def _mark_existing(self):
+        with os.scandir(self.folder) as entries:
+            for entry in entries:
+                if entry.is_file() and is_profile_file(entry.name):
+                    st = entry.stat()
+                    self.index[entry.name] = (st.st_mtime_ns, st.st_size)
+        self._dir_mtime = os.stat(self.folder).st_mtime_ns
+
+    # ---------------- Parsing ----------------
+    def _process(self, path, st=None):
+        if path.name in self.index:
+            return 0
+        try:
+            st = st or path.stat()
+        except FileNotFoundError:
+            return 0
+        # Recorded up front so a file that fails to parse is not retried on every poll
+        self.index[path.name] = (st.st_mtime_ns, st.st_size)
+        self.counts["parsed"] += 1
+
+        try:
+            parsed = evaluate_profile_file(path, self.role, self.loc, self.profiler, self.identities)
+        except Exception as e:
+            self.counts["errors"] += 1
+            print(f"❌ Error parsing {path.name}: {e}")
+            traceback.print_exc()
+            return 1
+
+        if parsed:
+            index_profiles([parsed], self.role, self.loc)
+        if not parsed or not parsed.accepted:
+            self.counts["rejected"] += 1
+            self.on_parsed(path, None)
+            return 1
+
+        self.counts["accepted"] += 1
+        self.results.append(parsed)
+        if self.move_files:
+            try:
+                move_parsed_file(path, self.parsed_path, self.profiler)
+            except Exception as e:
+                self.status_callback(f"⚠️ Failed to move {path.name}: {e}")
+        self.on_parsed(path, parsed.to_row())
+
+        row = {"#": len(self.results)}
+        if parsed.score is not None:
+            row["Score"] = parsed.score
+        row.update({col: parsed[col] for col in RESULT_COLUMNS})
+        self.on_result(row)
+        return 1
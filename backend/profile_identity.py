@@ -0,0 +1,251 @@
+# profile_identity.py
+import json
+import os
+import re
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import unquote
+
+from backend.profile_record import ProfileRecord, Role
+
+# Empty disables the identity store
+IDENTITY_DB = os.environ.get("LINKLENS_IDENTITY_DB", "data/identity/profiles.db")
+
+# Known profiles parsed (or contacts fetched) within this many days are not fetched again; 0 always fetches
+IDENTITY_MAX_AGE_DAYS = float(os.environ.get("LINKLENS_IDENTITY_MAX_AGE_DAYS", "30"))
+
+# Stands in for a file name in job checkpoints when a known profile was not fetched
+KNOWN_PREFIX = "identity:"
+
+VANITY_PATH_RE = re.compile(r"/in/([^/?#]+)", re.I)
+FILE_TIMESTAMP_RE = re.compile(r"_\d{10}$")
+PROFILE_FILE_SUFFIXES = (".html", ".jsonl")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS identities (
+    vanity       TEXT PRIMARY KEY,
+    fields       TEXT NOT NULL DEFAULT '{}',
+    field_times  TEXT NOT NULL DEFAULT '{}',
+    parsed_at    REAL,
+    email        TEXT,
+    phone        TEXT,
+    contact_at   REAL
+);
+CREATE TABLE IF NOT EXISTS files (
+    name      TEXT PRIMARY KEY,
+    vanity    TEXT NOT NULL,
+    size      INTEGER,
+    mtime_ns  INTEGER
+);
+"""
+
+# Record fields plus the filter inputs evaluate_profile_file needs besides them
+PROFILE_FIELDS = ("name", "title", "company", "location", "skills", "experience", "source_url",
+                  "headline_location")
+
+
+def canonical_vanity(value):
+    """
+    The vanity id a profile URL or saved file name refers to, lowercased, or None.
+
+    "https://au.linkedin.com/in/Jane-Doe/en?trk=x", "/in/jane-doe/" and the
+    saved file "jane-doe_1717000000.html" are all "jane-doe".
+    """
+    if not value:
+        return None
+    text = unquote(str(value)).strip()
+    m = VANITY_PATH_RE.search(text)
+    if m:
+        slug = m.group(1)
+    elif "/" in text or "linkedin." in text.lower():
+        return None  # search, company and other non-profile pages
+    else:
+        slug = text
+        for suffix in PROFILE_FILE_SUFFIXES:
+            slug = slug.removesuffix(suffix)
+        slug = FILE_TIMESTAMP_RE.sub("", slug)
+    return slug.strip().strip("-").lower() or None
+
+
+def unique_profile_links(links):
+    """links without repeats of the same profile (first one kept); non-profile links are kept as they are."""
+    seen = set()
+    unique = []
+    for link in links:
+        key = canonical_vanity(link) or link
+        if key not in seen:
+            seen.add(key)
+            unique.append(link)
+    return unique
+
+
+def profile_fields(record, facts):
+    """JSON-ready fields of a ProfileRecord plus its filter facts (see evaluate_profile_file)."""
+    return {
+        "name": record.name,
+        "title": record.title,
+        "company": record.company,
+        "location": record.location,
+        "skills": list(record.skills),
+        "experience": [record.employer, [[r.title, r.dates, r.location] for r in record.roles]]
+                      if record.roles else None,
+        "source_url": record.source_url,
+        "headline_location": facts.get("headline_location"),
+    }
+
+
+def record_from_fields(fields):
+    """(ProfileRecord, facts) back from profile_fields()."""
+    employer, roles = fields.get("experience") or (None, [])
+    record = ProfileRecord(
+        name=fields.get("name"),
+        title=fields.get("title"),
+        company=fields.get("company"),
+        location=fields.get("location"),
+        skills=tuple(fields.get("skills") or ()),
+        employer=employer,
+        roles=tuple(Role(*role) for role in roles),
+        source_url=fields.get("source_url"),
+    )
+    facts = {"headline_location": fields.get("headline_location")}
+    return record, facts
+
+
+def _is_empty(value):
+    return value is None or value == "" or value == "Not found" or value == []
+
+
+# --------------------------------------------------
+# Identity store
+# --------------------------------------------------
+# One row per person, keyed by canonical vanity id, however their URL was
+# written in the links or saved file names. Every parse and contact lookup
+# is merged in field by field: a newer observation replaces a field unless
+# it came back empty, so a page that failed to load its skills does not
+# wipe the skills seen last week. The fetch, parse and enrich stages look
+# profiles up here first and skip the ones seen within IDENTITY_MAX_AGE_DAYS.
+
+class IdentityStore:
+    def __init__(self, path=IDENTITY_DB, max_age_days=IDENTITY_MAX_AGE_DAYS):
+        self.path = Path(path)
+        self.max_age = max_age_days * 86400
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=30000")
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _fresh(self, timestamp):
+        return bool(timestamp) and self.max_age > 0 and time.time() - timestamp < self.max_age
+
+    # ---------------- Write ----------------
+    def record_parse(self, fields, file=None, observed_at=None):
+        """Merge a parsed profile (profile_fields()) in; returns its vanity id, or None without one."""
+        vanity = canonical_vanity(fields.get("source_url")) or (canonical_vanity(Path(file).name) if file else None)
+        if not vanity:
+            return None
+        observed_at = observed_at or time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT fields, field_times, parsed_at FROM identities WHERE vanity = ?",
+                               (vanity,)).fetchone()
+            merged, times = (json.loads(row[0]), json.loads(row[1])) if row else ({}, {})
+            for key in PROFILE_FIELDS:
+                value = fields.get(key)
+                if key not in merged or (not _is_empty(value) and observed_at >= times.get(key, 0)):
+                    merged[key] = value
+                    times[key] = observed_at
+            conn.execute(
+                "INSERT INTO identities (vanity, fields, field_times, parsed_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (vanity) DO UPDATE SET fields = excluded.fields, field_times = excluded.field_times, "
+                "parsed_at = MAX(COALESCE(parsed_at, 0), excluded.parsed_at)",
+                (vanity, json.dumps(merged, ensure_ascii=False), json.dumps(times), observed_at))
+            if file:
+                st = os.stat(file)
+                conn.execute("INSERT OR REPLACE INTO files (name, vanity, size, mtime_ns) VALUES (?, ?, ?, ?)",
+                             (Path(file).name, vanity, st.st_size, st.st_mtime_ns))
+            conn.execute("COMMIT")
+        return vanity
+
+    def record_contact(self, vanity, email, phone, observed_at=None):
+        """Merge a contact lookup in; an empty email or phone keeps the one found before."""
+        vanity = canonical_vanity(vanity)
+        if not vanity:
+            return
+        observed_at = observed_at or time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO identities (vanity, email, phone, contact_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (vanity) DO UPDATE SET "
+                "email = CASE WHEN excluded.email != '' AND excluded.contact_at >= COALESCE(contact_at, 0) "
+                "        THEN excluded.email ELSE email END, "
+                "phone = CASE WHEN excluded.phone != '' AND excluded.contact_at >= COALESCE(contact_at, 0) "
+                "        THEN excluded.phone ELSE phone END, "
+                "contact_at = MAX(COALESCE(contact_at, 0), excluded.contact_at)",
+                (vanity, email or "", phone or "", observed_at))
+
+    # ---------------- Read ----------------
+    def __len__(self):
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM identities").fetchone()[0]
+
+    def get(self, vanity):
+        """{"vanity", "fields", "parsed_at", "email", "phone", "contact_at"} of a known profile, or None."""
+        vanity = canonical_vanity(vanity)
+        if not vanity:
+            return None
+        with self._connect() as conn:
+            row = conn.execute("SELECT vanity, fields, parsed_at, email, phone, contact_at FROM identities "
+                               "WHERE vanity = ?", (vanity,)).fetchone()
+        if not row:
+            return None
+        return {"vanity": row[0], "fields": json.loads(row[1]), "parsed_at": row[2],
+                "email": row[3], "phone": row[4], "contact_at": row[5]}
+
+    def fresh_profile(self, link):
+        """The identity behind a link when it was parsed recently enough to skip fetching it."""
+        identity = self.get(link)
+        return identity if identity and self._fresh(identity["parsed_at"]) else None
+
+    def fresh_contact(self, vanity):
+        """(email, phone) looked up recently enough to skip the contact overlay, or None."""
+        identity = self.get(vanity)
+        if identity and self._fresh(identity["contact_at"]):
+            return identity["email"] or "", identity["phone"] or ""
+        return None
+
+    def known_file(self, file):
+        """Identity of a saved profile file that was parsed before and has not changed since."""
+        try:
+            st = os.stat(file)
+        except FileNotFoundError:
+            return None
+        with self._connect() as conn:
+            row = conn.execute("SELECT vanity FROM files WHERE name = ? AND size = ? AND mtime_ns = ?",
+                               (Path(file).name, st.st_size, st.st_mtime_ns)).fetchone()
+        return self.get(row[0]) if row else None
+
+
+# --------------------------------------------------
+# Default store
+# --------------------------------------------------
+_default_store = None
+
+
+def default_store():
+    """The store at IDENTITY_DB, or None when it is disabled."""
+    global _default_store
+    if _default_store is None and IDENTITY_DB:
+        _default_store = IdentityStore(IDENTITY_DB)
+    return _default_store
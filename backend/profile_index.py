@@ -0,0 +1,318 @@
+# profile_index.py
+"""
+Persistent full-text index of every profile parsed so far, across jobs.
+
+    python -m backend.profile_index --import-results data/results   # backfill from old exports
+    python -m backend.profile_index "kubernetes location:sydney"    # search from the shell
+"""
+import os
+import re
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from backend.profile_identity import canonical_vanity
+
+# Empty disables indexing
+PROFILE_INDEX_DB = os.environ.get("LINKLENS_PROFILE_INDEX", "data/profile_index/profiles.db")
+
+SEARCH_COLUMNS = ("name", "title", "company", "location", "skills")
+SEARCH_PAGE_SIZE = 50
+SEARCH_PAGE_MAX = 200
+# bm25 scores every match before sorting; broader searches list the newest profiles first
+RANK_MAX_MATCHES = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    id          INTEGER PRIMARY KEY,
+    vanity      TEXT NOT NULL UNIQUE,
+    source_url  TEXT NOT NULL,
+    name        TEXT,
+    title       TEXT,
+    company     TEXT,
+    location    TEXT,
+    skills      TEXT,
+    experience  TEXT,
+    query       TEXT,
+    accepted    INTEGER,
+    indexed_at  REAL NOT NULL
+);
+"""
+
+# External-content FTS table kept in sync with profiles by triggers
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS profiles_fts USING fts5(
+    name, title, company, location, skills,
+    content='profiles', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+CREATE TRIGGER IF NOT EXISTS profiles_ai AFTER INSERT ON profiles BEGIN
+    INSERT INTO profiles_fts (rowid, name, title, company, location, skills)
+    VALUES (new.id, new.name, new.title, new.company, new.location, new.skills);
+END;
+CREATE TRIGGER IF NOT EXISTS profiles_ad AFTER DELETE ON profiles BEGIN
+    INSERT INTO profiles_fts (profiles_fts, rowid, name, title, company, location, skills)
+    VALUES ('delete', old.id, old.name, old.title, old.company, old.location, old.skills);
+END;
+CREATE TRIGGER IF NOT EXISTS profiles_au AFTER UPDATE ON profiles BEGIN
+    INSERT INTO profiles_fts (profiles_fts, rowid, name, title, company, location, skills)
+    VALUES ('delete', old.id, old.name, old.title, old.company, old.location, old.skills);
+    INSERT INTO profiles_fts (rowid, name, title, company, location, skills)
+    VALUES (new.id, new.name, new.title, new.company, new.location, new.skills);
+END;
+"""
+
+UPSERT = """
+INSERT INTO profiles (vanity, source_url, name, title, company, location, skills, experience, query, accepted,
+                      indexed_at)
+VALUES (:vanity, :source_url, :name, :title, :company, :location, :skills, :experience, :query, :accepted,
+        :indexed_at)
+ON CONFLICT (vanity) DO UPDATE SET
+    source_url = excluded.source_url, name = excluded.name, title = excluded.title, company = excluded.company,
+    location = excluded.location, skills = excluded.skills, experience = excluded.experience,
+    query = excluded.query, accepted = excluded.accepted, indexed_at = excluded.indexed_at
+"""
+
+TERM_RE = re.compile(r'(?:(\w+):)?("[^"]*"|\S+)')
+
+
+# --------------------------------------------------
+# Profile index
+# --------------------------------------------------
+# Every parsed profile (accepted or not) is upserted by the canonical
+# vanity id of its Source_URL (the key the identity store uses), so the
+# index answers "who have we already scraped" across all jobs without
+# opening the Excel exports, and "/in/Jane-Doe/en?trk=x" and
+# "/in/jane-doe/" are one row. Search is SQLite FTS5 ranked by bm25; on a
+# SQLite built without FTS5 it falls back to LIKE over the same columns.
+
+class ProfileIndex:
+    def __init__(self, path=PROFILE_INDEX_DB):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            legacy = self._drop_legacy(conn)
+            conn.executescript(SCHEMA)
+            try:
+                conn.executescript(FTS_SCHEMA)
+                self.fts = True
+            except sqlite3.OperationalError as e:
+                print(f"⚠️ SQLite has no FTS5 ({e}); profile search falls back to LIKE")
+                self.fts = False
+            if legacy:
+                conn.executemany(UPSERT, legacy)
+                print(f"🔄 Re-keyed the profile index by vanity id ({len(legacy)} rows)")
+
+    def _drop_legacy(self, conn):
+        """Rows of an index keyed by raw Source_URL (oldest first, as entries), dropping its tables."""
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(profiles)")]
+        if not columns or "vanity" in columns:
+            return []
+        conn.row_factory = sqlite3.Row
+        rows = conn.execute("SELECT * FROM profiles ORDER BY indexed_at").fetchall()
+        conn.row_factory = None
+        conn.execute("DROP TABLE IF EXISTS profiles_fts")
+        conn.execute("DROP TABLE profiles")
+        entries = [dict(row, vanity=canonical_vanity(row["source_url"])) for row in rows]
+        return [{k: v for k, v in entry.items() if k != "id"} for entry in entries if entry["vanity"]]
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA busy_timeout=30000")
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    # ---------------- Write ----------------
+    def add(self, profiles, query=""):
+        """Upsert ProfileRecords or result row dicts; returns how many were indexed."""
+        now = time.time()
+        entries = [entry for entry in (_entry(p, query, now) for p in profiles) if entry]
+        if not entries:
+            return 0
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(UPSERT, entries)
+            conn.execute("COMMIT")
+        return len(entries)
+
+    # ---------------- Read ----------------
+    def __len__(self):
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+
+    def search(self, text, offset=0, limit=SEARCH_PAGE_SIZE):
+        """
+        (total, rows) of profiles matching every term of text, best match first.
+
+        Terms match word prefixes in any column; "location:sydney" limits a
+        term to one column and "\"data architect\"" matches a phrase.
+        """
+        terms = parse_terms(text)
+        limit = max(1, min(limit, SEARCH_PAGE_MAX))
+        offset = max(0, offset)
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            if not terms:
+                total = conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+                rows = conn.execute("SELECT * FROM profiles ORDER BY indexed_at DESC LIMIT ? OFFSET ?",
+                                    (limit, offset)).fetchall()
+            elif self.fts:
+                match = " AND ".join(_fts_term(column, value) for column, value in terms)
+                total = conn.execute("SELECT COUNT(*) FROM profiles_fts WHERE profiles_fts MATCH ?",
+                                     (match,)).fetchone()[0]
+                key, direction = ("bm25(profiles_fts)", "") if total <= RANK_MAX_MATCHES else ("rowid", "DESC")
+                # Page the rowids first so only the returned profiles are read from the table
+                rows = conn.execute(
+                    f"SELECT p.* FROM (SELECT rowid, {key} AS pos FROM profiles_fts "
+                    f"WHERE profiles_fts MATCH ? ORDER BY pos {direction} LIMIT ? OFFSET ?) m "
+                    f"JOIN profiles p ON p.id = m.rowid ORDER BY m.pos {direction}",
+                    (match, limit, offset)).fetchall()
+            else:
+                where, params = _like_clause(terms)
+                total = conn.execute(f"SELECT COUNT(*) FROM profiles WHERE {where}", params).fetchone()[0]
+                rows = conn.execute(f"SELECT * FROM profiles WHERE {where} ORDER BY indexed_at DESC "
+                                    f"LIMIT ? OFFSET ?", (*params, limit, offset)).fetchall()
+        return total, [_result(row) for row in rows]
+
+
+def parse_terms(text):
+    """[(column or None, value)] from a query string; unknown column prefixes are searched as text."""
+    terms = []
+    for column, value in TERM_RE.findall(text or ""):
+        value = value.strip('"').strip()
+        column = column.lower()
+        if column and column not in SEARCH_COLUMNS:
+            value, column = f"{column} {value}", ""
+        if value:
+            terms.append((column or None, value))
+    return terms
+
+
+def _fts_term(column, value):
+    words = re.findall(r"\w+", value)
+    if not words:
+        return '""'
+    # A quoted phrase whose last word may be a prefix
+    phrase = '"' + " ".join(words) + '"*'
+    return f"{column} : {phrase}" if column else phrase
+
+
+def _like_clause(terms):
+    clauses, params = [], []
+    for column, value in terms:
+        columns = (column,) if column else SEARCH_COLUMNS
+        clauses.append("(" + " OR ".join(f"{c} LIKE ?" for c in columns) + ")")
+        params.extend([f"%{value}%"] * len(columns))
+    return " AND ".join(clauses), params
+
+
+def _entry(profile, query, now):
+    if isinstance(profile, dict):
+        row = profile
+        accepted = row.get("Accepted")
+    else:
+        row = profile.to_row()
+        accepted = profile.accepted
+    source_url = row.get("Source_URL")
+    vanity = canonical_vanity(source_url) if isinstance(source_url, str) else None
+    if not vanity:
+        return None
+    return {
+        "vanity": vanity,
+        "source_url": source_url,
+        "name": row.get("Name"),
+        "title": row.get("Title"),
+        "company": row.get("Company"),
+        "location": row.get("Location"),
+        "skills": row.get("Skills"),
+        "experience": row.get("Experience"),
+        "query": query,
+        "accepted": None if accepted is None else int(bool(accepted)),
+        "indexed_at": now,
+    }
+
+
+def _result(row):
+    return {
+        "Name": row["name"],
+        "Title": row["title"],
+        "Company": row["company"],
+        "Location": row["location"],
+        "Skills": row["skills"],
+        "Source_URL": row["source_url"],
+        "Query": row["query"],
+        "Indexed": time.strftime("%Y-%m-%d %H:%M", time.localtime(row["indexed_at"])),
+    }
+
+
+# --------------------------------------------------
+# Default index
+# --------------------------------------------------
+_default_index = None
+
+
+def default_index():
+    """The index at PROFILE_INDEX_DB, or None when indexing is disabled."""
+    global _default_index
+    if _default_index is None and PROFILE_INDEX_DB:
+        _default_index = ProfileIndex(PROFILE_INDEX_DB)
+    return _default_index
+
+
+def index_profiles(profiles, role="", loc=""):
+    """Add parsed profiles to the default index; never fails the parse that produced them."""
+    try:
+        index = default_index()
+        if index is not None:
+            return index.add(profiles, query=" / ".join(p for p in (role, loc) if p))
+    except Exception as e:
+        print(f"⚠️ Profile index update failed: {e}")
+    return 0
+
+
+def import_results(index, folder):
+    """Index the rows of every linkedin_results_*.xlsx export in folder."""
+    import pandas as pd
+
+    total = 0
+    for path in sorted(Path(folder).glob("linkedin_results_*.xlsx")):
+        try:
+            df = pd.read_excel(path).astype(object)
+        except Exception as e:
+            print(f"⚠️ Skipping {path.name}: {e}")
+            continue
+        rows = df.where(df.notna(), None).to_dict("records")
+        count = index.add(rows, query=path.stem.removeprefix("linkedin_results_"))
+        total += count
+        print(f"📥 {path.name}: {count} profiles")
+    return total
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("query", nargs="?", default="")
+    parser.add_argument("--db", default=PROFILE_INDEX_DB or "data/profile_index/profiles.db")
+    parser.add_argument("--import-results", metavar="FOLDER", help="Index the rows of old Excel exports")
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    index = ProfileIndex(args.db)
+    if args.import_results:
+        print(f"✅ Indexed {import_results(index, args.import_results)} profiles ({len(index)} in the index)")
+    if args.query or not args.import_results:
+        start = time.perf_counter()
+        total, rows = index.search(args.query, limit=args.limit)
+        print(f"🔎 {total} profiles in {(time.perf_counter() - start) * 1000:.1f} ms")
+        for row in rows:
+            print(f"  {row['Name']} | {row['Title']} | {row['Company']} | {row['Location']} | {row['Source_URL']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# profile_record.py
+import sys
+from dataclasses import dataclass
+
+# Column order of a result row (see ProfileRecord.to_row)
+ROW_FIELDS = ("Name", "Title", "Company", "Location", "Skills", "Experience", "Source_URL")
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+# --------------------------------------------------
+# Compact parsed profile
+# --------------------------------------------------
+# Skills and roles are kept as tuples and repeated strings (companies,
+# locations, titles, skill names) are interned, so thousands of records
+# share one copy of "Sydney, New South Wales, Australia". The bullet
+# strings of the Skills and Experience columns are only built when a
+# row is exported or rendered.
+
+@dataclass(slots=True, frozen=True)
+class Role:
+    title: str
+    dates: str
+    location: str = None
+
+    def bullet(self):
+        line = f"  ◦ {self.title} ({self.dates})"
+        if self.location:
+            line += f" — {self.location}"
+        return line
+
+
+@dataclass(slots=True)
+class ProfileRecord:
+    name: str
+    title: str
+    company: str
+    location: str
+    skills: tuple
+    # Company heading of the experience bullets; None when no roles were found
+    employer: str
+    roles: tuple
+    source_url: str
+    accepted: bool = None
+    # Relevance to the job title, set by the filters when a role is given
+    score: float = None
+
+    @classmethod
+    def build(cls, name, title, company, location, skills, experience, source_url):
+        """Record from the extractors' output (experience is the find_experience dataset)."""
+        roles = ()
+        employer = None
+        if isinstance(experience, dict) and experience.get("Roles"):
+            employer = _intern(experience.get("Company", "Unknown Company"))
+            roles = tuple(
+                Role(_intern(role.get("Title", "Unknown Title")), role.get("Dates", "Dates not found"),
+                     _intern(role.get("Location")))
+                for role in experience["Roles"]
+            )
+        return cls(
+            name=name,
+            title=_intern(title),
+            company=_intern(company),
+            location=_intern(location),
+            skills=tuple(_intern(s) for s in skills or ()),
+            employer=employer,
+            roles=roles,
+            source_url=source_url,
+        )
+
+    # ---------------- Lazy columns ----------------
+    @property
+    def skills_text(self):
+        return "\n".join(f"• {s}" for s in self.skills) if self.skills else "Not found"
+
+    @property
+    def experience_text(self):
+        if not self.roles:
+            return "• No experience found"
+        return "\n".join([f"• {self.employer}", *(role.bullet() for role in self.roles)])
+
+    def to_row(self):
+        """The result row dict (same keys and values as the dicts parse_html used to return)."""
+        row = {
+            "Name": self.name,
+            "Title": self.title,
+            "Company": self.company,
+            "Location": self.location,
+            "Skills": self.skills_text,
+            "Experience": self.experience_text,
+            "Source_URL": self.source_url,
+        }
+        if self.accepted is not None:
+            row["Accepted"] = self.accepted
+        return row
+
+    def __getitem__(self, key):
+        # Read access by column name, for code written against the row dicts
+        return _COLUMN_GETTERS[key](self)
+
+
+_COLUMN_GETTERS = {
+    "Name": lambda r: r.name,
+    "Title": lambda r: r.title,
+    "Company": lambda r: r.company,
+    "Location": lambda r: r.location,
+    "Skills": lambda r: r.skills_text,
+    "Experience": lambda r: r.experience_text,
+    "Source_URL": lambda r: r.source_url,
+    "Accepted": lambda r: r.accepted,
+    "Score": lambda r: r.score,
+}
@@ -0,0 +1,154 @@
+# rate_control.py
+import os
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from urllib.parse import urlparse
+
+# Responses that mean LinkedIn wants us to slow down
+THROTTLE_STATUSES = {429, 999}
+LOGIN_REDIRECT_RE = re.compile(r"^/(login|authwall|uas/login|checkpoint/(challenge|lg))")
+
+
+class ThrottledError(Exception):
+    """LinkedIn kept throttling (429 / 999 / bounce to login) after backing off."""
+
+    def __init__(self, reason, url=None):
+        super().__init__(f"Throttled by LinkedIn ({reason}){f': {url}' if url else ''}")
+        self.reason = reason
+        self.url = url
+
+
+def throttle_reason(status, url=None):
+    """Why a response counts as throttled, or None if it is healthy."""
+    if status in THROTTLE_STATUSES:
+        return f"HTTP {status}"
+    if url and LOGIN_REDIRECT_RE.match(urlparse(url).path or ""):
+        return "redirect to login"
+    return None
+
+
+# --------------------------------------------------
+# AIMD rate controller
+# --------------------------------------------------
+# Requests are spaced 1/rate seconds apart. Every healthy response adds
+# `increase` requests/second (up to max_rate); every throttled one
+# multiplies the rate by `decrease` (down to min_rate) and pauses all
+# callers, doubling the pause on consecutive throttles. on_change(controller)
+# is called after every adjustment, e.g. to publish stats() to other processes.
+
+class AdaptiveRateController:
+    def __init__(self, name="linkedin", initial_rate=0.5, min_rate=0.05, max_rate=2.0,
+                 increase=0.05, decrease=0.5, pause_seconds=5.0, max_pause_seconds=300.0,
+                 status_callback=None, on_change=None):
+        self.name = name
+        self.rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.pause_seconds = pause_seconds
+        self.max_pause_seconds = max_pause_seconds
+        self.status_callback = status_callback or (lambda msg: None)
+        self.on_change = on_change or (lambda controller: None)
+
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        self._consecutive_throttles = 0
+        self.counts = {"requests": 0, "ok": 0, "throttled": 0, "waited_seconds": 0.0}
+        self.events = deque(maxlen=50)
+
+    # ---------------- Pacing ----------------
+    def acquire(self):
+        """Block until this caller may send its next request."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + 1.0 / self.rate
+            self.counts["requests"] += 1
+            wait = slot - now
+            self.counts["waited_seconds"] += wait
+        if wait > 0:
+            time.sleep(wait)
+
+    def observe(self, status, url=None):
+        """Feed back a response; returns True (after backing off) if it was throttled."""
+        reason = throttle_reason(status, url)
+        with self._lock:
+            if not reason:
+                self._consecutive_throttles = 0
+                self.counts["ok"] += 1
+                self.rate = min(self.max_rate, self.rate + self.increase)
+            else:
+                self._consecutive_throttles += 1
+                self.counts["throttled"] += 1
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                pause = min(self.max_pause_seconds, self.pause_seconds * 2 ** (self._consecutive_throttles - 1))
+                self._next_slot = max(self._next_slot, time.monotonic() + pause)
+                self.events.append({
+                    "time": datetime.now().isoformat(timespec="seconds"),
+                    "reason": reason,
+                    "url": url,
+                    "rate": round(self.rate, 3),
+                    "pause": pause,
+                })
+        # Outside the lock: the callback may read stats()
+        self.on_change(self)
+        if not reason:
+            return False
+        self.status_callback(f"🐢 LinkedIn throttled ({reason}); slowing to {self.rate:.2f} req/s, pausing {pause:.0f}s")
+        return True
+
+    def call(self, fn, attempts=3):
+        """
+        Run fn() -> (status, url, value) at the controlled rate and return value.
+
+        Throttled responses are retried after the back-off; ThrottledError is
+        raised if every attempt was throttled.
+        """
+        reason = url = None
+        for _ in range(attempts):
+            self.acquire()
+            status, url, value = fn()
+            if not self.observe(status, url):
+                return value
+            reason = throttle_reason(status, url)
+        raise ThrottledError(reason, url)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "name": self.name,
+                "rate": round(self.rate, 3),
+                "min_rate": self.min_rate,
+                "max_rate": self.max_rate,
+                "paused_for": round(max(0.0, self._next_slot - time.monotonic()), 1),
+                "consecutive_throttles": self._consecutive_throttles,
+                "counts": dict(self.counts, waited_seconds=round(self.counts["waited_seconds"], 1)),
+                "events": list(self.events),
+            }
+
+
+def _env_float(name, default):
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def linkedin_rate_controller(name="linkedin", status_callback=None, on_change=None):
+    """A controller for one LinkedIn account, configured from LINKLENS_RATE_*."""
+    return AdaptiveRateController(
+        name,
+        initial_rate=_env_float("LINKLENS_RATE_INITIAL", 0.5),
+        min_rate=_env_float("LINKLENS_RATE_MIN", 0.05),
+        max_rate=_env_float("LINKLENS_RATE_MAX", 2.0),
+        status_callback=status_callback,
+        on_change=on_change,
+    )
+
+
+# Shared by search, profile fetch and contact overlay requests of the job's account
+LINKEDIN_RATE = linkedin_rate_controller()
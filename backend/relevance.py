@@ -0,0 +1,76 @@
+# relevance.py
+import os
+import zlib
+from itertools import chain
+
+import numpy as np
+
+try:
+    from scipy import sparse
+except ImportError:  # scipy is optional
+    sparse = None
+
+# Terms are hashed into this many buckets; collisions are negligible for job-title vocabularies
+HASH_DIM = 1 << 18
+
+# Share of the score each field contributes; the scores of a profile sum to at most 1
+FIELD_WEIGHTS = {"Title": 0.6, "Skills": 0.25, "Experience": 0.15}
+
+# Profiles scoring below this are rejected. A title with none of the query's
+# words reaches at most 0.4; one with half of them (0.3) also needs most of
+# the missing words in its skills and experience.
+RELEVANCE_THRESHOLD = float(os.environ.get("LINKLENS_RELEVANCE_THRESHOLD", "0.55"))
+
+
+def term_id(term):
+    return zlib.crc32(term.encode("utf-8")) & (HASH_DIM - 1)
+
+
+# --------------------------------------------------
+# Relevance scoring
+# --------------------------------------------------
+# Each field of a profile is a hashed bag of words (a row of a sparse N x
+# HASH_DIM matrix of 0/1 entries) and the job query is one dense vector
+# with 1 / (number of query terms) at its terms. Callers tokenize, so a
+# profile arrives as {field: set of term_id()s}. One matrix-vector product
+# per field then gives, for every profile at once, the share of the query's
+# terms found in that field; the score is their weighted sum. Query terms
+# are weighted equally rather than by IDF so a profile scores the same
+# whether it is filtered on its own while parsing (score_one, a plain sum
+# over its few terms) or ranked with the rest.
+
+class RelevanceScorer:
+    def __init__(self, query_ids, weights=FIELD_WEIGHTS):
+        self.weights = weights
+        ids = set(query_ids)
+        self.size = len(ids)
+        self.query = np.zeros(HASH_DIM)
+        if ids:
+            self.query[list(ids)] = 1.0 / self.size
+
+    def score(self, profiles):
+        """Scores in [0, 1] of profiles given as {field: term ids} dicts, as a numpy array."""
+        scores = np.zeros(len(profiles))
+        if not self.size or not profiles:
+            return scores
+        for field, weight in self.weights.items():
+            scores += weight * self._match([ids.get(field, ()) for ids in profiles])
+        return scores
+
+    def score_one(self, profile):
+        """score() of a single profile, without building a matrix."""
+        if not self.size:
+            return 0.0
+        query = self.query
+        return sum(weight * sum(query[t] for t in profile.get(field, ())) for field, weight in self.weights.items())
+
+    def _match(self, rows):
+        counts = np.fromiter(map(len, rows), dtype=np.intp, count=len(rows))
+        indices = np.fromiter(chain.from_iterable(rows), dtype=np.intp, count=int(counts.sum()))
+        if sparse is not None:
+            indptr = np.concatenate(([0], np.cumsum(counts)))
+            matrix = sparse.csr_matrix((np.ones(len(indices)), indices, indptr), shape=(len(rows), HASH_DIM))
+            return matrix @ self.query
+        # CSR product without scipy: sum the query weights of each row's terms
+        return np.bincount(np.repeat(np.arange(len(rows)), counts), weights=self.query[indices],
+                           minlength=len(rows))
@@ -0,0 +1,144 @@
+# result_store.py
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+
+RESULT_STORE_DIR = Path("data/result_store")
+
+# How many jobs' results stay on disk; older stores are deleted when a new one is opened
+RESULT_STORE_KEEP = int(os.environ.get("LINKLENS_RESULT_STORE_KEEP", "20"))
+
+PAGE_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rows (
+    idx  INTEGER PRIMARY KEY,
+    data TEXT NOT NULL
+);
+"""
+
+
+# --------------------------------------------------
+# Per-job result store
+# --------------------------------------------------
+# Rows of one job live in their own SQLite file instead of process memory.
+# The UI and exports read them back page by page, so only the rows being
+# served are ever held in memory, and old jobs are evicted from disk.
+
+class ResultStore:
+    def __init__(self, job_id, store_dir=RESULT_STORE_DIR):
+        self.job_id = job_id
+        self.path = Path(store_dir) / f"{job_id}.sqlite"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @classmethod
+    def open(cls, job_id, store_dir=RESULT_STORE_DIR, keep=RESULT_STORE_KEEP):
+        """Store for this job; the oldest other stores beyond `keep` are evicted."""
+        store = cls(job_id, store_dir)
+        evict_stores(store_dir, keep, exclude=(store.path,))
+        return store
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    # ---------------- Write ----------------
+    def append(self, row):
+        with self._connect() as conn:
+            conn.execute("INSERT INTO rows (data) VALUES (?)", (_dumps(row),))
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM rows")
+
+    def replace(self, df):
+        """Make the DataFrame's rows the job's results."""
+        columns = list(df.columns)
+        with self._connect() as conn:
+            conn.execute("BEGIN")
+            conn.execute("DELETE FROM rows")
+            # Written in chunks so the DataFrame is never copied as a whole list of dicts
+            for start in range(0, len(df), PAGE_SIZE):
+                chunk = df.iloc[start:start + PAGE_SIZE]
+                conn.executemany("INSERT INTO rows (data) VALUES (?)",
+                                 ((_dumps(dict(zip(columns, values))),)
+                                  for values in chunk.itertuples(index=False, name=None)))
+            conn.execute("COMMIT")
+
+    # ---------------- Read ----------------
+    def __len__(self):
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM rows").fetchone()[0]
+
+    def __iter__(self):
+        return self.rows()
+
+    def rows(self, offset=0, limit=None):
+        """Yield rows in insertion order, reading PAGE_SIZE rows at a time."""
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = PAGE_SIZE if remaining is None else min(PAGE_SIZE, remaining)
+            with self._connect() as conn:
+                page = conn.execute("SELECT data FROM rows ORDER BY idx LIMIT ? OFFSET ?",
+                                    (size, offset)).fetchall()
+            for (data,) in page:
+                yield json.loads(data)
+            if len(page) < size:
+                return
+            offset += len(page)
+            if remaining is not None:
+                remaining -= len(page)
+
+    def row(self, index):
+        """The row at position `index` (0-based, insertion order), or None."""
+        with self._connect() as conn:
+            found = conn.execute("SELECT data FROM rows ORDER BY idx LIMIT 1 OFFSET ?", (index,)).fetchone()
+        return json.loads(found[0]) if found else None
+
+    def to_dataframe(self):
+        import pandas as pd
+
+        return pd.DataFrame(list(self.rows()))
+
+    def delete(self):
+        _delete_files(self.path)
+
+
+def _dumps(row):
+    # NaN is not valid JSON for the browser; store missing values as null
+    return json.dumps({k: (None if isinstance(v, float) and v != v else v) for k, v in row.items()},
+                      ensure_ascii=False, default=_json_default)
+
+
+def _json_default(value):
+    # numpy scalars from DataFrame rows
+    return value.item() if hasattr(value, "item") else str(value)
+
+
+def evict_stores(store_dir=RESULT_STORE_DIR, keep=RESULT_STORE_KEEP, exclude=()):
+    """Delete all but the `keep` most recently written stores."""
+    exclude = {Path(p) for p in exclude}
+    stores = sorted((p for p in Path(store_dir).glob("*.sqlite") if p not in exclude),
+                    key=_last_written, reverse=True)
+    for path in stores[max(0, keep - len(exclude)):]:
+        _delete_files(path)
+
+
+def _last_written(path):
+    # Recent writes may only have reached the WAL file so far
+    wal = Path(f"{path}-wal")
+    return max(path.stat().st_mtime, wal.stat().st_mtime if wal.exists() else 0)
+
+
+def _delete_files(path):
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{path}{suffix}").unlink(missing_ok=True)
@@ -0,0 +1,87 @@
+# similarity.py
+from difflib import SequenceMatcher
+
+try:
+    from rapidfuzz.distance import Indel
+except ImportError:  # rapidfuzz is optional
+    Indel = None
+
+DEFAULT_THRESHOLD = 0.82
+
+# --------------------------------------------------
+# String similarity with cheap upper-bound prefilters
+# --------------------------------------------------
+# Decisions are always those of difflib.SequenceMatcher(None, a, b).ratio().
+# Each prefilter computes an upper bound of that ratio, so a pair is only
+# rejected early when the full ratio could never reach the threshold:
+#
+#   length bound   2 * min(len) / (len(a) + len(b))   (== real_quick_ratio)
+#   rapidfuzz      Indel similarity, 2 * LCS / (len(a) + len(b))
+#   quick_ratio    character multiset overlap
+#
+# SequenceMatcher only counts matching blocks, which always form a common
+# subsequence, so the Indel (LCS) score is never lower than ratio().
+
+
+def length_ratio_bound(a, b):
+    total = len(a) + len(b)
+    if not total:
+        return 1.0
+    return 2.0 * min(len(a), len(b)) / total
+
+
+def is_similar(a, b, threshold=DEFAULT_THRESHOLD):
+    if not a or not b:
+        return False
+    if a == b:
+        return True
+    if length_ratio_bound(a, b) < threshold:
+        return False
+    if Indel is not None and Indel.normalized_similarity(a, b, score_cutoff=threshold) < threshold:
+        return False
+
+    matcher = SequenceMatcher(None, a, b)
+    if matcher.quick_ratio() < threshold:
+        return False
+    return matcher.ratio() >= threshold
+
+
+def find_similar(value, candidates, threshold=DEFAULT_THRESHOLD):
+    """Return the first candidate similar to value, or None.
+
+    The matcher keeps value as its second sequence, so difflib builds its
+    character index for value once instead of once per candidate.
+    """
+    if not value:
+        return None
+
+    matcher = None
+    for cand in candidates:
+        if not cand:
+            continue
+        if cand == value:
+            return cand
+        if length_ratio_bound(cand, value) < threshold:
+            continue
+        if Indel is not None and Indel.normalized_similarity(cand, value, score_cutoff=threshold) < threshold:
+            continue
+        if matcher is None:
+            matcher = SequenceMatcher(None, "", value)
+        matcher.set_seq1(cand)
+        if matcher.quick_ratio() < threshold:
+            continue
+        if matcher.ratio() >= threshold:
+            return cand
+    return None
+
+
+def dedupe_similar(items, key=None, threshold=DEFAULT_THRESHOLD):
+    """Drop items whose key is similar to an earlier kept item, preserving order."""
+    key = key or (lambda x: x)
+    kept, kept_keys = [], []
+    for item in items:
+        k = key(item)
+        if find_similar(k, kept_keys, threshold) is None:
+            kept.append(item)
+            kept_keys.append(k)
+    return kept
@@ -0,0 +1,190 @@
+# task_queue.py
+import json
+import os
+import socket
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+QUEUE_DB = Path(os.environ.get("LINKLENS_QUEUE_DB", "data/queue/tasks.db"))
+
+TASK_KINDS = ("fetch", "parse", "enrich")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id       TEXT NOT NULL,
+    kind         TEXT NOT NULL,
+    key          TEXT NOT NULL,
+    payload      TEXT NOT NULL,
+    status       TEXT NOT NULL DEFAULT 'queued',
+    attempts     INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    worker       TEXT,
+    lease_until  REAL,
+    result       TEXT,
+    error        TEXT,
+    created_at   REAL NOT NULL,
+    updated_at   REAL NOT NULL,
+    UNIQUE (job_id, kind, key)
+);
+CREATE INDEX IF NOT EXISTS tasks_claim ON tasks (status, kind, id);
+CREATE INDEX IF NOT EXISTS tasks_job ON tasks (job_id, kind, status);
+"""
+
+
+def worker_name():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+# --------------------------------------------------
+# SQLite task queue
+# --------------------------------------------------
+# Tasks are (job_id, kind, key) unique, so enqueueing the same work twice
+# (e.g. when a job is resumed) is a no-op. A claimed task holds a lease;
+# if its worker dies, the task becomes claimable again once the lease
+# runs out (workers renew it with heartbeat() while a task runs, so only
+# a dead worker's lease expires). Failed tasks are retried until max_attempts.
+# The database can live on a volume shared by the app and every worker.
+
+class TaskQueue:
+    def __init__(self, path=QUEUE_DB):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        # Autocommit; multi-statement updates use explicit BEGIN/COMMIT and are
+        # rolled back by close() if they fail halfway
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA busy_timeout=30000")
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    # ---------------- Producer ----------------
+    def enqueue(self, job_id, kind, key, payload, max_attempts=3):
+        """Add a task; returns False if the job already has this (kind, key)."""
+        now = time.time()
+        with self._connect() as conn:
+            cur = conn.execute(
+                "INSERT OR IGNORE INTO tasks (job_id, kind, key, payload, max_attempts, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, kind, str(key), json.dumps(payload), max_attempts, now, now),
+            )
+            return cur.rowcount == 1
+
+    def enqueue_many(self, job_id, kind, items, max_attempts=3):
+        """items: iterable of (key, payload). Returns how many were new."""
+        now = time.time()
+        rows = [(job_id, kind, str(key), json.dumps(payload), max_attempts, now, now) for key, payload in items]
+        with self._connect() as conn:
+            before = conn.total_changes
+            conn.execute("BEGIN")
+            conn.executemany(
+                "INSERT OR IGNORE INTO tasks (job_id, kind, key, payload, max_attempts, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.execute("COMMIT")
+            return conn.total_changes - before
+
+    # ---------------- Consumer ----------------
+    def claim(self, worker=None, kinds=TASK_KINDS, lease_seconds=300):
+        """Take the oldest runnable task of the given kinds, or None."""
+        worker = worker or worker_name()
+        now = time.time()
+        marks = ",".join("?" * len(kinds))
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                f"SELECT * FROM tasks WHERE kind IN ({marks}) AND "
+                f"(status = 'queued' OR (status = 'running' AND lease_until < ?)) "
+                f"ORDER BY id LIMIT 1",
+                (*kinds, now),
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                "UPDATE tasks SET status = 'running', worker = ?, lease_until = ?, attempts = attempts + 1, "
+                "updated_at = ? WHERE id = ?",
+                (worker, now + lease_seconds, now, row["id"]),
+            )
+            conn.execute("COMMIT")
+        task = dict(row)
+        task["payload"] = json.loads(task["payload"])
+        task["attempts"] += 1
+        return task
+
+    def heartbeat(self, task_id, lease_seconds=300, worker=None):
+        """Extend a running task's lease; False if it is no longer running (for worker, when given)."""
+        now = time.time()
+        with self._connect() as conn:
+            cur = conn.execute(
+                "UPDATE tasks SET lease_until = ?, updated_at = ? WHERE id = ? AND status = 'running' "
+                "AND (? IS NULL OR worker = ?)",
+                (now + lease_seconds, now, task_id, worker, worker))
+            return cur.rowcount == 1
+
+    def complete(self, task_id, result=None, worker=None):
+        """Record a running task's result; False if it is no longer running (for worker, when given)."""
+        with self._connect() as conn:
+            cur = conn.execute(
+                "UPDATE tasks SET status = 'done', result = ?, error = NULL, lease_until = NULL, updated_at = ? "
+                "WHERE id = ? AND status = 'running' AND (? IS NULL OR worker = ?)",
+                (json.dumps(result), time.time(), task_id, worker, worker))
+            return cur.rowcount == 1
+
+    def fail(self, task_id, error, retry=True, worker=None):
+        """Record a failure; the task is queued again unless it is out of attempts. False as for complete()."""
+        with self._connect() as conn:
+            cur = conn.execute(
+                "UPDATE tasks SET status = CASE WHEN ? AND attempts < max_attempts THEN 'queued' ELSE 'failed' END, "
+                "error = ?, lease_until = NULL, updated_at = ? "
+                "WHERE id = ? AND status = 'running' AND (? IS NULL OR worker = ?)",
+                (1 if retry else 0, str(error)[:2000], time.time(), task_id, worker, worker),
+            )
+            return cur.rowcount == 1
+
+    def retry_failed(self, job_id):
+        """Give a job's failed tasks a fresh set of attempts (used when the job is resumed)."""
+        with self._connect() as conn:
+            cur = conn.execute("UPDATE tasks SET status = 'queued', attempts = 0, updated_at = ? "
+                               "WHERE job_id = ? AND status = 'failed'", (time.time(), job_id))
+            return cur.rowcount
+
+    # ---------------- Status ----------------
+    def job_counts(self, job_id):
+        """{kind: {status: n}} for one job."""
+        counts = {}
+        with self._connect() as conn:
+            for row in conn.execute("SELECT kind, status, COUNT(*) AS n FROM tasks WHERE job_id = ? "
+                                    "GROUP BY kind, status", (job_id,)):
+                counts.setdefault(row["kind"], {})[row["status"]] = row["n"]
+        return counts
+
+    def is_job_done(self, job_id):
+        with self._connect() as conn:
+            row = conn.execute("SELECT COUNT(*) FROM tasks WHERE job_id = ? AND status IN ('queued', 'running')",
+                               (job_id,)).fetchone()
+        return row[0] == 0
+
+    def results(self, job_id, kind):
+        """(key, result) of every finished task of one kind, in enqueue order."""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT key, result FROM tasks WHERE job_id = ? AND kind = ? AND status = 'done' "
+                                "ORDER BY id", (job_id, kind)).fetchall()
+        return [(row["key"], json.loads(row["result"]) if row["result"] else None) for row in rows]
+
+    def failures(self, job_id):
+        with self._connect() as conn:
+            rows = conn.execute("SELECT kind, key, error FROM tasks WHERE job_id = ? AND status = 'failed' "
+                                "ORDER BY id", (job_id,)).fetchall()
+        return [dict(row) for row in rows]
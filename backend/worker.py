@@ -0,0 +1,214 @@
+# worker.py
+"""
+Task worker: pulls fetch, parse and enrich tasks from the shared queue.
+
+The Flask app enqueues one fetch task per profile link; each finished
+fetch enqueues a parse task, and each accepted profile an enrich task.
+Run as many workers as needed, on any node that shares the queue
+database and the data folder:
+
+    python -m backend.worker --account someone@example.com
+    python -m backend.worker --kinds parse          # CPU-only node, no browser needed
+    python -m backend.worker --once                 # exit once the queue is empty
+
+Fetch and enrich tasks log in with the account's saved session
+(data/linkedin/<account>/state.json), or LINKLENS_WORKER_PASSWORD.
+"""
+import argparse
+import os
+import signal
+import threading
+import time
+from pathlib import Path
+
+from backend.task_queue import QUEUE_DB, TASK_KINDS, TaskQueue, worker_name
+from backend.rate_control import ThrottledError, linkedin_rate_controller
+
+BROWSER_KINDS = {"fetch", "enrich"}
+
+
+class Worker:
+    def __init__(self, task_queue, kinds=TASK_KINDS, account=None, password="", headless=True,
+                 status_callback=None, poll_interval=2.0, lease_seconds=300):
+        self.queue = task_queue
+        self.kinds = tuple(kinds)
+        self.account = account
+        self.password = password
+        self.headless = headless
+        self.status_callback = status_callback or print
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.name = worker_name()
+        self.rate = linkedin_rate_controller(f"worker:{account or self.name}", self.status_callback)
+        self.login = None
+        self.stopping = False
+        self.counts = {"done": 0, "failed": 0}
+
+        if BROWSER_KINDS & set(self.kinds) and not account:
+            raise ValueError("fetch/enrich tasks need --account")
+
+    # ---------------- Loop ----------------
+    def run(self, once=False, max_tasks=None):
+        self.status_callback(f"👷 Worker {self.name} running {', '.join(self.kinds)} tasks")
+        handled = 0
+        try:
+            while not self.stopping:
+                task = self.queue.claim(self.name, self.kinds, self.lease_seconds)
+                if task is None:
+                    if once:
+                        break
+                    time.sleep(self.poll_interval)
+                    continue
+
+                self.run_task(task)
+                handled += 1
+                if max_tasks and handled >= max_tasks:
+                    break
+        finally:
+            self.close()
+        self.status_callback(f"👷 Worker {self.name} stopped: {self.counts['done']} done, {self.counts['failed']} failed")
+        return handled
+
+    def run_task(self, task):
+        handler = getattr(self, f"handle_{task['kind']}")
+        done = threading.Event()
+        threading.Thread(target=self._heartbeat, args=(task, done), daemon=True).start()
+        try:
+            result = handler(task["payload"], task)
+        except ThrottledError as e:
+            # The rate controller has already backed off; let another attempt (or worker) take it
+            outcome, recorded = "failed", self.queue.fail(task["id"], e, worker=self.name)
+        except Exception as e:
+            self.status_callback(f"❌ {task['kind']} {task['key']}: {e}")
+            outcome, recorded = "failed", self.queue.fail(task["id"], e, worker=self.name)
+        else:
+            outcome, recorded = "done", self.queue.complete(task["id"], result, worker=self.name)
+        finally:
+            done.set()
+
+        # The lease ran out and another worker took the task: its outcome is the one that counts
+        if not recorded:
+            self.status_callback(f"⚠️ {task['kind']} {task['key']} was taken over by another worker, result dropped")
+            return
+        self.counts[outcome] += 1
+
+    def _heartbeat(self, task, done):
+        # Renew the lease while the task runs, so only a dead worker's tasks are reclaimed
+        while not done.wait(self.lease_seconds / 3):
+            if not self.queue.heartbeat(task["id"], self.lease_seconds, self.name):
+                self.status_callback(f"⚠️ Lost the lease on {task['kind']} {task['key']}")
+                return
+
+    def stop(self, *_):
+        self.stopping = True
+
+    def close(self):
+        if self.login:
+            self.login.close()
+            self.login = None
+
+    # ---------------- Handlers ----------------
+    def handle_fetch(self, payload, task):
+        from backend.linkedin_html import LinkedInHTML
+
+        html = LinkedInHTML(self._browser().page, status_callback=self.status_callback,
+                            capture_mode=payload.get("capture_mode", "html"), rate=self.rate)
+        path = html.save_profile(payload["link"], Path(payload["folder"]))
+        if not path:
+            raise Exception(f"Failed to save {payload['link']}")
+
+        parse = payload.get("parse")
+        if parse is not None:
+            self.queue.enqueue(task["job_id"], "parse", path.name,
+                               dict(parse, file=path.name, folder=payload["folder"]))
+        return {"link": payload["link"], "file": path.name}
+
+    def handle_parse(self, payload, task):
+        from backend.linkedin_data_extract import evaluate_profile_file, move_parsed_file, resolve_parsed_folder
+        from backend.linkedin_data_extract import evaluate_known_profile
+        from backend.profile_identity import default_store
+        from backend.profile_index import index_profiles
+
+        folder = Path(payload["folder"])
+        parsed_path = resolve_parsed_folder(folder, payload.get("parsed_folder"))
+        file = folder / payload["file"]
+        moved = False
+        if not file.exists() and (parsed_path / payload["file"]).exists():
+            # Moved by an earlier attempt that died before completing the task
+            file, moved = parsed_path / payload["file"], True
+
+        identities = default_store()
+        known = identities.known_file(file) if identities is not None else None
+        if known:
+            # Parsed before and unchanged since
+            parsed = evaluate_known_profile(known, payload.get("role", ""), payload.get("loc", ""),
+                                            page=lambda: file.read_text(encoding="utf-8"))
+        else:
+            parsed = evaluate_profile_file(file, payload.get("role", ""), payload.get("loc", ""),
+                                           identities=identities)
+        if parsed:
+            index_profiles([parsed], payload.get("role", ""), payload.get("loc", ""))
+        if not parsed or not parsed.accepted:
+            return {"row": None}
+
+        if not moved:
+            parsed_path.mkdir(parents=True, exist_ok=True)
+            move_parsed_file(file, parsed_path)
+        vanity = (parsed.source_url or "").rstrip("/").split("/")[-1]
+        if payload.get("enrich") and vanity:
+            self.queue.enqueue(task["job_id"], "enrich", vanity, {"vanity": vanity})
+        return {"row": parsed.to_row()}
+
+    def handle_enrich(self, payload, task):
+        from backend.linkedin_contact_info import get_contact_info_for_profile
+        from backend.profile_identity import default_store
+
+        identities = default_store()
+        known = identities.fresh_contact(payload["vanity"]) if identities is not None else None
+        if known:
+            return {"Email": known[0], "Phone": known[1]}
+        contact = get_contact_info_for_profile(payload["vanity"], self._browser().cookies, rate=self.rate)
+        result = {"Email": ", ".join(contact.get("emails", [])), "Phone": ", ".join(contact.get("phones", []))}
+        if identities is not None:
+            identities.record_contact(payload["vanity"], result["Email"], result["Phone"])
+        return result
+
+    def _browser(self):
+        if self.login is None:
+            from backend.linkedin_login import LinkedInLogin
+
+            login = LinkedInLogin(headless=self.headless, status_callback=self.status_callback)
+            if self.password:
+                login.login(self.account, self.password)
+            else:
+                # Never submit the login form with an empty password
+                login.resume_session(self.account)
+            if not login.logged_in:
+                login.close()
+                raise Exception(f"Login failed for {self.account}")
+            self.login = login
+        return self.login
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--kinds", default=",".join(TASK_KINDS), help="Comma-separated task kinds to run")
+    parser.add_argument("--account", help="LinkedIn account (saved session) for fetch/enrich tasks")
+    parser.add_argument("--db", default=str(QUEUE_DB), help="Queue database (LINKLENS_QUEUE_DB)")
+    parser.add_argument("--headed", action="store_true", help="Show the browser")
+    parser.add_argument("--poll", type=float, default=2.0, help="Seconds between polls when idle")
+    parser.add_argument("--once", action="store_true", help="Exit when there is nothing left to do")
+    args = parser.parse_args()
+
+    kinds = [k.strip() for k in args.kinds.split(",") if k.strip() in TASK_KINDS]
+    worker = Worker(TaskQueue(args.db), kinds, account=args.account,
+                    password=os.environ.get("LINKLENS_WORKER_PASSWORD", ""),
+                    headless=not args.headed, poll_interval=args.poll)
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+    worker.run(once=args.once)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
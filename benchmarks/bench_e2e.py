@@ -0,0 +1,204 @@
+# bench_e2e.py
+"""
+End-to-end throughput benchmark against the local mock LinkedIn server.
+
+Starts benchmarks/mock_linkedin.py in-process, points the backend at it
+through the configurable base URL, and measures:
+
+  fetch    profile page downloads with N concurrent workers (plain HTTP)
+  enrich   contact-overlay enrichment via get_contact_info_for_profile
+  parse    parse_all_html over the fetched pages
+  full     (--full) the real background_linkedin_scraper job: Playwright
+           login, search, profile fetch, parse and enrichment. Needs
+           Chromium (`playwright install chromium`).
+
+Retries, throttle responses and overall profiles/second are reported.
+
+Run from the repository root:
+    python -m benchmarks.bench_e2e --corpus data/temp --concurrency 4 --latency-ms 100 --throttle-rate 0.05
+    python -m benchmarks.bench_e2e --corpus data/synthetic --limit 200 --full
+"""
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+
+from backend import linkedin_urls
+from backend.rate_control import AdaptiveRateController
+from benchmarks.mock_linkedin import start_mock_server
+
+
+def login_session(base_url):
+    session = requests.Session()
+    session.post(f"{base_url}/checkpoint/lg/login-submit",
+                 data={"session_key": "bench@example.org", "session_password": "x"}, timeout=30)
+    return session
+
+
+def with_retries(fn, max_retries, backoff):
+    """Call fn until it returns a truthy value; returns (value, attempts)."""
+    value = None
+    for attempt in range(1, max_retries + 1):
+        value = fn()
+        if value:
+            return value, attempt
+        time.sleep(backoff * attempt)
+    return value, max_retries
+
+
+def run_stage(name, items, fn, concurrency):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(fn, items))
+    seconds = time.perf_counter() - start
+    ok = sum(1 for value, _ in results if value)
+    retries = sum(attempts - 1 for _, attempts in results)
+    return {
+        "stage": name,
+        "items": len(items),
+        "ok": ok,
+        "retries": retries,
+        "seconds": seconds,
+        "per_sec": len(items) / seconds if seconds else 0.0,
+    }
+
+
+def run_http_pipeline(base_url, vanities, out_folder, concurrency, max_retries, backoff, role="", loc="", rate=None):
+    from backend.linkedin_contact_info import get_contact_info_for_profile
+    from backend.linkedin_data_extract import parse_all_html
+
+    session = login_session(base_url)
+    cookies = session.cookies.get_dict()
+
+    def fetch(vanity):
+        def once():
+            r = session.get(linkedin_urls.profile_url(vanity), timeout=30)
+            if r.status_code != 200:
+                return None
+            path = Path(out_folder) / f"{vanity}_{int(time.time())}.html"
+            path.write_bytes(r.content)
+            return path
+        return with_retries(once, max_retries, backoff)
+
+    def enrich(vanity):
+        def once():
+            try:
+                contact = get_contact_info_for_profile(vanity, cookies, rate=rate)
+            except Exception:
+                return None
+            return contact if contact.get("emails") or contact.get("phones") else None
+        return with_retries(once, max_retries, backoff)
+
+    stages = [
+        run_stage("fetch", vanities, fetch, concurrency),
+        run_stage("enrich", vanities, enrich, concurrency),
+    ]
+
+    start = time.perf_counter()
+    df = parse_all_html(move_files=False, role=role, loc=loc, html_folder=out_folder, index=False)
+    seconds = time.perf_counter() - start
+    stages.append({"stage": "parse", "items": len(vanities), "ok": len(df), "retries": 0,
+                   "seconds": seconds, "per_sec": len(vanities) / seconds if seconds else 0.0})
+    return stages
+
+
+def run_full_job(base_url, max_results, role="", loc=""):
+    """Run the real scraper job in a scratch working directory."""
+    scratch = tempfile.mkdtemp(prefix="linklens_e2e_")
+    cwd = os.getcwd()
+    os.chdir(scratch)
+    try:
+        import app
+
+        start = time.perf_counter()
+        app.background_linkedin_scraper({
+            "username": "bench@example.org",
+            "password": "x",
+            "mode": "full",
+            "headless": True,
+            "job_title": role,
+            "country": loc,
+            "city": "",
+            "max_results": max_results,
+        })
+        seconds = time.perf_counter() - start
+
+        messages = []
+        while not app.status_queue.empty():
+            messages.append(app.status_queue.get_nowait())
+        return {"stage": "full", "items": max_results, "seconds": seconds,
+                "per_sec": max_results / seconds if seconds else 0.0,
+                "errors": [m for m in messages if "❌" in m][:10]}
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", default="data/temp")
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--max-retries", type=int, default=3)
+    parser.add_argument("--backoff", type=float, default=0.2, help="Seconds of backoff per retry attempt")
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--jitter-ms", type=float, default=20)
+    parser.add_argument("--throttle-rate", type=float, default=0.02)
+    parser.add_argument("--throttle-status", type=int, default=429)
+    parser.add_argument("--rate-limit", type=float, default=0.0)
+    parser.add_argument("--rate-initial", type=float, default=10.0, help="Starting contact requests/second (adaptive)")
+    parser.add_argument("--rate-max", type=float, default=50.0)
+    parser.add_argument("--role", default="Data Architect", help="Job title filter for the parse stage")
+    parser.add_argument("--loc", default="Sydney", help="Location filter for the parse stage")
+    parser.add_argument("--full", action="store_true", help="Also run the Playwright scraper job end-to-end")
+    parser.add_argument("--output", help="Write the report to a JSON file")
+    args = parser.parse_args()
+
+    server, base_url = start_mock_server(
+        args.corpus, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, throttle_rate=args.throttle_rate,
+        throttle_status=args.throttle_status, rate_limit=args.rate_limit,
+    )
+    linkedin_urls.set_base_url(base_url)
+    os.environ["LINKEDIN_BASE_URL"] = base_url
+
+    vanities = server.RequestHandlerClass.config.vanities[:args.limit]
+    print(f"🧪 Mock LinkedIn at {base_url} serving {len(vanities)} profiles")
+
+    report = {"base_url": base_url, "concurrency": args.concurrency, "stages": []}
+    rate = AdaptiveRateController("bench", initial_rate=args.rate_initial, max_rate=args.rate_max,
+                                  pause_seconds=0.5, max_pause_seconds=5.0)
+    try:
+        with tempfile.TemporaryDirectory() as out_folder:
+            report["stages"] = run_http_pipeline(base_url, vanities, out_folder, args.concurrency,
+                                                 args.max_retries, args.backoff, args.role, args.loc, rate)
+        report["rate"] = rate.stats()
+        if args.full:
+            report["stages"].append(run_full_job(base_url, len(vanities), args.role, args.loc))
+        report["server_stats"] = requests.get(f"{base_url}/__stats", timeout=10).json()
+    finally:
+        server.shutdown()
+
+    print(f"{'stage':<8}{'items':>7}{'ok':>7}{'retries':>9}{'seconds':>10}{'per sec':>10}")
+    for st in report["stages"]:
+        print(f"{st['stage']:<8}{st['items']:>7}{st.get('ok', '-'):>7}{st.get('retries', '-'):>9}"
+              f"{st['seconds']:>10.2f}{st['per_sec']:>10.1f}")
+        for err in st.get("errors", []):
+            print(f"   {err}")
+    throttled = {k: v for k, v in report["server_stats"].items() if k.endswith("_throttled")}
+    print(f"server throttled: {throttled or 'none'}")
+    print(f"contact rate: {report['rate']['rate']} req/s after {report['rate']['counts']['throttled']} throttle events")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,131 @@
+# bench_import.py
+"""
+Cold-start benchmark: how long importing the web app and the task worker takes.
+
+Each module is imported in a fresh interpreter under `python -X importtime`
+(--repeat times, median reported), and the slowest imports are listed.
+
+Import times swing too much between machines (and runs) to gate on a stored
+number, so the checks are on what gets imported: the scraping stack
+(Playwright, BeautifulSoup, requests, pandas, numpy) must not be loaded at
+startup, and the number of modules loaded must not grow by more than
+--module-threshold over the baseline. Times are only compared when asked to.
+
+Run from the repository root:
+    python -m benchmarks.bench_import                     # check against the baseline
+    python -m benchmarks.bench_import --save-baseline     # record a new baseline
+    python -m benchmarks.bench_import --time-threshold 1  # also fail above 2x the baseline time
+
+Exits with status 1 when a heavy module is imported at startup or a check
+above fails.
+"""
+import argparse
+import json
+import platform
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+BASELINE_FILE = Path(__file__).with_name("import_baseline.json")
+DEFAULT_MODULE_THRESHOLD = 0.1
+TARGETS = ("app", "backend.worker")
+
+# Must only be imported once a job runs or an export is requested
+HEAVY_MODULES = ("playwright", "bs4", "requests", "pandas", "numpy", "lxml")
+
+IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def import_profile(module):
+    """({module: (self_us, cumulative_us)}, loaded heavy modules) for one cold import."""
+    code = (f"import sys, json, {module}; "
+            f"print(json.dumps(sorted({{m.split('.')[0] for m in sys.modules}} & set({list(HEAVY_MODULES)!r}))))")
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          capture_output=True, text=True, check=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        m = IMPORTTIME_RE.match(line)
+        if m:
+            times[m.group(4)] = (int(m.group(1)), int(m.group(2)))
+    return times, json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def measure(module, repeat):
+    totals = []
+    self_times = defaultdict(list)
+    heavy = []
+    for _ in range(repeat):
+        times, heavy = import_profile(module)
+        totals.append(times[module][1] / 1e6)
+        for name, (self_us, _) in times.items():
+            self_times[name].append(self_us / 1e6)
+    slowest = sorted(((statistics.median(v), k) for k, v in self_times.items()), reverse=True)[:10]
+    return {
+        "seconds": statistics.median(totals),
+        "min_seconds": min(totals),
+        "modules": len(self_times),
+        "heavy_modules": heavy,
+        "slowest": [{"module": name, "self_ms": round(sec * 1000, 2)} for sec, name in slowest],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", default=str(BASELINE_FILE))
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--module-threshold", type=float, default=DEFAULT_MODULE_THRESHOLD,
+                        help="Allowed growth in modules loaded, as a fraction of the baseline (default 0.1)")
+    parser.add_argument("--time-threshold", type=float,
+                        help="Allowed slowdown as a fraction of the baseline time (off by default)")
+    parser.add_argument("--output", help="Write the report to a JSON file")
+    args = parser.parse_args()
+
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "metrics": {module: measure(module, args.repeat) for module in TARGETS},
+    }
+
+    baseline_path = Path(args.baseline)
+    baseline = None
+    if baseline_path.exists():
+        with open(baseline_path, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    failures = []
+    print(f"{'module':<18}{'ms':>10}{'baseline':>10}{'modules':>9}  heavy")
+    for module, cur in report["metrics"].items():
+        base = (baseline or {}).get("metrics", {}).get(module)
+        base_ms = f"{base['seconds'] * 1000:.1f}" if base else "-"
+        print(f"{module:<18}{cur['seconds'] * 1000:>10.1f}{base_ms:>10}{cur['modules']:>9}  "
+              f"{', '.join(cur['heavy_modules']) or '-'}")
+        for item in cur["slowest"][:5]:
+            print(f"    {item['module']:<40}{item['self_ms']:>8.1f} ms")
+        if cur["heavy_modules"]:
+            failures.append(f"{module} imports {', '.join(cur['heavy_modules'])} at startup")
+        if base and cur["modules"] > base["modules"] * (1 + args.module_threshold):
+            failures.append(f"{module}: {cur['modules']} modules loaded vs baseline {base['modules']}")
+        if base and args.time_threshold is not None and cur["seconds"] > base["seconds"] * (1 + args.time_threshold):
+            failures.append(f"{module}: {cur['seconds'] * 1000:.1f} ms vs baseline {base['seconds'] * 1000:.1f} ms")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(baseline_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Baseline saved: {baseline_path}")
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,234 @@
+# bench_parse.py
+"""
+Benchmark suite for the parse pipeline over the sample profile corpus.
+
+Measures, using the HTML files in data/temp as fixtures:
+  - parse_html per file
+  - parse_all_html end-to-end (files are copied to a scratch folder, never moved)
+  - _parse_contact_from_html on a contact-info overlay fixture
+  - DataFrame export to .xlsx
+
+and records wall time, throughput and peak traced memory (tracemalloc).
+
+Run from the repository root:
+    python -m benchmarks.bench_parse                   # compare with baseline
+    python -m benchmarks.bench_parse --save-baseline   # record a new baseline
+    python -m benchmarks.bench_parse --threshold 0.3   # allow 30% slowdown
+    python -m benchmarks.bench_parse --corpus data/synthetic --limit 200
+
+Exits with status 1 when any timing regresses above the threshold.
+"""
+import argparse
+import io
+import json
+import platform
+import resource
+import shutil
+import statistics
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+from backend import linkedin_data_extract as extract
+from backend.linkedin_contact_info import _parse_contact_from_html
+
+CORPUS_FOLDER = Path("data/temp")
+BASELINE_FILE = Path(__file__).with_name("baseline.json")
+DEFAULT_THRESHOLD = 0.25
+
+# Role/location the sample corpus was collected for, so every profile runs the full filter path
+BENCH_ROLE = "Data Architect"
+BENCH_LOC = "Sydney"
+
+CONTACT_OVERLAY_FIXTURE = """
+<html><body>
+<section class="pv-contact-info__contact-type">
+  <h3>Ismail's Profile</h3><a href="https://www.linkedin.com/in/sample-profile">linkedin.com/in/sample-profile</a>
+</section>
+<section class="pv-contact-info__contact-type">
+  <h3>Phone</h3><ul><li><span>0412 345 678</span> <span>(Mobile)</span></li><li><span>+61 (2) 9876 5432</span></li></ul>
+</section>
+<section class="pv-contact-info__contact-type">
+  <h3>Email</h3><a href="mailto:sample.person@example.org">sample.person@example.org</a>
+</section>
+<section class="pv-contact-info__contact-type">
+  <h3>Connected</h3><span>Dec 24, 2025</span><p>noreply@linkedin.com</p>
+</section>
+</body></html>
+""" * 20
+
+
+def measure(fn, repeat=1):
+    """Return (result, median seconds over repeat runs, peak traced bytes).
+
+    Timed runs are untraced; one extra run under tracemalloc gives the
+    peak so its overhead never leaks into the timings.
+    """
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result, statistics.median(times), peak
+
+
+def run_suite(corpus, repeat=1, limit=None):
+    files = sorted(Path(corpus).glob("*.html"))[:limit]
+    if not files:
+        raise SystemExit(f"❌ No HTML fixtures found in {corpus}")
+
+    total_bytes = sum(f.stat().st_size for f in files)
+    metrics = {}
+
+    # ---------------- parse_html per file ----------------
+    per_file = []
+    peak_per_file = 0
+    for file in files:
+        html = file.read_text(encoding="utf-8")
+        _, seconds, peak = measure(lambda: extract.parse_html(html, file), repeat)
+        per_file.append(seconds)
+        peak_per_file = max(peak_per_file, peak)
+    metrics["parse_html"] = {
+        "seconds": statistics.median(per_file),
+        "max_seconds": max(per_file),
+        "files_per_sec": len(files) / sum(per_file),
+        "peak_mem_mb": peak_per_file / 1_048_576,
+    }
+
+    # ---------------- parse_all_html end-to-end ----------------
+    with tempfile.TemporaryDirectory() as scratch:
+        for file in files:
+            shutil.copy(file, scratch)
+        df, seconds, peak = measure(
+            lambda: extract.parse_all_html(move_files=False, role=BENCH_ROLE, loc=BENCH_LOC, html_folder=scratch,
+                                           index=False),
+            repeat,
+        )
+    metrics["parse_all_html"] = {
+        "seconds": seconds,
+        "files_per_sec": len(files) / seconds,
+        "mb_per_sec": total_bytes / 1_048_576 / seconds,
+        "peak_mem_mb": peak / 1_048_576,
+        "accepted": int(len(df)),
+    }
+
+    # ---------------- contact overlay parsing ----------------
+    contact_repeat = max(repeat, 20)
+    _, seconds, peak = measure(lambda: _parse_contact_from_html(CONTACT_OVERLAY_FIXTURE), contact_repeat)
+    metrics["parse_contact_from_html"] = {
+        "seconds": seconds,
+        "calls_per_sec": 1 / seconds,
+        "peak_mem_mb": peak / 1_048_576,
+    }
+
+    # ---------------- export ----------------
+    if not df.empty:
+        def export():
+            buf = io.BytesIO()
+            df.to_excel(buf, index=False)
+            return buf.tell()
+
+        size, seconds, peak = measure(export, max(repeat, 3))
+        metrics["export_xlsx"] = {
+            "seconds": seconds,
+            "rows_per_sec": len(df) / seconds,
+            "bytes": size,
+            "peak_mem_mb": peak / 1_048_576,
+        }
+
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "corpus": str(corpus),
+        "files": len(files),
+        "corpus_mb": total_bytes / 1_048_576,
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "metrics": metrics,
+    }
+
+
+def compare(current, baseline, threshold):
+    """Return a list of regression messages (timings above baseline * (1 + threshold))."""
+    regressions = []
+    for name, cur in current["metrics"].items():
+        base = baseline.get("metrics", {}).get(name)
+        if not base:
+            continue
+        limit = base["seconds"] * (1 + threshold)
+        if cur["seconds"] > limit:
+            regressions.append(
+                f"{name}: {cur['seconds'] * 1000:.1f} ms vs baseline {base['seconds'] * 1000:.1f} ms "
+                f"(+{(cur['seconds'] / base['seconds'] - 1) * 100:.0f}%)"
+            )
+    return regressions
+
+
+def print_report(report, baseline=None):
+    print(f"📄 {report['files']} files, {report['corpus_mb']:.1f} MB from {report['corpus']}")
+    print(f"{'benchmark':<26}{'ms':>10}{'baseline':>10}{'throughput':>16}{'peak MB':>10}")
+    for name, m in report["metrics"].items():
+        base = (baseline or {}).get("metrics", {}).get(name)
+        base_ms = f"{base['seconds'] * 1000:.1f}" if base else "-"
+        rate_key = next(k for k in m if k.endswith("_per_sec"))
+        rate = f"{m[rate_key]:.1f} {rate_key.replace('_per_sec', '/s')}"
+        print(f"{name:<26}{m['seconds'] * 1000:>10.1f}{base_ms:>10}{rate:>16}{m['peak_mem_mb']:>10.1f}")
+    print(f"max RSS: {report['max_rss_mb']:.0f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", default=str(CORPUS_FOLDER))
+    parser.add_argument("--limit", type=int, default=None, help="Only use the first N files of the corpus")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--baseline", default=str(BASELINE_FILE))
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown as a fraction of the baseline (default 0.25)")
+    parser.add_argument("--output", help="Also write this run's report to a JSON file")
+    args = parser.parse_args()
+
+    report = run_suite(args.corpus, repeat=args.repeat, limit=args.limit)
+    baseline_path = Path(args.baseline)
+    baseline = None
+    if baseline_path.exists():
+        with open(baseline_path, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    print_report(report, baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        with open(baseline_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Baseline saved: {baseline_path}")
+        return 0
+
+    if baseline is None:
+        print(f"⚠️ No baseline at {baseline_path}; run with --save-baseline first")
+        return 0
+
+    regressions = compare(report, baseline, args.threshold)
+    if regressions:
+        for msg in regressions:
+            print(f"❌ Regression: {msg}")
+        return 1
+    print(f"✅ No regressions above {args.threshold * 100:.0f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
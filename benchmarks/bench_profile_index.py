@@ -0,0 +1,97 @@
+# bench_profile_index.py
+"""
+Search latency of the profile index (backend/profile_index.py) at scale.
+
+Fills a scratch index with --profiles synthetic profiles, then times a
+set of typical dashboard searches (median of --repeat runs each).
+
+Run from the repository root:
+    python -m benchmarks.bench_profile_index                    # 50k profiles
+    python -m benchmarks.bench_profile_index --profiles 200000 --max-ms 50
+
+Exits with status 1 if any query's median exceeds --max-ms.
+"""
+import argparse
+import json
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from backend.profile_index import ProfileIndex
+
+FIRST = ["Sumana", "Ismail", "Nehal", "Milorad", "Priya", "James", "Olivia", "Wei", "Fatima", "Lucas"]
+LAST = ["Lan", "Baloch", "Hussain", "Mrvic", "Sharma", "Smith", "Nguyen", "Chen", "Ali", "Brown"]
+TITLES = ["Data Architect", "Enterprise Data Architect", "Platform Engineer", "DevOps Engineer",
+          "Data Engineer", "Solutions Architect", "Site Reliability Engineer", "Analytics Lead"]
+COMPANIES = ["Qantas", "Macquarie Group", "Atlassian", "Canva", "Telstra", "NSW Department of Customer Service"]
+LOCATIONS = ["Sydney, New South Wales, Australia", "Greater Melbourne Area", "Brisbane, Queensland, Australia",
+             "Perth, Western Australia, Australia", "Greater Sydney Area", "Auckland, New Zealand"]
+SKILLS = ["Kubernetes", "Terraform", "AWS", "Azure", "Snowflake", "dbt", "Python", "SQL Server", "Kafka",
+          "Spark", "Data Warehousing", "Power BI", "Docker", "Airflow", "Data Modeling", "SSIS"]
+
+QUERIES = [
+    "kubernetes location:sydney",
+    "data architect",
+    "\"data architect\" snowflake",
+    "kub",
+    "company:atlassian terraform",
+    "nonexistentterm",
+]
+
+
+def synthetic_rows(count, seed=7):
+    rng = random.Random(seed)
+    for i in range(count):
+        yield {
+            "Name": f"{rng.choice(FIRST)} {rng.choice(LAST)}",
+            "Title": rng.choice(TITLES),
+            "Company": rng.choice(COMPANIES),
+            "Location": rng.choice(LOCATIONS),
+            "Skills": "\n".join(f"• {s}" for s in rng.sample(SKILLS, 5)),
+            "Experience": "• " + rng.choice(COMPANIES),
+            "Source_URL": f"https://www.linkedin.com/in/synthetic-{i}/",
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--max-ms", type=float, default=25.0, help="Allowed median latency per query")
+    parser.add_argument("--output", help="Write the report to a JSON file")
+    args = parser.parse_args()
+
+    report = {"profiles": args.profiles, "queries": {}}
+    with tempfile.TemporaryDirectory() as scratch:
+        index = ProfileIndex(Path(scratch) / "profiles.db")
+        rows = list(synthetic_rows(args.profiles))
+        start = time.perf_counter()
+        for i in range(0, len(rows), 5000):
+            index.add(rows[i:i + 5000], query="bench")
+        report["fts5"] = index.fts
+        report["build_seconds"] = round(time.perf_counter() - start, 2)
+        print(f"🧪 Indexed {len(index)} profiles in {report['build_seconds']} s (fts5={index.fts})")
+
+        for query in QUERIES:
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                total, _ = index.search(query)
+                timings.append((time.perf_counter() - start) * 1000)
+            report["queries"][query] = {"matches": total, "median_ms": round(statistics.median(timings), 2),
+                                        "max_ms": round(max(timings), 2)}
+            print(f"  {query:<32}{total:>8} matches{statistics.median(timings):>9.2f} ms")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    slow = [q for q, m in report["queries"].items() if m["median_ms"] > args.max_ms]
+    for query in slow:
+        print(f"❌ {query}: {report['queries'][query]['median_ms']} ms > {args.max_ms} ms")
+    return 1 if slow else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
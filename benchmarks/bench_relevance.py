@@ -0,0 +1,59 @@
+# bench_relevance.py
+"""
+Batch relevance scoring (backend/relevance.py) at scale.
+
+Scores --profiles synthetic result rows against a few job titles with
+score_profiles, the way results_to_dataframe ranks an export, and reports
+the median of --repeat runs per title.
+
+Run from the repository root:
+    python -m benchmarks.bench_relevance                         # 50k profiles
+    python -m benchmarks.bench_relevance --profiles 200000 --max-ms 4000
+
+Exits with status 1 if any title's median exceeds --max-ms.
+"""
+import argparse
+import json
+import statistics
+import time
+
+from backend.linkedin_data_extract import score_profiles
+from backend.relevance import RELEVANCE_THRESHOLD, sparse
+from benchmarks.bench_profile_index import synthetic_rows
+
+ROLES = ["Data Architect", "Platform Engineer", "Site Reliability Engineer", "Chief Executive Officer"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=1500.0, help="Allowed median time per title")
+    parser.add_argument("--output", help="Write the report to a JSON file")
+    args = parser.parse_args()
+
+    rows = list(synthetic_rows(args.profiles))
+    report = {"profiles": args.profiles, "scipy": sparse is not None, "roles": {}}
+    print(f"🧪 Scoring {len(rows)} profiles (scipy={sparse is not None})")
+    for role in ROLES:
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            scores = score_profiles(rows, role)
+            timings.append((time.perf_counter() - start) * 1000)
+        accepted = int((scores >= RELEVANCE_THRESHOLD).sum())
+        report["roles"][role] = {"accepted": accepted, "median_ms": round(statistics.median(timings), 1),
+                                 "max_ms": round(max(timings), 1)}
+        print(f"  {role:<28}{accepted:>8} above threshold{statistics.median(timings):>10.1f} ms")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    slow = [r for r, m in report["roles"].items() if m["median_ms"] > args.max_ms]
+    for role in slow:
+        print(f"❌ {role}: {report['roles'][role]['median_ms']} ms > {args.max_ms} ms")
+    return 1 if slow else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
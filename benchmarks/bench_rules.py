@@ -0,0 +1,117 @@
+# bench_rules.py
+"""
+Microbenchmark: per-pattern re.search() loops vs. the compiled rule engine.
+
+Run from the repository root:
+    python -m benchmarks.bench_rules [--repeat 5]
+"""
+import argparse
+import re
+import timeit
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from backend import linkedin_data_extract as extract
+
+SAMPLE_FOLDER = Path("data/temp")
+
+
+def load_sample_lines(limit_files=5):
+    """Visible text lines from the sample profiles, the same input the extractors scan."""
+    lines = []
+    for file in sorted(SAMPLE_FOLDER.glob("*.html"))[:limit_files]:
+        soup = BeautifulSoup(file.read_text(encoding="utf-8"), "html.parser")
+        lines.extend(extract.get_visible_text(soup))
+    return lines
+
+
+# ---------------- Legacy implementations ----------------
+def legacy_is_junk(text):
+    for pattern in extract.JUNK_EXPERIENCE_PATTERNS:
+        if re.search(pattern, text, re.IGNORECASE):
+            return True
+    return False
+
+
+def legacy_is_recruiter(title, company):
+    combined = f"{title} {company}"
+    for pattern in extract.recruitment_agencies:
+        if re.search(pattern, combined, re.I):
+            if any(kw in title.lower() for kw in extract.tech_keywords):
+                return False
+            return True
+    return False
+
+
+def legacy_normalize_role_word(word):
+    w = word.lower()
+    for pattern, repl in extract.ROLE_WORD_RULES:
+        w = re.sub(pattern, repl, w)
+    return w
+
+
+def legacy_has_date(text):
+    return re.search(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|\d{4}|Present)', text) is not None
+
+
+# ---------------- Benchmark cases ----------------
+def build_cases(lines):
+    lowered = [ln.lower() for ln in lines]
+    words = [w for ln in lowered for w in extract.WORD_RE.findall(ln)]
+    pairs = list(zip(lines, lines[1:]))
+
+    return {
+        "junk_experience": (
+            lambda: [legacy_is_junk(ln) for ln in lowered],
+            lambda: [extract.JUNK_EXPERIENCE_RULE.search(ln) for ln in lowered],
+        ),
+        "date": (
+            lambda: [legacy_has_date(ln) for ln in lines],
+            lambda: [extract.DATE_RULE.search(ln) for ln in lines],
+        ),
+        "recruiter": (
+            lambda: [legacy_is_recruiter(t, c) for t, c in pairs],
+            lambda: [extract.is_recruiter_profile(t, c) for t, c in pairs],
+        ),
+        "role_word": (
+            lambda: [legacy_normalize_role_word(w) for w in words],
+            lambda: [extract.normalize_role_word(w) for w in words],
+        ),
+    }
+
+
+def _normalize(values):
+    return [v if isinstance(v, str) else bool(v) for v in values]
+
+
+def check_equivalence(cases):
+    for name, (legacy, compiled) in cases.items():
+        if _normalize(legacy()) != _normalize(compiled()):
+            raise AssertionError(f"Rule engine disagrees with legacy patterns for '{name}'")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    lines = load_sample_lines()
+    if not lines:
+        print(f"❌ No sample profiles found in {SAMPLE_FOLDER}")
+        return 1
+
+    cases = build_cases(lines)
+    check_equivalence(cases)
+    print(f"📄 {len(lines)} text lines from {SAMPLE_FOLDER}")
+    print(f"{'rule':<18}{'legacy ms':>12}{'compiled ms':>14}{'speedup':>10}")
+
+    for name, (legacy, compiled) in cases.items():
+        t_legacy = min(timeit.repeat(legacy, number=1, repeat=args.repeat)) * 1000
+        t_compiled = min(timeit.repeat(compiled, number=1, repeat=args.repeat)) * 1000
+        print(f"{name:<18}{t_legacy:>12.2f}{t_compiled:>14.2f}{t_legacy / t_compiled:>9.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
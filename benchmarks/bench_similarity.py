@@ -0,0 +1,77 @@
+# bench_similarity.py
+"""
+Microbenchmark: pairwise SequenceMatcher de-duplication vs. backend.similarity.
+
+Compares every pair of short text lines (role titles, companies, dates,
+locations) from the sample profiles, checks that both give the same
+decisions and reports the time taken.
+
+Run from the repository root:
+    python -m benchmarks.bench_similarity [--max-lines 400]
+"""
+import argparse
+import time
+from difflib import SequenceMatcher
+from itertools import combinations
+
+from backend import similarity
+from benchmarks.bench_rules import load_sample_lines
+
+
+def legacy_is_similar(a, b, threshold=similarity.DEFAULT_THRESHOLD):
+    if not a or not b:
+        return False
+    return SequenceMatcher(None, a, b).ratio() >= threshold
+
+
+def legacy_dedupe(items, threshold=similarity.DEFAULT_THRESHOLD):
+    kept = []
+    for item in items:
+        if not any(legacy_is_similar(k, item, threshold) for k in kept):
+            kept.append(item)
+    return kept
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-lines", type=int, default=400)
+    args = parser.parse_args()
+
+    lines = list(dict.fromkeys(ln for ln in load_sample_lines() if 3 <= len(ln) <= 80))[:args.max_lines]
+    pairs = list(combinations(lines, 2))
+    print(f"📄 {len(lines)} lines, {len(pairs)} pairs (rapidfuzz: {'yes' if similarity.Indel else 'no'})")
+
+    start = time.perf_counter()
+    expected = [legacy_is_similar(a, b) for a, b in pairs]
+    t_legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = [similarity.is_similar(a, b) for a, b in pairs]
+    t_new = time.perf_counter() - start
+
+    mismatches = [pair for pair, e, a in zip(pairs, expected, actual) if e != a]
+    if mismatches:
+        print(f"❌ {len(mismatches)} decisions differ, e.g. {mismatches[0]}")
+        return 1
+
+    start = time.perf_counter()
+    legacy_kept = legacy_dedupe(lines)
+    t_legacy_dedupe = time.perf_counter() - start
+
+    start = time.perf_counter()
+    kept = similarity.dedupe_similar(lines)
+    t_dedupe = time.perf_counter() - start
+
+    if kept != legacy_kept:
+        print("❌ dedupe_similar kept a different set of lines")
+        return 1
+
+    print(f"{'case':<14}{'legacy ms':>12}{'new ms':>10}{'speedup':>10}")
+    print(f"{'pairwise':<14}{t_legacy * 1000:>12.1f}{t_new * 1000:>10.1f}{t_legacy / t_new:>9.1f}x")
+    print(f"{'dedupe':<14}{t_legacy_dedupe * 1000:>12.1f}{t_dedupe * 1000:>10.1f}{t_legacy_dedupe / t_dedupe:>9.1f}x")
+    print(f"✅ {sum(expected)} similar pairs, identical decisions")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
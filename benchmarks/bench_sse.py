@@ -0,0 +1,232 @@
+# bench_sse.py
+"""
+Load test: many concurrent /linkedin_status (SSE) clients while normal routes are used.
+
+Starts the app (or targets --url), opens --clients EventSource-style
+connections, publishes status events into the shared job state and
+measures:
+
+  streams   clients streaming vs. told to retry later (stream cap reached)
+  delivery  share of streaming clients that received each event, and latency
+  routes    latency of GET /login requests made while the streams are open
+
+Run from the repository root:
+    python -m benchmarks.bench_sse --clients 500                       # Flask threaded server
+    python -m benchmarks.bench_sse --clients 500 --server gunicorn     # gunicorn.conf.py (gthread)
+    LINKLENS_SERVER_MODE=gevent python -m benchmarks.bench_sse --clients 500 --server gunicorn
+
+Exits with status 1 if a route request fails, the route p95 latency exceeds
+--max-route-ms, or a streaming client misses an event.
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.parse import urlparse
+
+EVENT_RE = re.compile(rb"data: \[[^\]]*\] bench (\d+) (\d+\.\d+)")
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(kind, port, state_url):
+    env = dict(os.environ, LINKLENS_STATE_URL=state_url, PORT=str(port))
+    if kind == "gunicorn":
+        cmd = [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "--bind", f"127.0.0.1:{port}", "app:app"]
+    else:
+        cmd = [sys.executable, "-c",
+               f"from app import app; app.run(host='127.0.0.1', port={port}, threaded=True)"]
+    proc = subprocess.Popen(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise SystemExit(f"Server exited: {proc.stderr.read().decode(errors='replace')[-2000:]}")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+            return proc
+        except OSError:
+            time.sleep(0.2)
+    proc.kill()
+    raise SystemExit("Server did not start")
+
+
+# ---------------- Clients ----------------
+class StreamClient:
+    def __init__(self):
+        self.status = None
+        self.streaming = False
+        self.received = {}  # event number -> receive time
+        self.error = None
+
+    async def run(self, host, port, stop):
+        try:
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(f"GET /linkedin_status HTTP/1.1\r\nHost: {host}\r\nAccept: text/event-stream\r\n\r\n".encode())
+            await writer.drain()
+            head = await reader.readuntil(b"\r\n\r\n")
+            self.status = int(head.split(b" ", 2)[1])
+            buf = b""
+            while not stop.is_set():
+                try:
+                    chunk = await asyncio.wait_for(reader.read(65536), timeout=0.5)
+                except asyncio.TimeoutError:
+                    continue
+                if not chunk:
+                    break
+                buf += chunk
+                if b"retry: 10000" in buf:
+                    # Stream cap reached; a browser would come back later
+                    break
+                if b"retry: 2000" in buf:
+                    self.streaming = True
+                now = time.time()
+                for m in EVENT_RE.finditer(buf):
+                    self.received.setdefault(int(m.group(1)), now)
+                buf = buf[-512:]
+            writer.close()
+        except Exception as e:
+            self.error = repr(e)
+
+
+async def probe_route(host, port, path):
+    start = time.perf_counter()
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode())
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n")
+    await reader.read()
+    writer.close()
+    return int(head.split(b" ", 2)[1]), (time.perf_counter() - start) * 1000
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))] if values else None
+
+
+async def run_load(host, port, state, clients, events, route, duration):
+    stop = asyncio.Event()
+    streams = [StreamClient() for _ in range(clients)]
+    tasks = []
+    for i, client in enumerate(streams):
+        tasks.append(asyncio.create_task(client.run(host, port, stop)))
+        if i % 50 == 49:
+            await asyncio.sleep(0.05)
+
+    # Let the streams settle before publishing
+    await asyncio.sleep(2.0)
+    connected = sum(1 for c in streams if c.streaming)
+    print(f"📡 {connected}/{clients} clients streaming")
+
+    loop = asyncio.get_running_loop()
+    sent = {}
+    route_results = []
+    started = time.time()
+    next_event = 0
+    while time.time() - started < duration:
+        if next_event < events:
+            sent[next_event] = time.time()
+            timestamp = time.strftime("%H:%M:%S")
+            await loop.run_in_executor(None, state.push_event,
+                                       f"[{timestamp}] bench {next_event} {sent[next_event]:.6f}")
+            next_event += 1
+        try:
+            route_results.append(await asyncio.wait_for(probe_route(host, port, route), timeout=30))
+        except Exception as e:
+            route_results.append((None, str(e)))
+        await asyncio.sleep(0.2)
+
+    await asyncio.sleep(3.0)
+    stop.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return streams, sent, route_results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--events", type=int, default=10, help="Status events published during the run")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of route probing")
+    parser.add_argument("--route", default="/login", help="Normal route probed while the streams are open")
+    parser.add_argument("--server", choices=["flask", "gunicorn"], default="flask")
+    parser.add_argument("--url", help="Use a running server instead (must share --state-url)")
+    parser.add_argument("--state-url", help="LINKLENS_STATE_URL of the server (default: a scratch SQLite file)")
+    parser.add_argument("--max-route-ms", type=float, default=1000.0)
+    parser.add_argument("--output", help="Write the report to a JSON file")
+    args = parser.parse_args()
+
+    scratch = tempfile.TemporaryDirectory()
+    state_url = args.state_url or f"sqlite:///{scratch.name}/state.db"
+    os.environ["LINKLENS_STATE_URL"] = state_url
+    from backend.job_state import open_job_state
+    state = open_job_state(state_url)
+
+    proc = None
+    if args.url:
+        parsed = urlparse(args.url)
+        host, port = parsed.hostname, parsed.port or 80
+    else:
+        host, port = "127.0.0.1", free_port()
+        proc = start_server(args.server, port, state_url)
+        print(f"🧪 {args.server} server on {host}:{port}")
+
+    try:
+        streams, sent, route_results = asyncio.run(
+            run_load(host, port, state, args.clients, args.events, args.route, args.duration)
+        )
+    finally:
+        if proc:
+            proc.terminate()
+            proc.wait(timeout=30)
+        scratch.cleanup()
+
+    streaming = [c for c in streams if c.streaming]
+    latencies = [(c.received[n] - sent[n]) * 1000 for c in streaming for n in sent if n in c.received]
+    missed = sum(1 for c in streaming for n in sent if n not in c.received)
+    route_ms = [ms for status, ms in route_results if status == 200]
+    route_failures = [r for r in route_results if r[0] != 200]
+
+    report = {
+        "clients": args.clients,
+        "streaming": len(streaming),
+        "deferred": sum(1 for c in streams if not c.streaming and c.status == 200 and not c.error),
+        "errors": sum(1 for c in streams if c.error),
+        "events": len(sent),
+        "missed_deliveries": missed,
+        "delivery_ms": {
+            "p50": round(statistics.median(latencies), 1) if latencies else None,
+            "p95": round(percentile(latencies, 95), 1) if latencies else None,
+        },
+        "route": {
+            "path": args.route,
+            "requests": len(route_results),
+            "failures": len(route_failures),
+            "p50_ms": round(statistics.median(route_ms), 1) if route_ms else None,
+            "p95_ms": round(percentile(route_ms, 95), 1) if route_ms else None,
+            "max_ms": round(max(route_ms), 1) if route_ms else None,
+        },
+    }
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    ok = (not route_failures and not missed and report["route"]["p95_ms"] is not None
+          and report["route"]["p95_ms"] <= args.max_route_ms)
+    print("✅ OK" if ok else "❌ FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,275 @@
+# mock_linkedin.py
+"""
+Local mock LinkedIn server for offline end-to-end throughput tests.
+
+Serves just enough of LinkedIn for the scraper pipeline:
+  GET  /login                                   login form (input#username, input#password)
+  POST /checkpoint/lg/login-submit              sets li_at/JSESSIONID, redirects to /feed/
+  GET  /feed/                                   feed page (login required)
+  GET  /search/results/people/?keywords=&page=  paginated people search, 10 results per page
+  GET  /in/<vanity>/                            profile page from the corpus folder
+  GET  /in/<vanity>/overlay/contact-info/       contact overlay with a generated email/phone
+  GET  /__stats                                 request, latency and throttle counters (JSON)
+
+Profile pages come from a corpus folder of saved pages named <vanity>_<unixtime>.html
+(data/temp, or a corpus from benchmarks/synthetic_corpus.py). Latency, jitter and
+throttling (random or over a requests-per-second budget) are configurable.
+
+Run from the repository root:
+    python -m benchmarks.mock_linkedin --corpus data/synthetic --port 8765 --latency-ms 150 --throttle-rate 0.02
+    LINKEDIN_BASE_URL=http://127.0.0.1:8765 python app.py
+"""
+import argparse
+import hashlib
+import html as html_lib
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+RESULTS_PER_PAGE = 10
+FILE_TIMESTAMP_RE = re.compile(r"_\d{10}$")
+
+
+class MockConfig:
+    def __init__(self, corpus, latency_ms=0, jitter_ms=0, throttle_rate=0.0, throttle_status=429,
+                 rate_limit=0.0, seed=0):
+        self.corpus = Path(corpus)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.throttle_rate = throttle_rate
+        self.throttle_status = throttle_status
+        self.rate_limit = rate_limit
+        self.rng = random.Random(seed)
+        self.profiles = index_corpus(self.corpus)
+        self.vanities = sorted(self.profiles)
+        self.lock = threading.Lock()
+        self.stats = Counter()
+        self._window_start = time.monotonic()
+        self._window_count = 0
+
+    def should_throttle(self):
+        with self.lock:
+            if self.throttle_rate and self.rng.random() < self.throttle_rate:
+                return True
+            if self.rate_limit:
+                now = time.monotonic()
+                if now - self._window_start >= 1.0:
+                    self._window_start, self._window_count = now, 0
+                self._window_count += 1
+                return self._window_count > self.rate_limit
+            return False
+
+    def delay(self):
+        if self.latency_ms or self.jitter_ms:
+            with self.lock:
+                jitter = self.rng.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0
+            time.sleep(max(0.0, self.latency_ms + jitter) / 1000.0)
+
+
+def index_corpus(corpus):
+    """vanity id -> saved page path."""
+    profiles = {}
+    for path in sorted(Path(corpus).glob("*.html")):
+        profiles[FILE_TIMESTAMP_RE.sub("", path.stem)] = path
+    return profiles
+
+
+def contact_for(vanity):
+    digest = hashlib.sha1(vanity.encode("utf-8")).hexdigest()
+    phone = "04" + str(int(digest[:10], 16))[:8].rjust(8, "0")
+    return f"{vanity.split('-')[0]}.{digest[:6]}@example.org", phone
+
+
+def _page(title, body):
+    return f"<!DOCTYPE html><html><head><title>{html_lib.escape(title)}</title></head><body>{body}</body></html>"
+
+
+class MockLinkedInHandler(BaseHTTPRequestHandler):
+    config = None  # set by make_server
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    # ---------------- Helpers ----------------
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _logged_in(self):
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        return "li_at" in cookie
+
+    def _send(self, status, body="", content_type="text/html; charset=utf-8", headers=None):
+        data = body.encode("utf-8") if isinstance(body, str) else body
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _redirect(self, location, headers=None):
+        self._send(303, "", headers=dict(headers or {}, Location=location))
+
+    def _route_name(self, path):
+        if path.startswith("/in/") and "/overlay/contact-info" in path:
+            return "contact"
+        if path.startswith("/in/"):
+            return "profile"
+        if path.startswith("/search/results/people"):
+            return "search"
+        return path.strip("/").split("/")[0] or "root"
+
+    # ---------------- Dispatch ----------------
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _dispatch(self, method):
+        cfg = self.config
+        url = urlparse(self.path)
+        route = self._route_name(url.path)
+        start = time.perf_counter()
+
+        if url.path == "/__stats":
+            with cfg.lock:
+                stats = dict(cfg.stats)
+            return self._send(200, json.dumps(stats), "application/json")
+
+        cfg.delay()
+        with cfg.lock:
+            cfg.stats[f"{route}_requests"] += 1
+
+        if route in ("search", "profile", "contact") and cfg.should_throttle():
+            with cfg.lock:
+                cfg.stats[f"{route}_throttled"] += 1
+            return self._send(cfg.throttle_status, "Too Many Requests", "text/plain", {"Retry-After": "1"})
+
+        try:
+            if url.path == "/login" and method == "GET":
+                self._login_form()
+            elif url.path == "/checkpoint/lg/login-submit" and method == "POST":
+                self._login_submit()
+            elif not self._logged_in():
+                # Authwall, like LinkedIn does for anonymous requests
+                self._redirect(f"{self.base_url}/login?session_redirect={url.path}")
+            elif url.path.startswith("/feed"):
+                self._send(200, _page("Feed | LinkedIn", "<main><h1>Feed</h1></main>"))
+            elif route == "search":
+                self._search(parse_qs(url.query))
+            elif route == "contact":
+                self._contact(url.path.split("/")[2])
+            elif route == "profile":
+                self._profile(url.path.split("/")[2])
+            else:
+                self._send(404, "Not found", "text/plain")
+        finally:
+            with cfg.lock:
+                cfg.stats[f"{route}_ms_total"] += int((time.perf_counter() - start) * 1000)
+
+    # ---------------- Routes ----------------
+    def _login_form(self):
+        body = (
+            '<form method="POST" action="/checkpoint/lg/login-submit">'
+            '<input id="username" name="session_key" type="text"/>'
+            '<input id="password" name="session_password" type="password"/>'
+            '<button type="submit">Sign in</button></form>'
+        )
+        self._send(200, _page("LinkedIn Login", body))
+
+    def _login_submit(self):
+        length = int(self.headers.get("Content-Length", 0) or 0)
+        form = parse_qs(self.rfile.read(length).decode("utf-8")) if length else {}
+        user = (form.get("session_key") or ["mock"])[0]
+        token = hashlib.sha1(user.encode("utf-8")).hexdigest()
+        self.send_response(303)
+        self.send_header("Location", f"{self.base_url}/feed/")
+        self.send_header("Set-Cookie", f"li_at={token}; Path=/")
+        self.send_header("Set-Cookie", f'JSESSIONID="ajax:{token[:16]}"; Path=/')
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _search(self, query):
+        cfg = self.config
+        page = max(1, int((query.get("page") or ["1"])[0]))
+        start = (page - 1) * RESULTS_PER_PAGE
+        vanities = cfg.vanities[start:start + RESULTS_PER_PAGE]
+        items = "".join(
+            f'<li class="reusable-search__result-container"><a href="{self.base_url}/in/{v}/?miniProfileUrn=x">{v}</a></li>'
+            for v in vanities
+        )
+        keywords = html_lib.escape((query.get("keywords") or [""])[0])
+        body = f"<main><h2>Results for {keywords}</h2><ul>{items}</ul></main>"
+        self._send(200, _page("Search | LinkedIn", body))
+
+    def _profile(self, vanity):
+        path = self.config.profiles.get(vanity)
+        if not path:
+            return self._send(404, _page("Profile not found", "<h1>Profile not found</h1>"))
+        self._send(200, path.read_bytes())
+
+    def _contact(self, vanity):
+        if vanity not in self.config.profiles:
+            return self._send(404, "Not found", "text/plain")
+        email, phone = contact_for(vanity)
+        body = (
+            f'<section><h3>Profile</h3><a href="{self.base_url}/in/{vanity}/">linkedin.com/in/{vanity}</a></section>'
+            f'<section><h3>Phone</h3><span>{phone}</span> <span>(Mobile)</span></section>'
+            f'<section><h3>Email</h3><a href="mailto:{email}">{email}</a></section>'
+        )
+        self._send(200, _page("Contact info", body))
+
+
+def make_server(config, host="127.0.0.1", port=0):
+    handler = type("ConfiguredMockLinkedInHandler", (MockLinkedInHandler,), {"config": config})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def start_mock_server(corpus, host="127.0.0.1", port=0, **options):
+    """Start the mock server in a background thread; returns (server, base_url)."""
+    server = make_server(MockConfig(corpus, **options), host, port)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", default="data/temp")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered with a throttle status")
+    parser.add_argument("--throttle-status", type=int, default=429)
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="Requests per second before throttling (0 = unlimited)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    config = MockConfig(args.corpus, args.latency_ms, args.jitter_ms, args.throttle_rate,
+                        args.throttle_status, args.rate_limit, args.seed)
+    server = make_server(config, args.host, args.port)
+    print(f"🧪 Mock LinkedIn serving {len(config.profiles)} profiles at http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,319 @@
+# synthetic_corpus.py
+"""
+Synthetic LinkedIn profile corpus generator for scale testing.
+
+Takes the page structure of a saved sample profile (data/temp) - its <head>
+and the sidebar sections - and fills the profile body with randomized names,
+headline locations, experience blocks (single- and multi-role companies) and
+skills sections. Pages are padded with hidden <code> payloads, like the real
+pages, up to a randomized target size.
+
+Every file is generated from its own seed (seed + index), so the first N
+files of a 100k corpus are identical to a 1k corpus with the same seed.
+A manifest.jsonl with the expected Name/Title/Company/Location/Skills of
+every page is written next to the HTML files.
+
+Run from the repository root:
+    python -m benchmarks.synthetic_corpus --count 1000 --seed 42
+    python -m benchmarks.synthetic_corpus --count 10000 --out data/synthetic_10k --min-kb 50 --max-kb 200
+    python -m benchmarks.bench_parse --corpus data/synthetic --limit 1000
+"""
+import argparse
+import html as html_lib
+import json
+import random
+import re
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+SAMPLE_FOLDER = Path("data/temp")
+OUTPUT_FOLDER = Path("data/synthetic")
+BASE_TIMESTAMP = 1766600000
+
+# Sidebar sections kept verbatim from the template page
+FILLER_SECTIONS = {"More profiles for you", "Explore Premium profiles", "People you may know", "You might like"}
+
+FIRST_NAMES = [
+    "Aarav", "Abigail", "Ahmed", "Aisha", "Alejandro", "Amelia", "Ananya", "Chen", "Chloe", "Daniel",
+    "Divya", "Elena", "Ethan", "Fatima", "Grace", "Hannah", "Hiroshi", "Isabella", "Jack", "James",
+    "Kavya", "Liam", "Lucas", "Mei", "Mohammed", "Noah", "Olivia", "Priya", "Rahul", "Sakura",
+    "Sofia", "Sunil", "Thomas", "Wei", "William", "Yusuf", "Zara", "Nikolai", "Ingrid", "Mateo",
+]
+LAST_NAMES = [
+    "Anderson", "Baloch", "Brown", "Chen", "Das", "Fernandez", "Garcia", "Gupta", "Hussain", "Ivanova",
+    "Jones", "Kim", "Kumar", "Lee", "Martin", "Mrvic", "Nguyen", "O'Brien", "Patel", "Rossi",
+    "Sato", "Singh", "Smith", "Taylor", "Thompson", "Wang", "Williams", "Wilson", "Yamamoto", "Zhang",
+]
+TITLES = [
+    "Data Architect", "Enterprise Data Architect", "Lead Data Architect", "Senior Data Engineer",
+    "Data Engineer", "Software Engineer", "Senior Software Developer", "Solution Architect",
+    "Cloud Architect", "Machine Learning Engineer", "Data Scientist", "Analytics Manager",
+    "BI Developer", "Data Analyst", "Platform Engineer", "Engineering Manager", "DevOps Engineer",
+    "Data Modeller", "Head of Data", "Principal Consultant",
+]
+RECRUITER_TITLES = ["Technical Recruiter", "Senior Talent Acquisition Partner", "Recruitment Consultant"]
+COMPANIES = [
+    "Macquarie Group", "Qantas", "Atlassian", "Commonwealth Bank", "Westpac", "Telstra", "Canva",
+    "Accenture", "Deloitte", "Google", "Microsoft", "Amazon Web Services", "IBM", "Infosys",
+    "Tata Consultancy Services", "Barclays", "HSBC", "Shopify", "RBC", "NSW Department of Education",
+    "Sydney Water", "Reserve Bank of Australia", "ASIC", "School Infrastructure", "Alumni Services",
+]
+RECRUITER_COMPANIES = ["Hays Recruitment", "Randstad Staffing", "Talent Acquisition Group"]
+LOCATIONS = [
+    ("Sydney, New South Wales, Australia", "Greater Sydney Area"),
+    ("Melbourne, Victoria, Australia", "Greater Melbourne Area"),
+    ("Brisbane, Queensland, Australia", "Greater Brisbane Area"),
+    ("New York, New York, United States", "New York City Metropolitan Area"),
+    ("San Francisco, California, United States", "San Francisco Bay Area"),
+    ("London, England, United Kingdom", "Greater London"),
+    ("Manchester, England, United Kingdom", "Greater Manchester"),
+    ("Toronto, Ontario, Canada", "Greater Toronto Area"),
+    ("Bengaluru, Karnataka, India", "Greater Bengaluru Area"),
+    ("Mumbai, Maharashtra, India", "Mumbai Metropolitan Region"),
+]
+EMPLOYMENT_TYPES = ["Full-time", "Full-time", "Full-time", "Contract", "Part-time", "Freelance"]
+WORKPLACES = ["", "", " · Hybrid", " · Remote", " · On-site"]
+SKILLS = [
+    "SQL", "Python", "Data Modeling", "Data Architecture", "Databricks", "Azure Databricks", "Snowflake",
+    "Apache Spark", "Kafka", "Airflow", "dbt", "Power BI", "Microsoft Power BI", "Tableau", "AWS",
+    "Microsoft Azure", "Google Cloud Platform", "Kubernetes", "Docker", "Terraform", "Data Governance",
+    "Master Data Management", "ETL", "SSIS", "Microsoft SQL Server", "Oracle Database", "Teradata",
+    "Data Warehouse Architecture", "Cloud Computing", "Machine Learning", "TOGAF", "Java", "Scala",
+    "Go", "TypeScript", "React", "Agile Methodologies", "Stakeholder Management", "Data Vault",
+]
+SCHOOLS = ["University of Sydney", "UNSW", "University of Toronto", "Imperial College London", "IIT Bombay",
+           "University of Melbourne", "Stanford University", "Quaid-e-Azam University, Islamabad"]
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+DESCRIPTION_WORDS = (
+    "designed built migrated led delivered modernised data platform pipelines warehouse lakehouse "
+    "governance reporting analytics cloud teams stakeholders architecture streaming models quality "
+    "integration security enterprise customers products domains standards roadmap"
+).split()
+
+
+# ---------------- Template ----------------
+def load_template(sample_path):
+    """Head and sidebar filler sections of a saved profile page."""
+    raw = Path(sample_path).read_text(encoding="utf-8")
+    head_end = raw.find("</head>")
+    head = raw[:head_end + len("</head>")] if head_end != -1 else "<!DOCTYPE html><html><head></head>"
+    head = re.sub(r"<title>.*?</title>", "<title>{title}</title>", head, count=1, flags=re.S)
+    if "{title}" not in head:
+        head = head.replace("</head>", "<title>{title}</title></head>", 1)
+    # The head may contain literal braces (CSS/JSON); only our placeholder is formatted
+    head = head.replace("{", "{{").replace("}", "}}").replace("{{title}}", "{title}")
+
+    soup = BeautifulSoup(raw[head_end:], "html.parser")
+    filler = []
+    for sec in soup.find_all("section"):
+        h = sec.find("h2")
+        heading = h.get_text(" ", strip=True) if h else ""
+        if any(heading.startswith(name) for name in FILLER_SECTIONS):
+            filler.append(str(sec))
+
+    return {"head": head, "filler": filler, "size": len(raw.encode("utf-8"))}
+
+
+# ---------------- Random profile ----------------
+def _duration(months):
+    yrs, mos = divmod(months, 12)
+    parts = []
+    if yrs:
+        parts.append(f"{yrs} yr{'s' if yrs > 1 else ''}")
+    if mos:
+        parts.append(f"{mos} mo{'s' if mos > 1 else ''}")
+    return " ".join(parts)
+
+
+def _date_range(end_year, end_month, months):
+    """Start label, duration label and (year, month) of a role ending at end_year/end_month."""
+    start_year, start_month = divmod(end_year * 12 + end_month - months, 12)
+    return f"{MONTHS[start_month]} {start_year}", _duration(months), (start_year, start_month)
+
+
+def random_profile(rng):
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    recruiter = rng.random() < 0.05
+    location, area = rng.choice(LOCATIONS)
+
+    # Experience: newest first, with an optional multi-role first company
+    positions = []
+    year, month = 2025, rng.randrange(12)
+    present = True
+    for idx in range(rng.randint(1, 8)):
+        if recruiter and idx == 0:
+            title, company = rng.choice(RECRUITER_TITLES), rng.choice(RECRUITER_COMPANIES)
+        else:
+            title, company = rng.choice(TITLES), rng.choice(COMPANIES)
+        months = rng.randint(3, 60)
+        end = "Present" if present else f"{MONTHS[month]} {year}"
+        start, duration, (year, month) = _date_range(year, month, months)
+        present = False
+        positions.append({
+            "title": title,
+            "company": company,
+            "employment": rng.choice(EMPLOYMENT_TYPES),
+            "dates": f"{start} - {end} · {duration}",
+            "location": rng.choice([location, location, rng.choice(LOCATIONS)[0]]) + rng.choice(WORKPLACES),
+            "description": " ".join(rng.choice(DESCRIPTION_WORDS) for _ in range(rng.randint(0, 40))).capitalize(),
+        })
+
+    multi_role = len(positions) > 2 and rng.random() < 0.3
+    if multi_role:
+        positions[1]["company"] = positions[0]["company"]
+
+    return {
+        "name": f"{first} {last}",
+        "vanity": re.sub(r"[^a-z0-9-]", "", f"{first}-{last}".lower()) + f"-{rng.randrange(16**7):07x}",
+        "headline": f"{positions[0]['title']} at {positions[0]['company']}",
+        "location": rng.choice([location, location, area]),
+        "positions": positions,
+        "multi_role": multi_role,
+        "skills": rng.sample(SKILLS, rng.randint(0, 12)),
+        "school": rng.choice(SCHOOLS),
+        "recruiter": recruiter,
+    }
+
+
+# ---------------- HTML rendering ----------------
+def _pair(text):
+    """Visible + visually-hidden span pair, as LinkedIn renders every entity line."""
+    t = html_lib.escape(text)
+    return f'<span aria-hidden="true"><!-- -->{t}<!-- --></span><span class="visually-hidden"><!-- -->{t}<!-- --></span>'
+
+
+def _entity(lines, logo=None, description=""):
+    logo_html = (f'<a data-field="experience_company_logo" href="#"><img alt="{html_lib.escape(logo)} logo" '
+                 f'height="48" width="48" loading="lazy"/></a>') if logo else ""
+    body = "".join(f"<span>{_pair(ln)}</span>" for ln in lines if ln)
+    desc = f'<ul><li><div dir="ltr">{_pair(description)}</div></li></ul>' if description else ""
+    return f'<li><div data-view-name="profile-component-entity"><div>{logo_html}</div><div>{body}</div>{desc}</div></li>'
+
+
+def _section(heading, items):
+    return (f'<section class="artdeco-card pv-profile-card break-words"><div>'
+            f'<h2 class="pvs-header__title">{_pair(heading)}</h2></div>'
+            f'<ul>{"".join(items)}</ul></section>')
+
+
+def render_experience(profile):
+    positions = profile["positions"]
+    items = []
+    if profile["multi_role"]:
+        first, second = positions[0], positions[1]
+        roles = "".join(_entity([p["title"], p["dates"], p["location"]], description=p["description"])
+                        for p in (first, second))
+        summary = f"{first['employment']} · {_duration(len(positions) * 12)}"
+        header = _entity([first["company"], summary], logo=first["company"])
+        items.append(f'<li><div data-view-name="profile-component-entity">{header}<ul>{roles}</ul></div></li>')
+        rest = positions[2:]
+    else:
+        rest = positions
+    for p in rest:
+        items.append(_entity([p["title"], f"{p['company']} · {p['employment']}", p["dates"], p["location"]],
+                             logo=p["company"], description=p["description"]))
+    return _section("Experience", items)
+
+
+def render_skills(profile, rng):
+    items = []
+    for skill in profile["skills"]:
+        filler = [f"Endorsed by {rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                  f"{rng.randint(1, 99)} endorsements"] if rng.random() < 0.5 else []
+        items.append(_entity([skill] + filler))
+    return _section("Skills", items)
+
+
+def render_profile(profile, template, rng, target_bytes):
+    top_card = (
+        f'<main><section class="artdeco-card pv-top-card"><div class="ph5 pb5">'
+        f'<h1 class="inline t-24 v-align-middle break-words">{html_lib.escape(profile["name"])}</h1>'
+        f'<div class="text-body-medium break-words">{html_lib.escape(profile["headline"])}</div>'
+        f'<div class="mt2"><span class="text-body-small inline t-black--light break-words">'
+        f'{html_lib.escape(profile["location"])}</span></div>'
+        f'<ul><li class="text-body-small">{rng.randint(10, 5000)} followers</li>'
+        f'<li class="text-body-small">500+ connections</li></ul></div></section>'
+    )
+    about = _section("About", [_entity([" ".join(rng.choice(DESCRIPTION_WORDS) for _ in range(rng.randint(10, 80)))])])
+    education = _section("Education", [_entity([profile["school"], "Bachelor of Engineering", "2008 - 2012"], logo=profile["school"])])
+    sections = [top_card, about, render_experience(profile), education]
+    if profile["skills"]:
+        sections.append(render_skills(profile, rng))
+    sections.append(_section("Languages", [_entity(["English", "Native or bilingual proficiency"])]))
+    sections.append("</main><aside>" + "".join(template["filler"]) + "</aside>")
+
+    head = template["head"].format(title=f"(1) {html_lib.escape(profile['name'])} | LinkedIn")
+    page = head + '<body class="render-mode-BIGPIPE">' + "".join(sections)
+
+    # Pad with hidden payloads up to the target size, like LinkedIn's embedded API responses
+    size = len(page.encode("utf-8"))
+    blobs = []
+    guid = rng.randrange(10**6, 10**7)
+    while size < target_bytes:
+        chunk = min(target_bytes - size, rng.randint(2_000, 120_000))
+        payload = json.dumps({"data": {"entityUrn": f"urn:li:collectionResponse:{guid}",
+                                       "padding": "x" * max(0, chunk - 120)}})
+        blob = f'<code style="display: none" id="bpr-guid-{guid}">{html_lib.escape(payload, quote=False)}</code>'
+        blobs.append(blob)
+        size += len(blob)
+        guid += 1
+    return page + "".join(blobs) + "</body></html>"
+
+
+def expected_row(profile):
+    """Ground truth for the fields the parser extracts."""
+    first = profile["positions"][0]
+    return {
+        "Name": profile["name"],
+        "Title": first["title"],
+        "Company": first["company"],
+        "Location": first["location"].split(" · ")[0],
+        "Headline_Location": profile["location"],
+        "Skills": profile["skills"],
+        "Recruiter": profile["recruiter"],
+    }
+
+
+# ---------------- Corpus ----------------
+def generate_corpus(count, out_folder=OUTPUT_FOLDER, seed=42, template_path=None, min_kb=None, max_kb=None):
+    samples = sorted(SAMPLE_FOLDER.glob("*.html"))
+    template_path = Path(template_path) if template_path else (samples[0] if samples else None)
+    if not template_path or not template_path.exists():
+        raise SystemExit(f"❌ No template page found in {SAMPLE_FOLDER}")
+
+    template = load_template(template_path)
+    sample_sizes = [p.stat().st_size for p in samples] or [template["size"]]
+    min_bytes = int(min_kb * 1024) if min_kb else min(sample_sizes)
+    max_bytes = int(max_kb * 1024) if max_kb else max(sample_sizes)
+
+    out_folder = Path(out_folder)
+    out_folder.mkdir(parents=True, exist_ok=True)
+    with open(out_folder / "manifest.jsonl", "w", encoding="utf-8") as manifest:
+        for i in range(count):
+            rng = random.Random(f"{seed}:{i}")
+            profile = random_profile(rng)
+            page = render_profile(profile, template, rng, rng.randint(min_bytes, max(min_bytes, max_bytes)))
+            filename = f"{profile['vanity']}_{BASE_TIMESTAMP + i}.html"
+            (out_folder / filename).write_text(page, encoding="utf-8")
+            manifest.write(json.dumps(dict(expected_row(profile), file=filename), ensure_ascii=False) + "\n")
+    return out_folder
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", default=str(OUTPUT_FOLDER))
+    parser.add_argument("--template", help="Sample page to take the structure from (default: first file in data/temp)")
+    parser.add_argument("--min-kb", type=float, help="Smallest page size (default: smallest sample page)")
+    parser.add_argument("--max-kb", type=float, help="Largest page size (default: largest sample page)")
+    args = parser.parse_args()
+
+    out = generate_corpus(args.count, args.out, args.seed, args.template, args.min_kb, args.max_kb)
+    print(f"✅ Generated {args.count} synthetic profiles in {out} (seed {args.seed})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
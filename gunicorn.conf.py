@@ -0,0 +1,43 @@
+# gunicorn.conf.py
+"""
+Gunicorn settings:  gunicorn -c gunicorn.conf.py app:app
+
+LINKLENS_SERVER_MODE picks the worker type; it defaults to gevent when gevent is
+installed (the Docker image installs it) and to gthread otherwise:
+
+  gevent   cooperative workers for many concurrent dashboards: a stream only
+           costs a greenlet, so each worker holds up to LINKLENS_WORKER_CONNECTIONS
+           (default 2000) minus 100 streams and the default two workers serve
+           several hundred open dashboards. Scraper jobs run in their own process
+           because Playwright's sync API does not run under gevent.
+  gthread  WEB_CONCURRENCY workers x LINKLENS_THREADS threads. Every open
+           /linkedin_status stream holds a thread, so each worker serves at most
+           half its threads as streams (4 with the defaults); further dashboards
+           retry later. Only suited to a handful of dashboards: pip install gevent,
+           or raise LINKLENS_THREADS, to serve more.
+
+Job status is shared between workers through LINKLENS_STATE_URL (see backend/job_state.py).
+"""
+import importlib.util
+import os
+
+default_mode = "gevent" if importlib.util.find_spec("gevent") else "gthread"
+mode = os.environ.setdefault("LINKLENS_SERVER_MODE", default_mode).strip().lower()
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", "2"))
+timeout = 300
+graceful_timeout = 30
+
+if mode == "gevent":
+    worker_class = "gevent"
+    worker_connections = int(os.environ.get("LINKLENS_WORKER_CONNECTIONS", "2000"))
+    # Leave connections for logins, downloads and the other routes
+    stream_limit = worker_connections - 100
+else:
+    worker_class = "gthread"
+    threads = int(os.environ.get("LINKLENS_THREADS", "8"))
+    stream_limit = threads // 2
+
+# Read by app.py when the workers import it
+os.environ.setdefault("LINKLENS_SSE_MAX_CLIENTS", str(max(1, stream_limit)))
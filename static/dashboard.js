@@ -84,10 +84,10 @@ document.addEventListener("DOMContentLoaded", () => {
             const msg = e.data || '';
 
             if (msg.includes('RESULTS_READY')) {
-                fetch("/get_results")
+                fetch(`/results?offset=0&limit=${RESULT_WINDOW}`)
                     .then(r => r.json())
                     .then(j => {
-                        renderResultsTable(j.results || []);
+                        renderResultsTable(j.total || 0, j.rows || []);
                         appendStatus('✅ Results loaded into table.');
                         window.scraperRunning = false;
                         hideSpinner();
@@ -126,8 +126,126 @@ document.addEventListener("DOMContentLoaded", () => {
         });
     }
 
-    // Render results table
-    function renderResultsTable(results) {
+    // Results table: virtualized. Only the rows in view (plus OVERSCAN) are in the DOM;
+    // they are fetched from /results in windows of RESULT_WINDOW rows as the table scrolls
+    const RESULT_COLUMNS = [
+        '#', 'Score', 'Name', 'Title', 'Company',
+        'Location', 'Email', 'Phone', 'Skills', 'Experience', 'Source_URL'
+    ];
+    const RESULT_WINDOW = 100;
+    const MAX_CACHED_WINDOWS = 10;
+    const OVERSCAN = 20;
+    const DEFAULT_ROW_HEIGHT = 34;
+
+    function initVirtualTable(table, firstRows) {
+        const viewport = table.closest('.table-responsive');
+        const tbody = table.tBodies[0];
+        if (!viewport || !tbody) return;
+        let total = parseInt(table.dataset.total || '0', 10);
+        let rowHeight = 0;
+        let frame = null;
+        const windows = new Map();   // window start -> rows
+        const pending = new Set();
+
+        if (firstRows) windows.set(0, firstRows);
+
+        function loadWindow(start) {
+            if (windows.has(start) || pending.has(start)) return;
+            pending.add(start);
+            fetch(`/results?offset=${start}&limit=${RESULT_WINDOW}`)
+                .then(r => r.json())
+                .then(j => {
+                    windows.set(start, j.rows || []);
+                    total = j.total ?? total;
+                    schedule();
+                })
+                .catch(err => console.error('Loading results failed:', err))
+                .finally(() => pending.delete(start));
+        }
+
+        function evictWindows(first) {
+            if (windows.size <= MAX_CACHED_WINDOWS) return;
+            const farthest = [...windows.keys()]
+                .sort((a, b) => Math.abs(b - first) - Math.abs(a - first));
+            farthest.slice(0, windows.size - MAX_CACHED_WINDOWS).forEach(k => windows.delete(k));
+        }
+
+        function spacerRow(height) {
+            const tr = document.createElement('tr');
+            const td = document.createElement('td');
+            td.colSpan = RESULT_COLUMNS.length;
+            td.style.cssText = `height:${height}px; padding:0; border:none;`;
+            tr.appendChild(td);
+            return tr;
+        }
+
+        function buildRow(index, row) {
+            const tr = document.createElement('tr');
+            RESULT_COLUMNS.forEach(col => {
+                const td = document.createElement('td');
+                if (col === '#') {
+                    td.textContent = index + 1;
+                } else if (!row) {
+                    td.textContent = '…';
+                } else if (col === 'Score') {
+                    td.textContent = typeof row.Score === 'number' ? row.Score.toFixed(2) : '';
+                } else if (col === 'Skills' || col === 'Experience') {
+                    td.className = 'expandable-cell';
+                    td.dataset.row = index;
+                    td.dataset.field = col;
+                    td.textContent = row[col] || '';
+                } else if (col === 'Source_URL') {
+                    const a = document.createElement('a');
+                    a.href = row[col] || '#';
+                    a.target = '_blank';
+                    a.textContent = 'View Profile';
+                    td.appendChild(a);
+                } else {
+                    td.textContent = row[col] || '';
+                }
+                tr.appendChild(td);
+            });
+            return tr;
+        }
+
+        function render() {
+            frame = null;
+            const height = rowHeight || DEFAULT_ROW_HEIGHT;
+            const first = Math.max(0, Math.floor(viewport.scrollTop / height) - OVERSCAN);
+            const last = Math.min(total, Math.ceil((viewport.scrollTop + viewport.clientHeight) / height) + OVERSCAN);
+
+            for (let start = first - first % RESULT_WINDOW; start < last; start += RESULT_WINDOW) {
+                loadWindow(start);
+            }
+            evictWindows(first);
+
+            const rows = [spacerRow(first * height)];
+            for (let i = first; i < last; i++) {
+                const page = windows.get(i - i % RESULT_WINDOW);
+                rows.push(buildRow(i, page && page[i % RESULT_WINDOW]));
+            }
+            rows.push(spacerRow(Math.max(0, total - last) * height));
+            tbody.replaceChildren(...rows);
+
+            // Measure a real row once; the spacers are sized from it from then on
+            if (!rowHeight && last > first) {
+                rowHeight = rows[1].getBoundingClientRect().height || DEFAULT_ROW_HEIGHT;
+                if (rowHeight !== height) schedule();
+            }
+        }
+
+        function schedule() {
+            if (frame === null) frame = requestAnimationFrame(render);
+        }
+
+        viewport.addEventListener('scroll', schedule, { passive: true });
+        window.addEventListener('resize', schedule);
+        attachExpandableCellHandlers(tbody);
+        render();
+    }
+
+    // Builds the same skeleton as app.html (used when results arrive after page load)
+    function renderResultsTable(total, firstRows) {
         if (!resultsArea) return;
 
         resultsArea.innerHTML = '';
@@ -139,7 +257,7 @@ document.addEventListener("DOMContentLoaded", () => {
         heading.style.marginBottom = '8px';
         resultsArea.appendChild(heading);
 
-        if (!results || results.length === 0) {
+        if (!total) {
             const noResults = document.createElement('p');
             noResults.className = 'small';
             noResults.id = 'no-results';
@@ -148,10 +266,12 @@ document.addEventListener("DOMContentLoaded", () => {
             return;
         }
 
-        const columnOrder = [
-            '#', 'Name', 'Title', 'Company',
-            'Location', 'Email', 'Phone', 'Skills', 'Experience', 'Source_URL'
-        ];
+        const count = document.createElement('p');
+        count.className = 'small';
+        count.id = 'results-count';
+        count.style.margin = '0 0 6px 0';
+        count.textContent = `${total} profiles`;
+        resultsArea.appendChild(count);
 
         const wrapper = document.createElement('div');
         wrapper.className = 'table-responsive';
@@ -159,11 +279,12 @@ document.addEventListener("DOMContentLoaded", () => {
         const table = document.createElement('table');
         table.className = 'table';
         table.id = 'results-table';
+        table.dataset.total = total;
 
         const thead = document.createElement('thead');
         const trh = document.createElement('tr');
 
-        columnOrder.forEach(col => {
+        RESULT_COLUMNS.forEach(col => {
             const th = document.createElement('th');
             th.textContent = col;
             trh.appendChild(th);
@@ -171,39 +292,7 @@ document.addEventListener("DOMContentLoaded", () => {
 
         thead.appendChild(trh);
         table.appendChild(thead);
-
-        const tbody = document.createElement('tbody');
-
-        results.forEach((row, index) => {
-            const tr = document.createElement('tr');
-
-            columnOrder.forEach(col => {
-                const td = document.createElement('td');
-
-                if (col === '#') {
-                    td.textContent = index + 1;
-                } else if (col === 'Skills' || col === 'Experience') {
-                    const full = row[col] || '';
-                    td.className = 'expandable-cell';
-                    td.dataset.fullContent = full;
-                    td.textContent = full.length > 30 ? full.slice(0, 30) + '...' : full;
-                } else if (col === 'Source_URL') {
-                    const a = document.createElement('a');
-                    a.href = row[col] || '#';
-                    a.target = '_blank';
-                    a.textContent = 'View Profile';
-                    td.appendChild(a);
-                } else {
-                    td.textContent = row[col] || '';
-                }
-
-                tr.appendChild(td);
-            });
-
-            tbody.appendChild(tr);
-        });
-
-        table.appendChild(tbody);
+        table.appendChild(document.createElement('tbody'));
         wrapper.appendChild(table);
         resultsArea.appendChild(wrapper);
 
@@ -219,27 +308,30 @@ document.addEventListener("DOMContentLoaded", () => {
         downloadBtn.style.padding = '5px 10px';
         resultsArea.appendChild(downloadBtn);
 
-        attachExpandableCellHandlers();
+        initVirtualTable(table, firstRows);
     }
 
     window.renderResultsTable = renderResultsTable;
 
-    // Expandable modal handlers
-    function attachExpandableCellHandlers() {
+    // Expandable modal handlers: the table only holds previews, the full text is fetched per row
+    function attachExpandableCellHandlers(tbody) {
         const modal = document.getElementById('popup-modal');
         const modalTitle = document.getElementById('modal-title');
         const modalContent = document.getElementById('modal-content');
         const modalClose = document.getElementById('modal-close');
         if (!modal || !modalTitle || !modalContent || !modalClose) return;
 
-        document.querySelectorAll('.expandable-cell').forEach(cell => {
-            cell.addEventListener('click', function () {
-                modalTitle.textContent =
-                    this.cellIndex === 7 ? 'Skills' : 'Experience';
-                modalContent.textContent =
-                    this.dataset.fullContent || '';
-                modal.style.display = 'flex';
-            });
+        tbody.addEventListener('click', e => {
+            const cell = e.target.closest('.expandable-cell');
+            if (!cell) return;
+            const field = cell.dataset.field;
+            modalTitle.textContent = field;
+            modalContent.textContent = 'Loading…';
+            modal.style.display = 'flex';
+            fetch(`/results/${cell.dataset.row}`)
+                .then(r => r.ok ? r.json() : Promise.reject(new Error(r.statusText)))
+                .then(row => { modalContent.textContent = row[field] || ''; })
+                .catch(() => { modalContent.textContent = 'Could not load details.'; });
         });
 
         modalClose.onclick = () => modal.style.display = 'none';
@@ -248,6 +340,146 @@ document.addEventListener("DOMContentLoaded", () => {
         };
     }
 
+    const initialTable = document.getElementById('results-table');
+    if (initialTable) initVirtualTable(initialTable);
+
+    // Admin users panel: loads a page only when opened, searches after typing pauses
+    function initAdminUsers() {
+        const panel = document.getElementById('admin-users');
+        if (!panel) return;
+        const tbody = panel.querySelector('#admin-users-table tbody');
+        const search = document.getElementById('admin-users-search');
+        const prevBtn = document.getElementById('admin-users-prev');
+        const nextBtn = document.getElementById('admin-users-next');
+        const pageLabel = document.getElementById('admin-users-page');
+        const totalLabel = document.getElementById('admin-users-total');
+        let page = 1;
+        let pages = 0;
+        let loaded = false;
+        let searchTimer = null;
+        let request = 0;
+
+        function cell(text) {
+            const td = document.createElement('td');
+            td.textContent = text ?? '';
+            return td;
+        }
+
+        async function loadPage(n) {
+            const current = ++request;
+            const params = new URLSearchParams({ page: n, q: search ? search.value.trim() : '' });
+            try {
+                const res = await fetch(`/admin/users?${params}`);
+                const data = await res.json();
+                if (current !== request) return;  // a newer search is on its way
+                if (!res.ok) throw new Error(data.error || res.statusText);
+                page = data.page;
+                pages = data.pages;
+                tbody.replaceChildren(...data.users.map(u => {
+                    const tr = document.createElement('tr');
+                    tr.append(cell(u.id), cell(u.name), cell(u.email), cell(u.company),
+                              cell(u.phone), cell(u.is_admin ? 'Yes' : ''));
+                    return tr;
+                }));
+                totalLabel.textContent = `(${data.total})`;
+                pageLabel.textContent = pages ? `Page ${page} / ${pages}` : 'No users found';
+                prevBtn.disabled = page <= 1;
+                nextBtn.disabled = page >= pages;
+            } catch (err) {
+                console.error('Loading users failed:', err);
+                pageLabel.textContent = 'Could not load users';
+            }
+        }
+
+        panel.addEventListener('toggle', () => {
+            if (panel.open && !loaded) {
+                loaded = true;
+                loadPage(1);
+            }
+        });
+        prevBtn?.addEventListener('click', () => loadPage(page - 1));
+        nextBtn?.addEventListener('click', () => loadPage(page + 1));
+        search?.addEventListener('input', () => {
+            clearTimeout(searchTimer);
+            searchTimer = setTimeout(() => loadPage(1), 250);
+        });
+    }
+
+    initAdminUsers();
+
+    // Profile search over every job's parsed profiles; runs after typing pauses
+    function initProfileSearch() {
+        const input = document.getElementById('profile-search-input');
+        if (!input) return;
+        const resultsBox = document.getElementById('profile-search-results');
+        const tbody = document.querySelector('#profile-search-table tbody');
+        const summary = document.getElementById('profile-search-summary');
+        const pageLabel = document.getElementById('profile-search-page');
+        const prevBtn = document.getElementById('profile-search-prev');
+        const nextBtn = document.getElementById('profile-search-next');
+        const PER_PAGE = 50;
+        let page = 1;
+        let pages = 0;
+        let timer = null;
+        let request = 0;
+
+        function cell(text) {
+            const td = document.createElement('td');
+            td.textContent = text ?? '';
+            td.title = text ?? '';
+            return td;
+        }
+
+        async function search(n) {
+            const q = input.value.trim();
+            if (!q) {
+                resultsBox.style.display = 'none';
+                summary.textContent = pageLabel.textContent = '';
+                prevBtn.disabled = nextBtn.disabled = true;
+                return;
+            }
+            const current = ++request;
+            const params = new URLSearchParams({ q, page: n, per_page: PER_PAGE });
+            try {
+                const res = await fetch(`/profiles/search?${params}`);
+                const data = await res.json();
+                if (current !== request) return;  // a newer search is on its way
+                if (!res.ok) throw new Error(data.error || res.statusText);
+                page = data.page;
+                pages = data.pages;
+                tbody.replaceChildren(...data.profiles.map((p, i) => {
+                    const tr = document.createElement('tr');
+                    const link = document.createElement('td');
+                    const a = document.createElement('a');
+                    a.href = p.Source_URL || '#';
+                    a.target = '_blank';
+                    a.textContent = 'View Profile';
+                    link.appendChild(a);
+                    tr.append(cell((page - 1) * PER_PAGE + i + 1), cell(p.Name), cell(p.Title), cell(p.Company),
+                              cell(p.Location), cell(p.Skills), cell(p.Indexed), link);
+                    return tr;
+                }));
+                resultsBox.style.display = data.total ? 'block' : 'none';
+                summary.textContent = `${data.total} profiles (${data.ms} ms)`;
+                pageLabel.textContent = pages > 1 ? `Page ${page} / ${pages}` : '';
+                prevBtn.disabled = page <= 1;
+                nextBtn.disabled = page >= pages;
+            } catch (err) {
+                console.error('Profile search failed:', err);
+                summary.textContent = 'Search failed';
+            }
+        }
+
+        input.addEventListener('input', () => {
+            clearTimeout(timer);
+            timer = setTimeout(() => search(1), 250);
+        });
+        prevBtn.addEventListener('click', () => search(page - 1));
+        nextBtn.addEventListener('click', () => search(page + 1));
+    }
+
+    initProfileSearch();
+
     // File input toggle
     function toggleFileInput() {
         if (!scraperSelect || !fileInputContainer) return;
@@ -321,13 +553,13 @@ async function pollResults() {
     if (resultsLoaded || window.scraperRunning) return;
 
     try {
-        const res = await fetch("/get_results");
+        const res = await fetch("/results?offset=0&limit=100");
         const data = await res.json();
 
-        if (data.results && data.results.length > 0) {
+        if (data.total > 0) {
             resultsLoaded = true;
             if (typeof window.renderResultsTable === 'function') {
-                window.renderResultsTable(data.results);
+                window.renderResultsTable(data.total, data.rows);
             }
         }
     } catch (e) {
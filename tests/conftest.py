@@ -0,0 +1,42 @@
+import os
+import tempfile
+
+import pytest
+
+# The app and the default stores read their locations when first imported; keep test runs out of data/
+_scratch = tempfile.mkdtemp(prefix="linklens-tests-")
+os.environ.setdefault("LINKLENS_STATE_URL", f"sqlite:///{_scratch}/state.db")
+os.environ.setdefault("LINKLENS_QUEUE_DB", f"{_scratch}/tasks.db")
+os.environ.setdefault("LINKLENS_IDENTITY_DB", "")
+os.environ.setdefault("LINKLENS_PROFILE_INDEX", "")
+
+
+@pytest.fixture
+def users(tmp_path, monkeypatch):
+    """A users.json of its own: admin@x.com (the first user, so an admin) and plain@x.com, password "pw"."""
+    import auth.json_module_flask as db
+
+    monkeypatch.setattr(db, "USERS_FILE", str(tmp_path / "users.json"))
+    # Cheap hashes; the cost factor is not under test
+    gensalt = db.bcrypt.gensalt
+    monkeypatch.setattr(db.bcrypt, "gensalt", lambda rounds=4, prefix=b"2b": gensalt(rounds, prefix))
+    db._cached_user.cache_clear()
+    db._invalidate_user_index()
+    db.add_user("Admin", "admin@x.com", "pw")
+    db.add_user("Plain", "plain@x.com", "pw")
+    return db
+
+
+@pytest.fixture
+def client(users):
+    from app import app
+
+    return app.test_client()
+
+
+@pytest.fixture
+def login(client):
+    """login(email) signs the test client in as one of the users."""
+    def login(email, password="pw"):
+        return client.post("/login", data={"email": email, "password": password})
+    return login
@@ -0,0 +1,152 @@
+import threading
+
+import pandas as pd
+import pytest
+
+from backend import account_pool
+from backend.account_pool import AccountPool, discover_accounts
+from backend.rate_control import ThrottledError
+
+EXPIRED = {"stale"}
+THROTTLED = {"slow"}
+
+
+class FakeLogin:
+    """Stands in for LinkedInLogin: every session resumes except the EXPIRED ones."""
+    logins = []
+
+    def __init__(self, headless=True, status_callback=None):
+        self.page = None
+        self.cookies = None
+        self.username = None
+        self.closed = False
+
+    def resume_session(self, username):
+        FakeLogin.logins.append(username)
+        self.username = username
+        if username in EXPIRED:
+            return False
+        self.cookies = [{"name": "li_at", "value": username}]
+        return True
+
+    def login(self, username, password):
+        raise AssertionError("pool accounts must never log in with a password")
+
+    def close(self):
+        self.closed = True
+
+
+class FakeHTML:
+    """Stands in for LinkedInHTML: saves nothing, and THROTTLED accounts are always throttled."""
+    saved = []
+    lock = threading.Lock()
+    throttled = threading.Event()
+    wait_for_throttle = False
+
+    def __init__(self, page, status_callback=None, capture_mode="html", on_saved=None, rate=None):
+        self.rate = rate
+
+    def save_profile(self, link, folder):
+        if self.rate.name.split(":")[-1] in THROTTLED:
+            self.throttled.set()
+            raise ThrottledError("HTTP 429", link)
+        if self.wait_for_throttle:
+            # Leave a link for the throttled account to take first
+            self.throttled.wait(5)
+        with self.lock:
+            self.saved.append(link)
+        return folder / f"{link}.html"
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(account_pool, "LinkedInHTML", FakeHTML)
+    FakeLogin.logins = []
+    FakeHTML.saved = []
+    FakeHTML.throttled.clear()
+
+    def make(*usernames):
+        return AccountPool(usernames, login_factory=FakeLogin)
+    return make
+
+
+def test_discover_accounts(tmp_path):
+    for name in ("bob", "alice", "no-session"):
+        (tmp_path / name).mkdir()
+    (tmp_path / "alice" / "state.json").write_text("{}")
+    (tmp_path / "bob" / "state.json").write_text("{}")
+    assert discover_accounts(tmp_path) == ["alice", "bob"]
+
+
+def test_duplicate_usernames_share_one_worker(pool):
+    assert len(pool("a", "b", "a")) == 2
+
+
+def test_fetch_spreads_links_over_the_accounts(pool, tmp_path):
+    accounts = pool("a", "b")
+    links = [f"link-{i}" for i in range(20)]
+    fetched = []
+    accounts.fetch_profiles(links, tmp_path, on_fetched=lambda link, path: fetched.append(link))
+    assert sorted(fetched) == sorted(links) == sorted(FakeHTML.saved)
+    assert sum(w.fetched for w in accounts.workers) == 20
+
+
+def test_throttled_account_retires_and_hands_its_link_back(pool, tmp_path, monkeypatch):
+    monkeypatch.setattr(FakeHTML, "wait_for_throttle", True)
+    accounts = pool("slow", "a")
+    links = [f"link-{i}" for i in range(5)]
+    accounts.fetch_profiles(links, tmp_path)
+    assert sorted(FakeHTML.saved) == links
+    slow, fast = accounts.workers
+    assert slow.fetched == 0 and "Throttled" in slow.error
+    assert fast.fetched == 5
+
+
+def test_changes_are_reported_for_publishing(pool, tmp_path, monkeypatch):
+    monkeypatch.setattr(FakeHTML, "wait_for_throttle", True)
+    changed = []
+    accounts = AccountPool(["stale", "slow", "a"], login_factory=FakeLogin, on_change=changed.append)
+    accounts.fetch_profiles(["link-0", "link-1"], tmp_path)
+    stale, slow, fast = accounts.workers
+    # Expired, retired, and once per fetched profile
+    assert (changed.count(stale), changed.count(slow), changed.count(fast)) == (1, 1, 2)
+    # The accounts' own controllers report their adjustments too
+    assert fast.rate.on_change == changed.append
+
+
+def test_links_left_when_every_account_is_throttled(pool, tmp_path):
+    with pytest.raises(ThrottledError):
+        pool("slow").fetch_profiles(["link-0", "link-1"], tmp_path)
+
+
+def test_expired_session_marks_the_account_unavailable(pool, tmp_path):
+    accounts = pool("stale", "a")
+    accounts.fetch_profiles(["link-0", "link-1"], tmp_path)
+    stale = accounts.workers[0]
+    assert not stale.available and stale.error == "Saved session expired"
+    assert accounts.stats()[0]["available"] is False
+
+    # An unavailable account is not tried again, for fetching or enrichment
+    FakeLogin.logins = []
+    df = pd.DataFrame({"Name": list("abc")})
+    accounts.enrich(df, lambda chunk, cookies, rate: chunk)
+    assert accounts.fetch_profiles(["link-2"], tmp_path) is None
+    assert "stale" not in FakeLogin.logins
+
+
+def test_enrich_merges_chunks_back_in_row_order(pool):
+    accounts = pool("a", "b", "c")
+    df = pd.DataFrame({"Name": [f"n{i}" for i in range(10)]}, index=range(100, 110))
+
+    def enrich(chunk, cookies, rate):
+        return chunk.assign(Email=chunk["Name"] + "@" + cookies[0]["value"])
+
+    result = accounts.enrich(df, enrich)
+    assert list(result.index) == list(df.index)
+    assert list(result["Name"]) == list(df["Name"])
+    assert {e.split("@")[1] for e in result["Email"]} == {"a", "b", "c"}
+
+
+def test_enrich_fails_when_no_account_can_log_in(pool):
+    with pytest.raises(Exception, match="No account"):
+        pool("stale").enrich(pd.DataFrame({"Name": ["x"]}), lambda chunk, cookies, rate: chunk)
@@ -0,0 +1,87 @@
+import re
+from pathlib import Path
+
+import pytest
+from bs4 import BeautifulSoup
+
+from backend import linkedin_data_extract as extract
+from backend.extract_rules import KeywordSet, RuleSet, SubstitutionChain, all_rules, get_rule, register
+
+SAMPLES = Path(__file__).resolve().parent.parent / "data" / "temp"
+EXTRA_LINES = [
+    "", "Show all 12 skills", "Senior Technical Recruiter", "Talent Acquisition Partner · Full-time",
+    "Data Engineer at Staffing Co", "Jan 2020 - Present · 4 yrs", "Sydney, New South Wales, Australia",
+    "3rd+ · Remote", "Engineering Manager", "Statisticians", "analytics", "Executives",
+]
+
+
+@pytest.fixture(scope="module")
+def lines():
+    found = list(EXTRA_LINES)
+    for file in sorted(SAMPLES.glob("*.html")):
+        soup = BeautifulSoup(file.read_text(encoding="utf-8"), "html.parser")
+        found.extend(extract.get_visible_text(soup))
+    assert len(found) > len(EXTRA_LINES)
+    return found
+
+
+def per_pattern_search(rule, text):
+    """The pre-engine form: one re.search() per pattern."""
+    return any(re.search(p, text, rule.flags) for p in rule.patterns)
+
+
+def test_rule_sets_agree_with_per_pattern_search(lines):
+    rule_sets = [r for r in all_rules().values() if isinstance(r, RuleSet)]
+    assert rule_sets
+    for rule in rule_sets:
+        for text in lines + [t.lower() for t in lines]:
+            assert rule.search(text) == per_pattern_search(rule, text), (rule.name, text)
+
+
+def test_keyword_sets_agree_with_substring_checks(lines):
+    rule = get_rule("tech_keywords")
+    for text in lines:
+        lowered = text.lower()
+        assert rule.contains_any(lowered) == any(kw in lowered for kw in extract.tech_keywords), text
+
+
+def test_recruiter_check_matches_the_old_loop(lines):
+    def legacy(title, company):
+        for pattern in extract.recruitment_agencies:
+            if re.search(pattern, f"{title} {company}", re.I):
+                return not any(kw in title.lower() for kw in extract.tech_keywords)
+        return False
+
+    for title, company in zip(lines, lines[1:]):
+        assert extract.is_recruiter_profile(title, company) == legacy(title, company), (title, company)
+
+
+def test_role_word_chain_matches_sequential_subs(lines):
+    chain = get_rule("role_word")
+    for word in {w for ln in lines for w in extract.WORD_RE.findall(ln.lower())}:
+        expected = word
+        for pattern, repl in extract.ROLE_WORD_RULES:
+            expected = re.sub(pattern, repl, expected)
+        assert chain.apply(word) == expected, word
+
+
+def test_match_is_anchored_and_empty_text_never_matches():
+    rule = RuleSet("test", [r"b+", r"c"])
+    assert rule.search("abb") and not rule.match("abb")
+    assert rule.match("cab")
+    assert not rule.search("") and not rule.search(None)
+    assert not KeywordSet("test", ["x"]).contains_any("")
+
+
+def test_overlapping_keywords_and_ordered_substitutions():
+    assert KeywordSet("test", ["data", "data engineer"], ignore_case=True).contains_any("DATA ENGINEER")
+    # Later rules see the output of earlier ones
+    assert SubstitutionChain("test", [(r"ing$", ""), (r"er$", "")]).apply("engineering") == "engine"
+
+
+def test_registry_rejects_duplicates_and_unknown_names():
+    assert get_rule("date") is extract.DATE_RULE
+    with pytest.raises(ValueError):
+        register(RuleSet("date", [r"\d{4}"]))
+    with pytest.raises(KeyError, match="Unknown extraction rule"):
+        get_rule("no-such-rule")
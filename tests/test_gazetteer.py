@@ -0,0 +1,76 @@
+from backend.gazetteer import Gazetteer, Place, default_gazetteer, normalize_location, place_key
+from backend.linkedin_data_extract import location_match
+
+SYDNEY = Place("Sydney", "New South Wales", "Australia")
+
+
+def test_place_key_folds_case_accents_and_punctuation():
+    assert place_key("Zürich") == place_key("zurich") == "zurich"
+    assert place_key("  Sydney,  NSW ") == "sydney nsw"
+
+
+def test_city_forms_and_aliases_resolve_to_the_city():
+    for text in ("Sydney", "Greater Sydney Area", "Sydney Metropolitan Area", "Sydney CBD", "Sydney NSW",
+                 "Parramatta", "North Sydney", "Sydney, New South Wales, Australia"):
+        assert normalize_location(text) == SYDNEY, text
+
+
+def test_region_and_country_aliases():
+    assert normalize_location("NSW") == Place(None, "New South Wales", "Australia")
+    assert normalize_location("AU") == Place(None, None, "Australia")
+
+
+def test_workplace_suffix_is_ignored():
+    assert normalize_location("Sydney, New South Wales, Australia · Hybrid") == SYDNEY
+    assert normalize_location("Greater Sydney Area (Remote)") == SYDNEY
+
+
+def test_ambiguous_city_is_resolved_from_the_other_parts():
+    assert normalize_location("Sydney").country == "Australia"
+    assert normalize_location("Sydney, Nova Scotia") == Place("Sydney", "Nova Scotia", "Canada")
+
+
+def test_misspelling_is_matched_fuzzily():
+    assert normalize_location("Sydeny") == SYDNEY
+
+
+def test_unknown_place_is_none():
+    assert normalize_location("Atlantis") is None
+    assert normalize_location("") is None
+    assert normalize_location(None) is None
+
+
+def test_is_place_does_not_match_fuzzily():
+    gazetteer = default_gazetteer()
+    assert gazetteer.is_place("Greater Sydney Area")
+    assert gazetteer.is_place("Sydney, New South Wales, Australia")
+    assert not gazetteer.is_place("Sydeny")
+    assert not gazetteer.is_place("Senior Data Architect")
+
+
+def test_custom_file(tmp_path):
+    path = tmp_path / "places.tsv"
+    path.write_text("# country\tregion\tcity\taliases\n"
+                    "Utopia\t\t\tUT\n"
+                    "Utopia\tNorth\t\tNorthern Province\n"
+                    "Utopia\tNorth\tHope\tHopeville;Old Hope\n", encoding="utf-8")
+    gazetteer = Gazetteer(path)
+    assert gazetteer.normalize("Greater Hopeville Area") == Place("Hope", "North", "Utopia")
+    assert gazetteer.normalize("Old Hope") == Place("Hope", "North", "Utopia")
+    assert gazetteer.normalize("Northern Province") == Place(None, "North", "Utopia")
+    assert gazetteer.normalize("UT") == Place(None, None, "Utopia")
+
+
+# ---------------- location_match ----------------
+def test_location_match_accepts_places_within_the_job_location():
+    assert location_match("Greater Sydney Area", "Sydney, New South Wales, Australia")
+    assert location_match("Greater Sydney Area", "Parramatta")
+    assert location_match("Australia", "Melbourne, Victoria, Australia")
+    assert location_match("NSW", "Sydney CBD")
+
+
+def test_location_match_rejects_other_places():
+    assert not location_match("Greater Sydney Area", "Melbourne, Victoria, Australia")
+    assert not location_match("Greater Sydney Area", "Sydney, Nova Scotia, Canada")
+    assert not location_match("Sydney", "Australia")  # too coarse once both are known places
+    assert not location_match("Sydney", "")
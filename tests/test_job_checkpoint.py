@@ -0,0 +1,75 @@
+import json
+from pathlib import Path
+
+from backend import job_checkpoint
+from backend.job_checkpoint import STAGES, JobCheckpoint, list_jobs
+
+
+def test_checkpoint_file_format(tmp_path):
+    job = JobCheckpoint.create({"job_title": "Data Architect", "excel_path": Path("links.xlsx"), "password": "secret"},
+                               tmp_path)
+    assert job.path == tmp_path / job.job_id / "checkpoint.json"
+    state = json.loads(job.path.read_text(encoding="utf-8"))
+    assert state["job_id"] == job.job_id and state["status"] == "running"
+    assert state["params"] == {"job_title": "Data Architect", "excel_path": "links.xlsx"}
+    assert state["stages"] == {stage: False for stage in STAGES}
+    assert (state["links"], state["fetched"], state["failed"], state["parsed"], state["contacts"]) == ([], {}, [], {}, {})
+    # Written through a temp file that is renamed into place
+    assert [p.name for p in job.folder.iterdir()] == ["checkpoint.json"]
+
+
+def test_frequent_updates_are_batched(tmp_path, monkeypatch):
+    monkeypatch.setattr(job_checkpoint, "CHECKPOINT_EVERY", 3)
+    job = JobCheckpoint.create({}, tmp_path)
+
+    def saved():
+        return JobCheckpoint.load(job.job_id, tmp_path).state
+
+    job.record_contact("a", "a@x.com", None)
+    job.record_contact("b", None, None)
+    assert saved()["contacts"] == {}
+    job.record_contact("c", None, "+61")
+    assert saved()["contacts"]["c"] == {"Email": None, "Phone": "+61"}
+    # Fetched files and accepted rows are never held back
+    job.record_fetch("link", tmp_path / "a.html")
+    job.record_parse("a.html", {"Name": "A"})
+    assert saved()["fetched"] == {"link": "a.html"} and saved()["parsed"] == {"a.html": {"Name": "A"}}
+
+
+def test_load_only_reads_job_folders(tmp_path):
+    job = JobCheckpoint.create({}, tmp_path)
+    assert JobCheckpoint.load(f"../{tmp_path.name}/{job.job_id}", tmp_path).job_id == job.job_id
+    assert JobCheckpoint.load("missing", tmp_path) is None
+
+
+# ---------------- Resume ----------------
+def test_checkpointed_job_resumes_from_another_worker(tmp_path):
+    job = JobCheckpoint.create({"job_title": "Data Architect", "password": "secret"}, tmp_path)
+    job.set_links(["a", "b", "a", "c"])
+    job.record_fetch("a", tmp_path / "a.html")
+    job.record_fetch("b", None)
+    job.record_parse("a.html", {"Name": "A"})
+
+    resumed = JobCheckpoint.load(job.job_id, tmp_path)
+    assert "password" not in resumed.params
+    assert resumed.state["links"] == ["a", "b", "c"]
+    assert resumed.stage_done("links") and not resumed.stage_done("fetch")
+    assert resumed.state["fetched"] == {"a": "a.html"}
+    assert resumed.state["failed"] == ["b"]
+    assert resumed.summary()["accepted"] == 1
+
+    # Running, but not the job this process is running: it was cut off
+    assert list_jobs(tmp_path)[0]["status"] == "interrupted"
+    assert list_jobs(tmp_path, active_job_id=job.job_id)[0]["status"] == "running"
+    resumed.record_fetch("b", tmp_path / "b.html")
+    resumed.finish()
+    assert JobCheckpoint.load(job.job_id, tmp_path).summary()["failed"] == 0
+    assert list_jobs(tmp_path)[0]["status"] == "completed"
+
+
+def test_unreadable_checkpoints_are_skipped(tmp_path):
+    job = JobCheckpoint.create({}, tmp_path)
+    job.finish("failed", "boom")
+    (tmp_path / "broken").mkdir()
+    (tmp_path / "broken" / "checkpoint.json").write_text("{", encoding="utf-8")
+    assert [(j["job_id"], j["status"], j["error"]) for j in list_jobs(tmp_path)] == [(job.job_id, "failed", "boom")]
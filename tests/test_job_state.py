@@ -0,0 +1,82 @@
+import time
+
+import pytest
+
+from backend import job_state
+from backend.job_state import EventFeed, SQLiteJobState, open_job_state
+
+
+@pytest.fixture
+def state(tmp_path):
+    return SQLiteJobState(tmp_path / "state.db")
+
+
+def test_open_job_state_from_url(tmp_path):
+    assert isinstance(open_job_state(f"sqlite:///{tmp_path}/app.db"), SQLiteJobState)
+
+
+def test_events_are_read_back_after_an_id(state):
+    assert state.last_event_id() == 0
+    ids = [state.push_event(f"message {i}") for i in range(5)]
+    assert state.last_event_id() == ids[-1]
+    assert state.events_after(ids[2]) == [(ids[3], "message 3"), (ids[4], "message 4")]
+    assert len(state.events_after(0, limit=2)) == 2
+
+
+def test_old_events_are_trimmed(state, monkeypatch):
+    monkeypatch.setattr(job_state, "EVENTS_KEEP", 100)
+    for i in range(500):
+        state.push_event(str(i))
+    assert state.events_after(0, limit=1000)[0][0] == 401
+
+
+def test_scraper_lock_is_a_lease(state):
+    assert state.acquire_scraper("w1", lease_seconds=0.1)
+    assert state.scraper_active()
+    assert not state.acquire_scraper("w2")
+    assert state.acquire_scraper("w1")  # re-entrant
+    assert not state.renew_scraper("w2")
+
+    # A dead owner's lock frees itself once the lease runs out
+    assert state.acquire_scraper("w1", lease_seconds=0.05)
+    time.sleep(0.1)
+    assert not state.scraper_active()
+    assert state.acquire_scraper("w2")
+    assert not state.renew_scraper("w1")
+
+    state.release_scraper("w1")
+    assert state.scraper_active()
+    state.release_scraper("w2")
+    assert not state.scraper_active()
+
+
+def test_current_job_is_shared_between_store_instances(state):
+    assert state.current_job() == (None, 0)
+    state.set_current_job("job-1", first_event_id=42)
+    assert SQLiteJobState(state.path).current_job() == ("job-1", 42)
+    assert SQLiteJobState(state.path).current_job_id() == "job-1"
+
+
+def test_published_values_are_shared_between_store_instances(state):
+    assert state.get_value("linkedin_rate") is None
+    assert state.get_value("linkedin_rate", {}) == {}
+    state.set_value("linkedin_rate", {"rate": 0.5, "accounts": [{"username": "a"}]})
+    state.set_value("linkedin_rate", {"rate": 0.25, "accounts": []})
+    assert SQLiteJobState(state.path).get_value("linkedin_rate") == {"rate": 0.25, "accounts": []}
+    # Values live apart from the lock and the current job
+    state.set_value("scraper", "x")
+    assert not state.scraper_active()
+
+
+def test_event_feed_serves_new_and_replayed_events(state):
+    feed = EventFeed(state, poll_interval=0.01, buffer_size=3)
+    first = state.push_event("before the feed started")
+    assert feed.wait(first, timeout=0.05) == []
+    ids = [state.push_event(f"live {i}") for i in range(5)]
+    deadline = time.monotonic() + 2
+    while feed._last_id < ids[-1] and time.monotonic() < deadline:
+        feed.wait(first, timeout=0.05)
+    # Newer than the buffer's start: served from the buffer
+    assert [m for _, m in feed.wait(ids[2], timeout=0)] == ["live 3", "live 4"]
+    # Older than the buffer (a reconnect): read from the store
+    assert [m for _, m in feed.wait(0, timeout=0)][:2] == ["before the feed started", "live 0"]
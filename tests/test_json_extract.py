@@ -0,0 +1,205 @@
+import html as html_lib
+import json
+from pathlib import Path
+
+import pytest
+
+from backend import linkedin_data_extract as extract, linkedin_html
+from backend.linkedin_html import LinkedInHTML
+from backend.linkedin_json_extract import (
+    CAPTURE_SUFFIX, experience_from_positions, extract_profile_data, load_capture, read_capture, write_capture
+)
+from backend.rate_control import AdaptiveRateController
+
+SAMPLES = sorted((Path(__file__).resolve().parent.parent / "data" / "temp").glob("*.html"))
+PROFILE_REQUEST = "/voyager/api/identity/dash/profiles?q=memberIdentity&memberIdentity=jane-doe"
+PROFILE_TYPE = "com.linkedin.voyager.dash.identity.profile.Profile"
+POSITION_TYPE = "com.linkedin.voyager.dash.identity.profile.Position"
+SKILL_TYPE = "com.linkedin.voyager.dash.identity.profile.Skill"
+
+
+def position(urn, title, company, start, end=None, location=None):
+    return {"$type": POSITION_TYPE, "entityUrn": urn, "title": title, "companyName": company,
+            "dateRange": {"start": start, "end": end}, "locationName": location}
+
+
+PAYLOAD = {
+    "data": {"data": {"identityDashProfilesByMemberIdentity": {"*elements": ["urn:li:fsd_profile:1"]}}},
+    "included": [
+        {"$type": PROFILE_TYPE, "entityUrn": "urn:li:fsd_profile:1", "firstName": "Jane", "lastName": "Doe",
+         "headline": "Data Architect at Atlassian", "publicIdentifier": "jane-doe",
+         "geoLocation": {"*geo": "urn:li:fsd_geo:1"}},
+        {"entityUrn": "urn:li:fsd_geo:1", "defaultLocalizedName": "Sydney, New South Wales, Australia"},
+        position("urn:pos:1", "Data Engineer", "Atlassian", {"year": 2018}, {"year": 2021, "month": 2}),
+        position("urn:pos:2", "Data Architect", "Atlassian", {"year": 2021, "month": 3}, location="Sydney"),
+        position("urn:pos:3", "Analyst", "Canva", {"year": 2015, "month": 1}, {"year": 2017, "month": 12}),
+        {"$type": SKILL_TYPE, "entityUrn": "urn:skill:1", "name": "SQL"},
+        {"$type": SKILL_TYPE, "entityUrn": "urn:skill:2", "name": "Snowflake"},
+        {"$type": SKILL_TYPE, "entityUrn": "urn:skill:3", "name": "SQL"},
+    ],
+}
+
+
+def embedded_page(payload, request=PROFILE_REQUEST, body=None):
+    """A saved page carrying one API response the way LinkedIn embeds them."""
+    meta = html_lib.escape(json.dumps({"request": request, "status": 200, "body": "bpr-guid-1"}))
+    body = html_lib.escape(json.dumps(payload)) if body is None else body
+    return (f'<html><body><code style="display: none" id="datalet-bpr-guid-1">{meta}</code>'
+            f'<code style="display: none" id="bpr-guid-1">{body}</code><main>Page</main></body></html>')
+
+
+@pytest.fixture
+def dom_extractors(monkeypatch):
+    """Records which DOM extractors parse_html falls back to."""
+    called = []
+    for name, value in (("find_name", "DOM Name"), ("find_skills", ["DOM skill"]),
+                        ("find_url", "https://www.linkedin.com/in/dom/"),
+                        ("find_experience", {"Company": "No roles found!", "Roles": []})):
+        monkeypatch.setattr(extract, name, lambda *args, _n=name, _v=value: called.append(_n) or _v)
+    return called
+
+
+def test_embedded_payload_maps_to_profile_fields():
+    data = extract_profile_data(embedded_page(PAYLOAD))
+    assert (data["name"], data["vanity"], data["location"]) == ("Jane Doe", "jane-doe", "Sydney, New South Wales, Australia")
+    assert data["skills"] == ["SQL", "Snowflake"]
+    assert [p["dates"] for p in data["positions"]] == ["Mar 2021 - Present", "2018 - Feb 2021", "Jan 2015 - Dec 2017"]
+    assert experience_from_positions(data["positions"]) == {"Company": "Atlassian", "Roles": [
+        {"Title": "Data Architect", "Dates": "Mar 2021 - Present", "Location": "Sydney"},
+        {"Title": "Data Engineer", "Dates": "2018 - Feb 2021", "Location": None},
+    ]}
+
+
+def test_parse_uses_embedded_data_without_the_dom(dom_extractors):
+    row = extract.parse_html(embedded_page(PAYLOAD), "jane-doe_1766613390.html").to_row()
+    assert dom_extractors == []
+    assert (row["Name"], row["Title"], row["Company"]) == ("Jane Doe", "Data Architect", "Atlassian")
+    assert row["Skills"] == "• SQL\n• Snowflake"
+    assert row["Source_URL"].endswith("/in/jane-doe/")
+
+
+def test_missing_fields_fall_back_to_the_dom(dom_extractors):
+    partial = dict(PAYLOAD, included=PAYLOAD["included"][:2])
+    row = extract.parse_html(embedded_page(partial), "jane-doe_1766613390.html").to_row()
+    assert dom_extractors == ["find_experience", "find_skills"]
+    assert row["Name"] == "Jane Doe" and row["Skills"] == "• DOM skill"
+
+
+@pytest.mark.parametrize("page", [
+    embedded_page(PAYLOAD, request="/voyager/api/feed/updates"),
+    embedded_page(PAYLOAD, body="{not json"),
+    "<html><body><main>No embedded data</main></body></html>",
+])
+def test_pages_without_usable_payloads_use_the_dom(page, dom_extractors):
+    assert extract_profile_data(page) == {}
+    assert extract.parse_html(page, "jane-doe_1766613390.html").to_row()["Name"] == "DOM Name"
+    assert dom_extractors == ["find_experience", "find_name", "find_skills", "find_url"]
+
+
+def test_dom_engine_ignores_embedded_data(dom_extractors, monkeypatch):
+    monkeypatch.setattr(extract, "EXTRACTION_ENGINE", "dom")
+    assert extract.parse_html(embedded_page(PAYLOAD), "jane-doe_1766613390.html").to_row()["Name"] == "DOM Name"
+
+
+@pytest.mark.parametrize("sample", SAMPLES, ids=lambda p: p.stem)
+def test_sample_pages_parse_the_same_with_either_engine(sample, monkeypatch):
+    page = sample.read_text(encoding="utf-8")
+    assert extract_profile_data(page).get("name")
+    auto = extract.parse_html(page, sample).to_row()
+    monkeypatch.setattr(extract, "EXTRACTION_ENGINE", "dom")
+    assert extract.parse_html(page, sample).to_row() == auto
+
+
+# ---------------- Network capture ----------------
+class Response:
+    def __init__(self, url, resource_type="fetch", body=None, text=""):
+        self.url, self.body, self.body_text = url, body, text
+        self.request = type("Request", (), {"resource_type": resource_type})()
+
+    def json(self):
+        if isinstance(self.body, Exception):
+            raise self.body
+        return self.body
+
+    def text(self):
+        return self.body_text
+
+
+class CapturePage:
+    """Plays the given responses to the response listener while navigating."""
+
+    def __init__(self, responses, content="<html><title>Jane</title><main>rendered</main></html>"):
+        self.responses, self.rendered = responses, content
+        self.listeners = []
+        self.url = ""
+
+    def on(self, event, callback):
+        self.listeners.append(callback)
+
+    def remove_listener(self, event, callback):
+        self.listeners.remove(callback)
+
+    def goto(self, url):
+        self.url = url
+        for response in self.responses:
+            for callback in list(self.listeners):
+                callback(response)
+        return None
+
+    def content(self):
+        return self.rendered
+
+
+@pytest.fixture
+def capture(monkeypatch):
+    monkeypatch.setattr(linkedin_html.time, "sleep", lambda seconds: None)
+
+    def make(responses, saved=None):
+        page = CapturePage(responses)
+        rate = AdaptiveRateController("test", initial_rate=1000, max_rate=1000)
+        return page, LinkedInHTML(page, capture_mode="network", rate=rate, on_saved=saved)
+    return make
+
+
+def test_capture_file_round_trip(tmp_path):
+    records = [(PROFILE_REQUEST, PAYLOAD), ("/voyager/api/identity/dash/profileCards", {"included": []})]
+    path = write_capture(tmp_path / f"jane-doe_1766613390{CAPTURE_SUFFIX}", "https://www.linkedin.com/in/jane-doe/",
+                         "jane-doe", records, captured_at=1766613390)
+    header, read_back = read_capture(path.read_text(encoding="utf-8") + "\nnot json\n")
+    assert header["vanity"] == "jane-doe" and header["captured_at"] == 1766613390
+    assert read_back == records
+    assert load_capture(path.read_text(encoding="utf-8")) == extract_profile_data(embedded_page(PAYLOAD))
+
+
+def test_network_capture_saves_only_profile_responses(capture, tmp_path):
+    saved = []
+    responses = [
+        Response("https://www.linkedin.com/in/jane-doe/", "document",
+                 text=embedded_page({"included": []}, request="/voyager/api/identity/dash/profiles?q=viewee")),
+        Response(f"https://www.linkedin.com{PROFILE_REQUEST}", body=PAYLOAD),
+        Response("https://www.linkedin.com/voyager/api/feed/updates", body={"included": ["ignored"]}),
+        Response("https://www.linkedin.com/voyager/api/identity/dash/profiles?q=broken", body=ValueError("gone")),
+    ]
+    page, html = capture(responses, saved.append)
+    path = html.save_profile("https://www.linkedin.com/in/jane-doe/", tmp_path)
+    assert path.suffix == CAPTURE_SUFFIX and saved == [path] and page.listeners == []
+    header, records = read_capture(path.read_text(encoding="utf-8"))
+    assert header["url"] == "https://www.linkedin.com/in/jane-doe/" and header["vanity"] == "jane-doe"
+    assert [request for request, _ in records] == ["/voyager/api/identity/dash/profiles?q=viewee", PROFILE_REQUEST]
+
+
+def test_network_capture_falls_back_to_html(capture, tmp_path):
+    partial = dict(PAYLOAD, included=PAYLOAD["included"][:2])
+    page, html = capture([Response(f"https://www.linkedin.com{PROFILE_REQUEST}", body=partial)])
+    path = html.save_profile("https://www.linkedin.com/in/jane-doe/", tmp_path)
+    assert path.suffix == ".html" and path.read_text(encoding="utf-8") == page.rendered
+
+
+def test_capture_files_are_parsed_and_filtered(tmp_path):
+    path = write_capture(tmp_path / f"jane-doe_1766613390{CAPTURE_SUFFIX}", "https://www.linkedin.com/in/jane-doe/",
+                         "jane-doe", [(PROFILE_REQUEST, PAYLOAD)])
+    assert extract.is_profile_file(path)
+    parsed = extract.evaluate_profile_file(path, role="Data Architect", loc="Sydney")
+    assert parsed.accepted
+    assert (parsed["Name"], parsed["Company"], parsed["Location"]) == ("Jane Doe", "Atlassian", "Sydney")
+    assert parsed["Source_URL"].endswith("/in/jane-doe/")
@@ -0,0 +1,16 @@
+from pathlib import Path
+
+import pytest
+
+from benchmarks.bench_import import import_profile
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.mark.parametrize("module", ["app", "backend.worker"])
+def test_startup_imports_nothing_heavy(module, monkeypatch):
+    # Playwright, pandas and friends are only imported once a job runs or an export is requested
+    monkeypatch.chdir(ROOT)
+    times, heavy = import_profile(module)
+    assert module in times
+    assert heavy == []
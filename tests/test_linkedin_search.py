@@ -0,0 +1,101 @@
+import pytest
+
+from backend import linkedin_search, linkedin_urls
+from backend.linkedin_search import LinkedInSearch
+from backend.rate_control import AdaptiveRateController
+
+
+@pytest.fixture
+def base_url(monkeypatch):
+    # set_base_url rebinds the module global; monkeypatch puts the old one back
+    monkeypatch.setattr(linkedin_urls, "LINKEDIN_BASE_URL", linkedin_urls.LINKEDIN_BASE_URL)
+    return linkedin_urls.set_base_url
+
+
+def test_urls_follow_the_base_url(base_url):
+    base_url("http://127.0.0.1:8765/")
+    assert linkedin_urls.linkedin_url("/feed/") == linkedin_urls.linkedin_url("feed/") == "http://127.0.0.1:8765/feed/"
+    assert linkedin_urls.profile_url("jane-doe") == "http://127.0.0.1:8765/in/jane-doe/"
+    assert linkedin_urls.contact_overlay_url("jane-doe") == "http://127.0.0.1:8765/in/jane-doe/overlay/contact-info/"
+    base_url(None)
+    assert linkedin_urls.login_url() == "https://www.linkedin.com/login"
+
+
+def test_search_url_quotes_keywords_and_only_pages_after_the_first(base_url):
+    base_url("https://www.linkedin.com")
+    first = linkedin_urls.people_search_url("Data Architect Sydney & Co")
+    assert first == ("https://www.linkedin.com/search/results/people/"
+                     "?keywords=Data%20Architect%20Sydney%20%26%20Co&origin=GLOBAL_SEARCH_HEADER")
+    assert linkedin_urls.people_search_url("x", page=1) == linkedin_urls.people_search_url("x")
+    assert linkedin_urls.people_search_url("x", page=3).endswith("&page=3")
+
+
+# ---------------- Search ----------------
+class Anchor:
+    def __init__(self, href):
+        self.href = href
+
+    def get_attribute(self, name):
+        return self.href
+
+
+class FakeSearchPage:
+    """A results page with `per_page` profiles on each of `pages` pages."""
+
+    def __init__(self, pages, per_page=3):
+        self.pages, self.per_page = pages, per_page
+        self.visited = []
+        self.url = ""
+
+    def goto(self, url):
+        self.visited.append(url)
+        self.url = url
+        return None
+
+    def query_selector_all(self, selector):
+        page = int(self.url.split("&page=")[1]) if "&page=" in self.url else 1
+        if page > self.pages:
+            return [Anchor("/search/results/people/?page=1")]
+        return [Anchor(f"https://www.linkedin.com/in/p{page}-{i}/?miniProfileUrn=x") for i in range(self.per_page)]
+
+    def evaluate(self, script):
+        pass
+
+
+@pytest.fixture
+def search(monkeypatch):
+    monkeypatch.setattr(linkedin_search.time, "sleep", lambda seconds: None)
+
+    def make(page, **kwargs):
+        rate = AdaptiveRateController("test", initial_rate=1000, max_rate=1000)
+        return LinkedInSearch(page, rate=rate, **kwargs)
+    return make
+
+
+def test_search_reads_one_page_by_default(search):
+    page = FakeSearchPage(pages=5)
+    links = search(page).collect_profile_links("Data Architect", "Australia", max_results=20)
+    assert len(page.visited) == 1
+    assert sorted(links) == [f"https://www.linkedin.com/in/p1-{i}/" for i in range(3)]
+
+
+def test_search_stops_at_the_page_limit(search):
+    page = FakeSearchPage(pages=5)
+    links = search(page, max_pages=3).collect_profile_links("Data Architect", "Australia", max_results=20)
+    assert len(page.visited) == 3 and page.visited[-1].endswith("&page=3")
+    assert len(links) == 9
+
+
+def test_search_stops_when_results_run_out_or_enough_were_found(search):
+    page = FakeSearchPage(pages=2)
+    assert len(search(page, max_pages=10).collect_profile_links("x", "y", max_results=20)) == 6
+    assert len(page.visited) == 3
+
+    page = FakeSearchPage(pages=5)
+    assert len(search(page, max_pages=10).collect_profile_links("x", "y", max_results=4)) == 4
+    assert len(page.visited) == 2
+
+
+def test_search_needs_a_page(search):
+    with pytest.raises(RuntimeError):
+        search(None).collect_profile_links("x", "y")
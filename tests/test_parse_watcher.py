@@ -0,0 +1,106 @@
+import pytest
+
+from backend import parse_watcher
+from backend.parse_watcher import ParseWatcher
+from backend.profile_record import ProfileRecord
+
+
+@pytest.fixture
+def parsed_files(monkeypatch):
+    """Stands in for evaluate_profile_file: "reject*" files are rejected, "broken*" ones raise."""
+    calls = []
+
+    def evaluate(path, role, loc, profiler, identities):
+        calls.append(path.name)
+        if path.name.startswith("broken"):
+            raise ValueError("bad page")
+        parsed = ProfileRecord.build(path.stem, "Data Architect", "Atlassian", "Sydney", [], {"Roles": []},
+                                     f"https://www.linkedin.com/in/{path.stem}/")
+        parsed.accepted = not path.name.startswith("reject")
+        return parsed
+
+    monkeypatch.setattr(parse_watcher, "evaluate_profile_file", evaluate)
+    monkeypatch.setattr(parse_watcher, "index_profiles", lambda profiles, role, loc: None)
+    return calls
+
+
+@pytest.fixture
+def folder(tmp_path):
+    path = tmp_path / "temp"
+    path.mkdir()
+    return path
+
+
+def save(folder, name):
+    path = folder / name
+    path.write_text("<html></html>", encoding="utf-8")
+    return path
+
+
+def test_unsettled_files_wait_for_a_later_poll(folder, parsed_files):
+    watcher = ParseWatcher(folder, move_files=False, settle_seconds=3600)
+    save(folder, "a.html")
+    assert watcher.poll() == 0
+    assert watcher._pending == {"a.html"} and parsed_files == []
+    # Still settling: the unchanged folder is rescanned rather than skipped
+    assert watcher.poll() == 0 and watcher.counts["scans"] == 2
+    assert watcher.poll(settle_ns=0) == 1
+    assert parsed_files == ["a.html"] and watcher._pending == set()
+
+
+def test_files_are_parsed_once(folder, parsed_files):
+    watcher = ParseWatcher(folder, move_files=False, settle_seconds=0)
+    path = save(folder, "a.html")
+    watcher.notify(path)
+    watcher.notify(path)
+    assert watcher.poll() == 1
+    assert watcher.poll() == 0
+    watcher.notify(path)
+    assert watcher.poll(settle_ns=0) == 0
+    assert parsed_files == ["a.html"]
+
+
+def test_only_profile_files_are_handled(folder, parsed_files):
+    watcher = ParseWatcher(folder, move_files=False, settle_seconds=0)
+    watcher.notify(save(folder, "notes.txt"))
+    save(folder, "links.xlsx")
+    (folder / "sub.html").mkdir()
+    save(folder, "b.jsonl")
+    assert watcher.poll() == 1 and parsed_files == ["b.jsonl"]
+
+
+def test_skipped_and_existing_files_are_not_parsed(folder, parsed_files):
+    save(folder, "done.html")
+    save(folder, "old.html")
+    watcher = ParseWatcher(folder, move_files=False, settle_seconds=0, include_existing=False, skip=["later.html"])
+    save(folder, "later.html")
+    save(folder, "new.html")
+    assert watcher.poll(settle_ns=0) == 1
+    assert parsed_files == ["new.html"]
+
+
+def test_failures_are_counted_and_not_retried(folder, parsed_files):
+    watcher = ParseWatcher(folder, move_files=False, settle_seconds=0)
+    save(folder, "broken.html")
+    save(folder, "reject.html")
+    assert watcher.poll() == 2
+    save(folder, "c.html")
+    assert watcher.poll() == 1
+    assert sorted(parsed_files) == ["broken.html", "c.html", "reject.html"]
+    assert watcher.counts | {"scans": 0} == {"parsed": 3, "accepted": 1, "rejected": 1, "errors": 1, "scans": 0}
+
+
+def test_accepted_profiles_are_reported_and_moved(folder, parsed_files):
+    rows, parsed = [], []
+    watcher = ParseWatcher(folder, settle_seconds=0, on_result=rows.append,
+                           on_parsed=lambda path, row: parsed.append((path.name, row is not None)))
+    watcher.start()
+    for name in ("a.html", "reject.html", "b.html"):
+        watcher.notify(save(folder, name))
+    results = watcher.stop()
+    # The thread may list the folder before the notifications arrive, so the order varies
+    assert sorted(r.name for r in results) == ["a", "b"]
+    assert [(row["#"], row["Name"]) for row in rows] == [(1, results[0].name), (2, results[1].name)]
+    assert sorted(parsed) == [("a.html", True), ("b.html", True), ("reject.html", False)]
+    assert sorted(p.name for p in (folder / "parsed").iterdir()) == ["a.html", "b.html"]
+    assert [p.name for p in folder.glob("*.html")] == ["reject.html"]
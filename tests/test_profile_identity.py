@@ -0,0 +1,98 @@
+import time
+
+import pytest
+
+from backend.profile_identity import (IdentityStore, canonical_vanity, profile_fields, record_from_fields,
+                                      unique_profile_links)
+from backend.profile_record import ProfileRecord
+
+JANE = "https://www.linkedin.com/in/jane-doe/"
+
+
+@pytest.fixture
+def store(tmp_path):
+    return IdentityStore(tmp_path / "identity.db", max_age_days=30)
+
+
+def fields(**kwargs):
+    return {"name": "Jane Doe", "title": "Data Architect", "company": "Atlassian", "location": "Sydney",
+            "skills": ["SQL"], "experience": None, "source_url": JANE, "headline_location": None, **kwargs}
+
+
+@pytest.mark.parametrize("value", [
+    "https://au.linkedin.com/in/Jane-Doe/en?trk=x", "/in/jane-doe/", "jane-doe", "jane-doe_1717000000.html",
+    "Jane-Doe.jsonl", "https://www.linkedin.com/in/jane%2Ddoe",
+])
+def test_canonical_vanity(value):
+    assert canonical_vanity(value) == "jane-doe"
+
+
+@pytest.mark.parametrize("value", [None, "", "https://www.linkedin.com/company/acme/",
+                                   "https://www.linkedin.com/search/results/people/?keywords=x"])
+def test_canonical_vanity_of_other_pages(value):
+    assert canonical_vanity(value) is None
+
+
+def test_unique_profile_links_keeps_the_first_form():
+    links = [JANE, "https://au.linkedin.com/in/Jane-Doe/", "https://www.linkedin.com/in/bob/",
+             "https://www.linkedin.com/company/acme/", "https://www.linkedin.com/company/acme/"]
+    assert unique_profile_links(links) == [JANE, "https://www.linkedin.com/in/bob/",
+                                           "https://www.linkedin.com/company/acme/"]
+
+
+def test_upserts_merge_into_one_row_per_person(store):
+    assert store.record_parse(fields(), observed_at=100) == "jane-doe"
+    assert store.record_parse(fields(title="Principal Data Architect", source_url="/in/Jane-Doe/en"),
+                              observed_at=200) == "jane-doe"
+    assert len(store) == 1
+    assert store.get("https://au.linkedin.com/in/JANE-DOE")["fields"]["title"] == "Principal Data Architect"
+
+
+def test_empty_or_older_observations_keep_the_known_fields(store):
+    store.record_parse(fields(skills=["SQL", "dbt"]), observed_at=200)
+    store.record_parse(fields(skills=[], company="Not found", location="Perth"), observed_at=300)
+    store.record_parse(fields(location="Melbourne"), observed_at=100)
+    known = store.get("jane-doe")
+    assert known["fields"]["skills"] == ["SQL", "dbt"]
+    assert known["fields"]["company"] == "Atlassian"
+    assert known["fields"]["location"] == "Perth"
+    assert known["parsed_at"] == 300
+
+
+def test_contacts_merge_the_same_way(store):
+    store.record_contact(JANE, "jane@x.com", "", observed_at=100)
+    store.record_contact("jane-doe", "", "0400 000 000", observed_at=200)
+    store.record_contact("jane-doe", "old@x.com", "", observed_at=50)
+    known = store.get("jane-doe")
+    assert (known["email"], known["phone"], known["contact_at"]) == ("jane@x.com", "0400 000 000", 200)
+    assert known["fields"] == {}
+
+
+def test_freshness(store):
+    now = time.time()
+    store.record_parse(fields(), observed_at=now - 86400)
+    store.record_contact("jane-doe", "jane@x.com", "", observed_at=now - 40 * 86400)
+    assert store.fresh_profile("/in/jane-doe")["vanity"] == "jane-doe"
+    assert store.fresh_contact("jane-doe") is None
+    assert store.fresh_profile("/in/bob") is None
+    assert IdentityStore(store.path, max_age_days=0).fresh_profile("/in/jane-doe") is None
+
+
+def test_known_file_is_matched_by_name_size_and_mtime(store, tmp_path):
+    page = tmp_path / "jane-doe_1717000000.html"
+    page.write_text("<html>v1</html>")
+    assert store.record_parse(fields(source_url=None), file=page) == "jane-doe"
+    assert store.known_file(page)["vanity"] == "jane-doe"
+    page.write_text("<html>v2, longer</html>")
+    assert store.known_file(page) is None
+    assert store.known_file(tmp_path / "missing.html") is None
+
+
+def test_fields_round_trip_through_a_record():
+    record = ProfileRecord.build("Jane Doe", "Data Architect", "Atlassian", "Sydney", ["SQL"],
+                                 {"Company": "Atlassian", "Roles": [{"Title": "Data Architect", "Dates": "2021"}]},
+                                 JANE)
+    stored = profile_fields(record, {"headline_location": "Sydney NSW"})
+    rebuilt, facts = record_from_fields(stored)
+    assert rebuilt.to_row() == record.to_row()
+    assert facts == {"headline_location": "Sydney NSW"}
@@ -0,0 +1,102 @@
+import sqlite3
+
+import pytest
+
+from backend.profile_index import ProfileIndex, index_profiles, parse_terms
+from backend.profile_record import ProfileRecord
+
+ROWS = [
+    {"Name": "Jane Doe", "Title": "Data Architect", "Company": "Atlassian",
+     "Location": "Sydney, New South Wales, Australia", "Skills": "• Snowflake\n• dbt",
+     "Source_URL": "https://www.linkedin.com/in/jane-doe/"},
+    {"Name": "John Smith", "Title": "Platform Engineer", "Company": "Canva",
+     "Location": "Melbourne, Victoria, Australia", "Skills": "• Kubernetes\n• Terraform\n• Data modelling",
+     "Source_URL": "https://www.linkedin.com/in/john-smith/"},
+    {"Name": "Ana Data", "Title": "Data Architect and Data Engineer", "Company": "Data Co",
+     "Location": "Sydney, New South Wales, Australia", "Skills": "• Data",
+     "Source_URL": "https://www.linkedin.com/in/ana-data/"},
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = ProfileIndex(tmp_path / "profiles.db")
+    index.add(ROWS, query="test")
+    return index
+
+
+def names(result):
+    return [row["Name"] for row in result[1]]
+
+
+def test_parse_terms():
+    assert parse_terms('kubernetes location:sydney "data architect"') == [
+        (None, "kubernetes"), ("location", "sydney"), (None, "data architect")]
+    # Unknown columns are searched as text
+    assert parse_terms("foo:bar") == [(None, "foo bar")]
+
+
+def test_search_needs_every_term_and_ranks_by_bm25(index):
+    assert names(index.search("data architect")) == ["Ana Data", "Jane Doe"]
+    assert names(index.search("kubernetes")) == ["John Smith"]
+    assert names(index.search("snowflake kubernetes")) == []
+
+
+def test_prefix_phrase_and_column_terms(index):
+    assert names(index.search("kub")) == ["John Smith"]
+    assert names(index.search('"data engineer"')) == ["Ana Data"]
+    assert sorted(names(index.search("location:sydney"))) == ["Ana Data", "Jane Doe"]
+    assert names(index.search("company:canva data")) == ["John Smith"]
+
+
+def test_paging_and_empty_query(index):
+    total, rows = index.search("", limit=2)
+    assert total == 3 and len(rows) == 2
+    total, rows = index.search("australia", offset=2)
+    assert total == 3 and len(rows) == 1
+
+
+def test_same_person_through_another_url_is_one_row(index):
+    assert len(index) == 3
+    index.add([{**ROWS[0], "Title": "Principal Data Architect",
+                "Source_URL": "https://au.linkedin.com/in/Jane-Doe/en?trk=public_profile"}])
+    assert len(index) == 3
+    total, rows = index.search("principal")
+    assert total == 1 and rows[0]["Source_URL"].startswith("https://au.linkedin.com/in/Jane-Doe")
+    # The FTS table followed the update
+    assert names(index.search("data architect")) == ["Ana Data", "Jane Doe"]
+
+
+def test_records_and_rows_without_a_profile_url(tmp_path):
+    index = ProfileIndex(tmp_path / "profiles.db")
+    record = ProfileRecord.build("Bo", "Engineer", "Acme", "Perth", ["Go"], {}, "https://www.linkedin.com/in/bo/")
+    record.accepted = True
+    assert index.add([record, {"Name": "No URL"}, {"Name": "Search", "Source_URL": "https://x.com/search/?q=1"}]) == 1
+    with sqlite3.connect(index.path) as conn:
+        assert conn.execute("SELECT vanity, accepted FROM profiles").fetchall() == [("bo", 1)]
+
+
+def test_index_keyed_by_url_is_rekeyed_on_open(tmp_path):
+    path = tmp_path / "profiles.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE profiles (id INTEGER PRIMARY KEY, source_url TEXT NOT NULL UNIQUE, name TEXT, "
+                     "title TEXT, company TEXT, location TEXT, skills TEXT, experience TEXT, query TEXT, "
+                     "accepted INTEGER, indexed_at REAL NOT NULL)")
+        conn.executemany("INSERT INTO profiles (source_url, name, title, indexed_at) VALUES (?, ?, ?, ?)", [
+            ("https://www.linkedin.com/in/jane-doe/", "Jane Doe", "Old title", 1.0),
+            ("https://au.linkedin.com/in/Jane-Doe/en", "Jane Doe", "New title", 2.0),
+            ("https://www.linkedin.com/in/bob/", "Bob", "Engineer", 1.5),
+        ])
+    index = ProfileIndex(path)
+    assert len(index) == 2
+    assert names(index.search("new title")) == ["Jane Doe"]
+    assert names(index.search("old")) == []
+
+
+def test_index_profiles_never_raises(monkeypatch):
+    import backend.profile_index as profile_index
+
+    def broken():
+        raise sqlite3.OperationalError("disk I/O error")
+    monkeypatch.setattr(profile_index, "default_index", broken)
+    assert index_profiles(ROWS) == 0
@@ -0,0 +1,60 @@
+import pickle
+
+from backend.profile_record import ROW_FIELDS, ProfileRecord, Role
+
+EXPERIENCE = {
+    "Company": "Atlassian",
+    "Roles": [
+        {"Title": "Data Architect", "Dates": "2021 - Present", "Location": "Sydney, New South Wales, Australia"},
+        {"Title": "Data Engineer", "Dates": "2018 - 2021"},
+    ],
+}
+
+
+def record(**kwargs):
+    fields = {"name": "Jane Doe", "title": "Data Architect", "company": "Atlassian",
+              "location": "Sydney, New South Wales, Australia", "skills": ["SQL", "Snowflake"],
+              "experience": EXPERIENCE, "source_url": "https://www.linkedin.com/in/jane-doe/", **kwargs}
+    return ProfileRecord.build(**fields)
+
+
+def test_row_matches_the_old_dict_format():
+    row = record().to_row()
+    assert tuple(row) == ROW_FIELDS
+    assert row["Skills"] == "• SQL\n• Snowflake"
+    assert row["Experience"] == ("• Atlassian\n"
+                                 "  ◦ Data Architect (2021 - Present) — Sydney, New South Wales, Australia\n"
+                                 "  ◦ Data Engineer (2018 - 2021)")
+
+
+def test_empty_skills_and_experience():
+    row = record(skills=[], experience={"Roles": []}).to_row()
+    assert row["Skills"] == "Not found"
+    assert row["Experience"] == "• No experience found"
+
+
+def test_accepted_is_only_in_the_row_once_decided():
+    parsed = record()
+    assert "Accepted" not in parsed.to_row()
+    parsed.accepted = False
+    assert parsed.to_row()["Accepted"] is False
+
+
+def test_columns_are_readable_by_name():
+    parsed = record()
+    parsed.score = 0.75
+    assert [parsed[field] for field in ROW_FIELDS] == list(parsed.to_row().values())
+    assert parsed["Score"] == 0.75
+
+
+def test_repeated_strings_are_shared():
+    a, b = record(), record(location="".join(["Sydney, New South Wales, ", "Australia"]))
+    assert a.location is b.location
+    assert a.roles[0].title is b.roles[0].title
+
+
+def test_records_are_compact_and_picklable():
+    parsed = record()
+    assert not hasattr(parsed, "__dict__")
+    assert parsed.roles[1] == Role("Data Engineer", "2018 - 2021")
+    assert pickle.loads(pickle.dumps(parsed)) == parsed
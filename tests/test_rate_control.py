@@ -0,0 +1,96 @@
+import time
+
+import pytest
+
+from backend.job_state import SQLiteJobState
+from backend.rate_control import AdaptiveRateController, ThrottledError, throttle_reason
+
+
+def controller(**kwargs):
+    return AdaptiveRateController(**{"initial_rate": 1000.0, "max_rate": 2000.0, "pause_seconds": 0.0, **kwargs})
+
+
+def test_throttle_reason():
+    assert throttle_reason(200, "https://www.linkedin.com/in/jane-doe/") is None
+    assert throttle_reason(429) == "HTTP 429"
+    assert throttle_reason(999) == "HTTP 999"
+    assert throttle_reason(200, "https://www.linkedin.com/authwall?trk=x") == "redirect to login"
+    assert throttle_reason(200, "https://www.linkedin.com/checkpoint/challenge/abc") == "redirect to login"
+
+
+def test_healthy_responses_raise_the_rate_additively_up_to_the_cap():
+    rate = controller(initial_rate=1.0, max_rate=1.2, increase=0.1)
+    assert rate.observe(200) is False
+    assert rate.rate == pytest.approx(1.1)
+    rate.observe(200)
+    rate.observe(200)
+    assert rate.rate == pytest.approx(1.2)
+
+
+def test_throttles_cut_the_rate_multiplicatively_down_to_the_floor():
+    rate = controller(initial_rate=1.0, min_rate=0.3, decrease=0.5)
+    assert rate.observe(429) is True
+    assert rate.rate == pytest.approx(0.5)
+    rate.observe(999)
+    assert rate.rate == pytest.approx(0.3)
+    stats = rate.stats()
+    assert stats["counts"]["throttled"] == 2
+    assert stats["consecutive_throttles"] == 2
+    assert [e["reason"] for e in stats["events"]] == ["HTTP 429", "HTTP 999"]
+
+
+def test_consecutive_throttles_double_the_pause():
+    rate = controller(pause_seconds=10.0, max_pause_seconds=25.0)
+    pauses = []
+    for _ in range(3):
+        rate.observe(429)
+        pauses.append(rate.events[-1]["pause"])
+    assert pauses == [10.0, 20.0, 25.0]
+    rate.observe(200)
+    rate.observe(429)
+    assert rate.events[-1]["pause"] == 10.0
+
+
+def test_call_retries_throttled_responses():
+    responses = iter([(429, None, "a"), (200, None, "b")])
+    rate = controller()
+    assert rate.call(lambda: next(responses)) == "b"
+    assert rate.stats()["counts"] == {"requests": 2, "ok": 1, "throttled": 1, "waited_seconds": 0.0}
+
+
+def test_call_raises_after_every_attempt_is_throttled():
+    rate = controller()
+    with pytest.raises(ThrottledError) as e:
+        rate.call(lambda: (200, "https://www.linkedin.com/login", None), attempts=2)
+    assert e.value.reason == "redirect to login"
+    assert rate.counts["requests"] == 2
+
+
+def test_every_adjustment_is_reported():
+    seen = []
+    rate = controller(on_change=lambda c: seen.append(c.stats()["counts"]["throttled"]))
+    rate.observe(200)
+    rate.observe(429)
+    rate.observe(200)
+    assert seen == [0, 1, 1]
+
+
+# ---------------- Dashboard ----------------
+def test_rate_route_serves_what_the_job_process_published(client, tmp_path, monkeypatch):
+    import app
+
+    monkeypatch.setattr(app, "job_state", SQLiteJobState(tmp_path / "state.db"))
+    assert client.get("/linkedin_rate").get_json()["name"] == "linkedin"
+
+    # Another process runs the job and publishes through the same store
+    rate = controller(name="linkedin:job", pause_seconds=30.0)
+    rate.observe(429)
+    stats = dict(rate.stats(), published_at=time.time() - 10,
+                 accounts=[{"username": "a", "available": False, "rate": rate.stats()}])
+    SQLiteJobState(tmp_path / "state.db").set_value("linkedin_rate", stats)
+
+    served = client.get("/linkedin_rate").get_json()
+    assert served["name"] == "linkedin:job" and served["counts"]["throttled"] == 1
+    assert served["accounts"][0]["available"] is False
+    assert 19 <= served["paused_for"] <= 20 and 19 <= served["accounts"][0]["rate"]["paused_for"] <= 20
+    assert "published_at" not in served
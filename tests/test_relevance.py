@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from backend import relevance
+from backend.linkedin_data_extract import results_to_dataframe, role_term_ids, score_profile, score_profiles
+from backend.profile_record import ProfileRecord
+from backend.relevance import FIELD_WEIGHTS, RELEVANCE_THRESHOLD, RelevanceScorer, term_id
+
+
+def row(title, skills="Not found", experience="• No experience found", name="x"):
+    return {"Name": name, "Title": title, "Skills": skills, "Experience": experience,
+            "Source_URL": f"https://www.linkedin.com/in/{name}/"}
+
+
+def test_score_is_the_weighted_share_of_query_terms_per_field():
+    scorer = RelevanceScorer([term_id("data"), term_id("architect")])
+    profiles = [
+        {"Title": {term_id("data"), term_id("architect")}},
+        {"Title": {term_id("data")}, "Skills": {term_id("architect")}},
+        {"Experience": {term_id("data"), term_id("chef")}},
+        {},
+    ]
+    expected = [0.6, 0.3 + 0.125, 0.075, 0.0]
+    assert scorer.score(profiles) == pytest.approx(expected)
+    assert [scorer.score_one(p) for p in profiles] == pytest.approx(expected)
+    assert sum(FIELD_WEIGHTS.values()) == pytest.approx(1.0)
+
+
+def test_without_scipy_the_scores_are_the_same(monkeypatch):
+    scorer = RelevanceScorer([term_id(w) for w in ("site", "reliability", "engineer")])
+    profiles = [{"Title": {term_id("engineer")}, "Skills": {term_id("site"), term_id("x")}}, {}] * 3
+    expected = scorer.score(profiles)
+    monkeypatch.setattr(relevance, "sparse", None)
+    assert scorer.score(profiles) == pytest.approx(expected)
+
+
+def test_empty_query_or_batch():
+    assert RelevanceScorer([]).score([{"Title": {1}}]).tolist() == [0.0]
+    assert RelevanceScorer([1]).score([]).tolist() == []
+
+
+def test_role_words_are_normalized_and_common_words_dropped():
+    assert role_term_ids("Data Engineer") == role_term_ids("data engineering") == role_term_ids("Data Engineers")
+    assert role_term_ids("Head of Data") == role_term_ids("head data")
+    assert role_term_ids("of the and") == set()
+
+
+def test_profiles_are_scored_against_the_job_title():
+    rows = [
+        row("Data Architect"),
+        row("Solutions Architect", skills="• Data modelling\n• Snowflake"),
+        row("Chef", skills="• Data"),
+        row("Not found", skills="Not found"),
+    ]
+    scores = score_profiles(rows, "Data Architect")
+    assert scores[0] == pytest.approx(1.0 - FIELD_WEIGHTS["Skills"] - FIELD_WEIGHTS["Experience"])
+    assert scores[0] > scores[1] > scores[2] > scores[3] == 0
+    assert scores[0] >= RELEVANCE_THRESHOLD > scores[2]
+    # One profile at a time scores the same as the batch
+    assert [score_profile(r, "Data Architect") for r in rows] == list(np.round(scores, 3))
+
+
+def test_results_are_ranked_by_score():
+    rows = [row("Chef", skills="• Data", name="c"), row("Data Architect", name="a"),
+            row("Architect", skills="• Data", name="b")]
+    df = results_to_dataframe(rows, role="Data Architect")
+    assert list(df["Name"]) == ["a", "b", "c"]
+    assert list(df["#"]) == [1, 2, 3]
+    assert list(df.columns[:2]) == ["#", "Score"]
+    assert "Score" not in results_to_dataframe(rows).columns
+
+
+def test_records_keep_the_score_the_filter_gave_them():
+    scored = ProfileRecord.build("r", "Chef", "", "", [], {}, "https://www.linkedin.com/in/r/")
+    scored.score = 0.9
+    unscored = ProfileRecord.build("a", "Data Architect", "", "", [], {}, "https://www.linkedin.com/in/a/")
+    df = results_to_dataframe([unscored, scored], role="Data Architect")
+    assert list(df["Name"]) == ["r", "a"]
+    assert df["Score"].tolist() == [0.9, 0.6]
+
+
+def test_filter_accepts_on_the_relevance_threshold():
+    from backend.linkedin_data_extract import apply_profile_filters
+
+    def evaluate(title, skills):
+        record = ProfileRecord.build("x", title, "Acme", "Sydney, New South Wales, Australia", skills,
+                                     {"Company": "Acme", "Roles": [{"Title": title, "Dates": "2020"}]},
+                                     "https://www.linkedin.com/in/x/")
+        apply_profile_filters(record, {"headline_location": ""}, "Data Architect", "Sydney")
+        return record
+
+    accepted = evaluate("Data Architect", ["SQL"])
+    assert accepted.accepted and accepted.score >= RELEVANCE_THRESHOLD
+    rejected = evaluate("Chef", ["Data"])
+    assert not rejected.accepted and rejected.score < RELEVANCE_THRESHOLD
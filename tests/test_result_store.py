@@ -0,0 +1,63 @@
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend import result_store
+from backend.result_store import ResultStore, evict_stores
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ResultStore("job-1", tmp_path)
+
+
+def test_rows_come_back_in_insertion_order(store):
+    for i in range(5):
+        store.append({"Name": f"n{i}", "#": i})
+    assert len(store) == 5
+    assert [row["Name"] for row in store] == ["n0", "n1", "n2", "n3", "n4"]
+    assert store.row(3) == {"Name": "n3", "#": 3}
+    assert store.row(5) is None
+
+
+def test_rows_are_read_page_by_page(store, monkeypatch):
+    monkeypatch.setattr(result_store, "PAGE_SIZE", 3)
+    for i in range(10):
+        store.append({"i": i})
+    assert [row["i"] for row in store.rows()] == list(range(10))
+    assert [row["i"] for row in store.rows(offset=2, limit=5)] == [2, 3, 4, 5, 6]
+    assert [row["i"] for row in store.rows(offset=8, limit=5)] == [8, 9]
+    assert list(store.rows(offset=10)) == []
+
+
+def test_replace_writes_json_safe_rows(store, monkeypatch):
+    monkeypatch.setattr(result_store, "PAGE_SIZE", 2)
+    store.append({"stale": True})
+    df = pd.DataFrame({"#": np.arange(1, 6), "Name": list("abcde"), "Score": [0.5, np.nan, 1.0, 0.25, 0.75]})
+    store.replace(df)
+    rows = list(store)
+    assert len(rows) == 5
+    assert rows[1] == {"#": 2, "Name": "b", "Score": None}
+    assert store.to_dataframe()["Name"].tolist() == list("abcde")
+
+
+def test_clear_and_delete(store):
+    store.append({"a": 1})
+    store.clear()
+    assert len(store) == 0
+    store.delete()
+    assert not store.path.exists()
+
+
+def test_open_evicts_the_oldest_other_stores(tmp_path):
+    for i in range(4):
+        ResultStore(f"old-{i}", tmp_path).append({"i": i})
+        os.utime(tmp_path / f"old-{i}.sqlite", (time.time() - 100 + i, time.time() - 100 + i))
+    ResultStore.open("new", tmp_path, keep=3)
+    assert sorted(p.name for p in tmp_path.glob("*.sqlite")) == ["new.sqlite", "old-2.sqlite", "old-3.sqlite"]
+
+    evict_stores(tmp_path, keep=1)
+    assert [p.name for p in tmp_path.glob("*.sqlite")] == ["new.sqlite"]
@@ -0,0 +1,47 @@
+import pytest
+
+import app
+from backend.result_store import ResultStore
+
+
+@pytest.fixture
+def results(tmp_path, monkeypatch):
+    store = ResultStore("job", tmp_path)
+    for i in range(250):
+        store.append({"#": i + 1, "Name": f"n{i}", "Skills": "• SQL\n" * 10, "Experience": "• Acme"})
+    monkeypatch.setattr(app, "job_results", lambda: store)
+    return store
+
+
+def test_results_need_a_login(client, results):
+    assert client.get("/results").status_code == 401
+    assert client.get("/results/0").status_code == 401
+
+
+def test_results_window_returns_summary_rows(client, login, results):
+    login("plain@x.com")
+    body = client.get("/results?offset=10&limit=5").get_json()
+    assert (body["total"], body["offset"]) == (250, 10)
+    assert [row["#"] for row in body["rows"]] == [11, 12, 13, 14, 15]
+    row = body["rows"][0]
+    assert row["Skills"] == ("• SQL\n" * 10)[:app.RESULT_PREVIEW_CHARS] + "..."
+    assert row["Experience"] == "• Acme"
+
+
+def test_results_window_is_capped(client, login, results):
+    login("plain@x.com")
+    assert len(client.get("/results?limit=100000").get_json()["rows"]) == app.RESULTS_WINDOW_MAX
+    assert len(client.get("/results?offset=240").get_json()["rows"]) == 10
+
+
+def test_result_detail_returns_the_full_row(client, login, results):
+    login("plain@x.com")
+    assert client.get("/results/3").get_json()["Skills"] == "• SQL\n" * 10
+    assert client.get("/results/250").status_code == 404
+
+
+def test_no_job_yet(client, login, monkeypatch):
+    monkeypatch.setattr(app, "job_results", lambda: None)
+    login("plain@x.com")
+    assert client.get("/results").get_json() == {"rows": [], "total": 0, "offset": 0}
+    assert client.get("/results/0").status_code == 404
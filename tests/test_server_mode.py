@@ -0,0 +1,72 @@
+import functools
+import importlib.util
+import os
+import runpy
+import threading
+from pathlib import Path
+
+import pytest
+
+CONF = str(Path(__file__).resolve().parent.parent / "gunicorn.conf.py")
+# Set by gunicorn.conf.py for the app in the workers
+EXPORTED_ENV = ("LINKLENS_SERVER_MODE", "LINKLENS_SSE_MAX_CLIENTS")
+FIND_SPEC = importlib.util.find_spec
+
+
+def run_conf(monkeypatch, gevent_installed=False, **env):
+    """Runs gunicorn.conf.py with the given environment; returns its settings and the variables it exported."""
+    # Cleared through monkeypatch first, so whatever the conf exports is undone with it
+    for name in EXPORTED_ENV:
+        monkeypatch.delenv(name, raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.setattr(importlib.util, "find_spec",
+                        lambda name, *args: object() if name == "gevent" and gevent_installed
+                        else FIND_SPEC(name, *args))
+    settings = runpy.run_path(CONF)
+    settings["exported"] = {name: os.environ.get(name) for name in EXPORTED_ENV}
+    return settings
+
+
+@pytest.fixture
+def conf(monkeypatch):
+    return functools.partial(run_conf, monkeypatch)
+
+
+def test_gevent_is_the_default_when_installed(conf):
+    assert conf(gevent_installed=True)["worker_class"] == "gevent"
+    assert conf(gevent_installed=False)["worker_class"] == "gthread"
+    assert conf(gevent_installed=True, LINKLENS_SERVER_MODE="gthread")["worker_class"] == "gthread"
+
+
+def test_stream_limit_follows_the_worker_type(conf):
+    settings = conf(LINKLENS_SERVER_MODE="gevent", LINKLENS_WORKER_CONNECTIONS="500")
+    assert settings["stream_limit"] == 400
+    settings = conf(LINKLENS_SERVER_MODE="gthread", LINKLENS_THREADS="8")
+    assert settings["stream_limit"] == 4
+    assert settings["exported"] == {"LINKLENS_SERVER_MODE": "gthread", "LINKLENS_SSE_MAX_CLIENTS": "4"}
+    # An explicit limit is left alone
+    assert conf(LINKLENS_SSE_MAX_CLIENTS="7")["exported"]["LINKLENS_SSE_MAX_CLIENTS"] == "7"
+
+
+def test_conf_leaves_the_environment_as_it_found_it():
+    before = {name: os.environ.get(name) for name in EXPORTED_ENV}
+    with pytest.MonkeyPatch.context() as mp:
+        assert run_conf(mp, LINKLENS_SERVER_MODE="gevent")["exported"]["LINKLENS_SSE_MAX_CLIENTS"] == "1900"
+    assert {name: os.environ.get(name) for name in EXPORTED_ENV} == before
+
+
+def test_status_stream_is_turned_away_when_every_slot_is_taken(client, monkeypatch):
+    import app
+
+    slots = threading.BoundedSemaphore(1)
+    monkeypatch.setattr(app, "sse_slots", slots)
+
+    response = client.get("/linkedin_status", buffered=False)
+    assert next(response.response) == b"retry: 2000\n\n"
+    # The open stream holds the only slot
+    busy = client.get("/linkedin_status")
+    assert busy.get_data(as_text=True) == "retry: 10000\n\n"
+
+    response.close()
+    assert slots.acquire(blocking=False)
@@ -0,0 +1,54 @@
+from flask import session
+
+import app as app_module
+import auth.auth_flask_module as auth_module
+from app import app
+from auth.json_module_flask import current_user
+
+
+def test_login_keeps_only_the_user_id_in_the_session(client, login):
+    assert login("plain@x.com").status_code == 302
+    with client.session_transaction() as session:
+        assert dict(session) == {"logged_in": True, "user_id": 2}
+
+
+def test_wrong_password_does_not_log_in(client, login):
+    login("plain@x.com", "nope")
+    with client.session_transaction() as session:
+        assert "user_id" not in session
+
+
+def test_current_user_is_the_public_record(client, login, users):
+    login("plain@x.com")
+    with client:
+        client.get("/login")
+        user = current_user()
+    assert user["email"] == "plain@x.com" and not user["is_admin"]
+    assert not set(users.PRIVATE_FIELDS) & set(user)
+
+
+def test_legacy_session_with_the_whole_record_is_migrated(users):
+    with app.test_request_context():
+        session.update({"logged_in": True, "user": users.get_user("admin@x.com")})
+        assert current_user()["email"] == "admin@x.com"
+        assert "user" not in session and session["user_id"] == 1
+
+
+def test_cached_user_follows_users_json(users):
+    assert users.get_user_by_id(2)["name"] == "Plain"
+    users.update_user(2, "Renamed", "plain@x.com", "", "", "", False)
+    assert users.get_user_by_id(2)["name"] == "Renamed"
+    users.delete_user(2)
+    assert users.get_user_by_id(2) is None
+    assert users.get_user_by_id(None) is None
+
+
+def test_auth_module_session_holds_only_the_id(users):
+    client = auth_module.app.test_client()
+    client.post("/login", data={"email": "admin@x.com", "password": "pw"})
+    with client.session_transaction() as session:
+        assert dict(session) == {"logged_in": True, "user_id": 1}
+
+
+def test_every_app_uses_the_same_helper():
+    assert app_module.current_user is auth_module.current_user is current_user
@@ -0,0 +1,57 @@
+import itertools
+from difflib import SequenceMatcher
+
+import pytest
+
+from backend import similarity
+from backend.similarity import dedupe_similar, find_similar, is_similar, length_ratio_bound
+
+WORDS = ["Atlassian", "Atlasian", "Atlassian Pty Ltd", "Canva", "Canva Inc", "canva", "Data Engineer",
+         "Data Engineering", "Engineer Data", "abcd", "abce", "a", "", "Sydney", "Sydeny"]
+
+
+@pytest.fixture(params=["rapidfuzz", "difflib only"])
+def prefilter(request, monkeypatch):
+    if request.param == "difflib only":
+        monkeypatch.setattr(similarity, "Indel", None)
+    elif similarity.Indel is None:
+        pytest.skip("rapidfuzz is not installed")
+
+
+def ratio(a, b):
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def test_decisions_are_those_of_difflib(prefilter):
+    for threshold in (0.5, 0.75, 0.82, 0.9):
+        for a, b in itertools.product(WORDS, repeat=2):
+            expected = bool(a and b) and ratio(a, b) >= threshold
+            assert is_similar(a, b, threshold) == expected, (a, b, threshold)
+
+
+def test_threshold_is_inclusive(prefilter):
+    # 3 matching characters out of 8: ratio is exactly 0.75
+    assert ratio("abcd", "abce") == 0.75
+    assert is_similar("abcd", "abce", 0.75)
+    assert not is_similar("abcd", "abce", 0.76)
+    assert find_similar("abcd", ["abce"], 0.75) == "abce"
+    assert find_similar("abcd", ["abce"], 0.76) is None
+
+
+def test_find_similar_returns_the_first_match(prefilter):
+    candidates = ["", None, "Canva Inc", "Atlasian", "Atlassian"]
+    assert find_similar("Atlassian", candidates) == "Atlasian"
+    assert find_similar("Atlassian", candidates, threshold=1.0) == "Atlassian"
+    assert find_similar("", candidates) is None
+    assert find_similar("Google", candidates) is None
+
+
+def test_length_bound_never_rejects_a_match():
+    for a, b in itertools.product(WORDS, repeat=2):
+        assert length_ratio_bound(a, b) >= ratio(a, b)
+    assert length_ratio_bound("", "") == 1.0
+
+
+def test_dedupe_keeps_the_first_of_each_group(prefilter):
+    rows = [{"c": "Atlassian"}, {"c": "Canva"}, {"c": "Atlasian"}, {"c": "Canvas"}, {"c": "Google"}]
+    assert [r["c"] for r in dedupe_similar(rows, key=lambda r: r["c"])] == ["Atlassian", "Canva", "Google"]
@@ -0,0 +1,138 @@
+import time
+
+import pytest
+
+from backend.task_queue import TaskQueue
+from backend.worker import Worker
+
+
+@pytest.fixture
+def tasks(tmp_path):
+    return TaskQueue(tmp_path / "tasks.db")
+
+
+def test_enqueue_is_idempotent_per_job_kind_and_key(tasks):
+    assert tasks.enqueue("job", "fetch", "a", {"link": "a"})
+    assert not tasks.enqueue("job", "fetch", "a", {"link": "a"})
+    assert tasks.enqueue("job", "parse", "a", {})
+    assert tasks.enqueue("other", "fetch", "a", {})
+    assert tasks.enqueue_many("job", "fetch", [("a", {}), ("b", {}), ("c", {})]) == 2
+    assert tasks.job_counts("job") == {"fetch": {"queued": 3}, "parse": {"queued": 1}}
+
+
+def test_claim_takes_the_oldest_task_of_the_requested_kinds(tasks):
+    tasks.enqueue_many("job", "fetch", [("a", {"n": 1}), ("b", {"n": 2})])
+    tasks.enqueue("job", "parse", "c", {"n": 3})
+    task = tasks.claim("w1", kinds=("parse",))
+    assert (task["key"], task["payload"], task["attempts"]) == ("c", {"n": 3}, 1)
+    assert tasks.claim("w1", kinds=("fetch",))["key"] == "a"
+    assert tasks.claim("w1", kinds=("fetch",))["key"] == "b"
+    assert tasks.claim("w1") is None
+
+
+def test_expired_lease_is_reclaimed_by_another_worker(tasks):
+    tasks.enqueue("job", "fetch", "a", {})
+    first = tasks.claim("w1", lease_seconds=0.05)
+    assert tasks.claim("w2") is None
+    time.sleep(0.1)
+    second = tasks.claim("w2")
+    assert second["id"] == first["id"] and second["attempts"] == 2
+    # The first worker has lost the task and can no longer renew it
+    assert not tasks.heartbeat(first["id"], worker="w1")
+    assert tasks.heartbeat(second["id"], worker="w2")
+
+
+def test_heartbeat_keeps_a_task_from_being_reclaimed(tasks):
+    tasks.enqueue("job", "fetch", "a", {})
+    task = tasks.claim("w1", lease_seconds=0.1)
+    for _ in range(3):
+        time.sleep(0.05)
+        assert tasks.heartbeat(task["id"], lease_seconds=0.1, worker="w1")
+        assert tasks.claim("w2") is None
+    tasks.complete(task["id"])
+    assert not tasks.heartbeat(task["id"])
+
+
+def test_complete_acknowledges_and_records_the_result(tasks):
+    tasks.enqueue_many("job", "parse", [("a", {}), ("b", {})])
+    for key in ("a", "b"):
+        task = tasks.claim("w1")
+        tasks.complete(task["id"], {"key": key})
+    assert tasks.is_job_done("job")
+    assert tasks.results("job", "parse") == [("a", {"key": "a"}), ("b", {"key": "b"})]
+    assert tasks.claim("w1") is None
+
+
+def test_failed_task_is_retried_until_out_of_attempts(tasks):
+    tasks.enqueue("job", "fetch", "a", {}, max_attempts=2)
+    tasks.fail(tasks.claim("w1")["id"], "boom")
+    assert tasks.job_counts("job") == {"fetch": {"queued": 1}}
+    tasks.fail(tasks.claim("w1")["id"], "boom again")
+    assert tasks.is_job_done("job")
+    assert tasks.failures("job") == [{"kind": "fetch", "key": "a", "error": "boom again"}]
+
+    assert tasks.retry_failed("job") == 1
+    assert tasks.claim("w1")["attempts"] == 1
+
+
+def test_fail_without_retry(tasks):
+    tasks.enqueue("job", "fetch", "a", {})
+    tasks.fail(tasks.claim("w1")["id"], "not found", retry=False)
+    assert tasks.job_counts("job") == {"fetch": {"failed": 1}}
+
+
+def test_only_the_lease_holder_can_finish_a_task(tasks):
+    tasks.enqueue("job", "fetch", "a", {})
+    first = tasks.claim("w1", lease_seconds=0.05)
+    time.sleep(0.1)
+    second = tasks.claim("w2")
+    assert not tasks.complete(first["id"], {"by": "w1"}, worker="w1")
+    assert not tasks.fail(first["id"], "late", worker="w1")
+    assert tasks.job_counts("job") == {"fetch": {"running": 1}}
+
+    assert tasks.complete(second["id"], {"by": "w2"}, worker="w2")
+    # Finished tasks are not running any more, whoever asks
+    assert not tasks.complete(second["id"], {"by": "w2"})
+    assert not tasks.fail(second["id"], "late")
+    assert tasks.results("job", "fetch") == [("a", {"by": "w2"})]
+
+
+# ---------------- Worker ----------------
+class SlowParseWorker(Worker):
+    def handle_parse(self, payload, task):
+        if payload.get("fail"):
+            raise ValueError("bad page")
+        # Outlive the lease a few times; the heartbeat must keep the task ours
+        time.sleep(self.lease_seconds * 3)
+        return {"reclaimed": self.queue.claim("other", ("parse",), self.lease_seconds) is not None}
+
+
+def test_worker_renews_its_lease_while_a_task_runs(tasks):
+    tasks.enqueue("job", "parse", "a", {})
+    worker = SlowParseWorker(tasks, kinds=("parse",), status_callback=lambda msg: None, lease_seconds=0.3)
+    assert worker.run(once=True) == 1
+    assert tasks.results("job", "parse") == [("a", {"reclaimed": False})]
+    assert worker.counts == {"done": 1, "failed": 0}
+
+
+def test_worker_records_handler_failures(tasks):
+    tasks.enqueue("job", "parse", "a", {"fail": True}, max_attempts=1)
+    worker = SlowParseWorker(tasks, kinds=("parse",), status_callback=lambda msg: None)
+    worker.run(once=True)
+    assert tasks.failures("job") == [{"kind": "parse", "key": "a", "error": "bad page"}]
+    assert worker.counts == {"done": 0, "failed": 1}
+
+
+def test_worker_drops_the_result_of_a_task_it_lost(tasks, monkeypatch):
+    tasks.enqueue("job", "parse", "a", {})
+    worker = SlowParseWorker(tasks, kinds=("parse",), status_callback=lambda msg: None, lease_seconds=0.05)
+    # No heartbeat: the lease runs out while the handler sleeps and "other" takes the task
+    monkeypatch.setattr(worker, "_heartbeat", lambda task, done: None)
+    assert worker.run(once=True) == 1
+    assert worker.counts == {"done": 0, "failed": 0}
+    assert tasks.job_counts("job") == {"parse": {"running": 1}}
+
+
+def test_browser_kinds_need_an_account(tasks):
+    with pytest.raises(ValueError):
+        Worker(tasks, kinds=("fetch",))
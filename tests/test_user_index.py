@@ -0,0 +1,65 @@
+import json
+import os
+
+import pytest
+
+
+@pytest.fixture
+def many_users(users):
+    """users.json with 250 users written directly (as another worker process would)."""
+    records = [{"id": i, "name": f"User {i:03d}", "email": f"user{i:03d}@{'acme' if i % 2 else 'globex'}.com",
+                "is_admin": i == 1, "password_hash": "x", "reset_token": None}
+               for i in range(1, 251)]
+    records[41]["name"] = "Jane Doe"
+    with open(users.USERS_FILE, "w", encoding="utf-8") as f:
+        json.dump(records, f)
+    return users
+
+
+def test_search_matches_name_or_email_substrings(many_users):
+    total, page = many_users.search_users("JANE")
+    assert total == 1 and page[0]["id"] == 42
+    assert many_users.search_users("globex")[0] == 125
+    assert many_users.search_users("user 01")[0] == 10  # name "User 010" .. "User 019"
+    # Shorter than a trigram: checked user by user
+    assert many_users.search_users("do")[0] == 1
+    assert many_users.search_users("zz")[0] == 0
+
+
+def test_match_never_spans_name_and_email(many_users):
+    # Name "User 001" + email "user001@acme.com" would contain "001user" if they were joined
+    assert many_users.search_users("001user")[0] == 0
+
+
+def test_pages_are_in_users_json_order(many_users):
+    total, page = many_users.search_users("acme", offset=10, limit=5)
+    assert total == 125
+    assert [u["id"] for u in page] == [21, 23, 25, 27, 29]
+    assert len(many_users.search_users(limit=10_000)[1]) == many_users.USER_PAGE_MAX
+
+
+def test_results_hold_no_private_fields(many_users):
+    _, page = many_users.search_users()
+    assert not any(set(many_users.PRIVATE_FIELDS) & set(u) for u in page)
+
+
+def test_index_is_rebuilt_when_users_json_changes(many_users):
+    assert many_users.search_users("newcomer")[0] == 0
+    with open(many_users.USERS_FILE, "r", encoding="utf-8") as f:
+        records = json.load(f)
+    records.append({"id": 251, "name": "Newcomer", "email": "new@acme.com"})
+    with open(many_users.USERS_FILE, "w", encoding="utf-8") as f:
+        json.dump(records, f)
+    stat = os.stat(many_users.USERS_FILE)
+    os.utime(many_users.USERS_FILE, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert many_users.search_users("newcomer")[0] == 1
+
+
+def test_admin_users_route(client, login, users):
+    assert client.get("/admin/users").status_code == 401
+    login("plain@x.com")
+    assert client.get("/admin/users").status_code == 403
+    login("admin@x.com")
+    body = client.get("/admin/users?q=x.com&per_page=1&page=2").get_json()
+    assert (body["total"], body["pages"], body["page"]) == (2, 2, 2)
+    assert body["users"][0]["email"] == "plain@x.com"